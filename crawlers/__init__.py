@@ -1,6 +1,25 @@
 # crawlers package
-from .naver_blog import NaverBlogCrawler
-from .naver_blog_detail import NaverBlogDetailCrawler
-from .twitter import TwitterCrawler
+# 크롤러마다 무거운 의존성(selenium, ntscraper 등)이 달라서, 실제로 사용하는 크롤러 모듈만
+# 처음 접근할 때 불러옴 (from crawlers import TwitterCrawler → crawlers.twitter만 import)
+import importlib
 
-__all__ = ['NaverBlogCrawler', 'NaverBlogDetailCrawler', 'TwitterCrawler']
+_LAZY = {
+    'NaverBlogCrawler': '.naver_blog',
+    'NaverBlogDetailCrawler': '.naver_blog_detail',
+    'NaverBlogHttpExtractor': '.naver_blog_http',
+    'TwitterCrawler': '.twitter',
+}
+
+__all__ = ['NaverBlogCrawler', 'NaverBlogDetailCrawler', 'NaverBlogHttpExtractor', 'TwitterCrawler']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
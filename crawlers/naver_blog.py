@@ -1,21 +1,59 @@
 import os
 import requests
-from datetime import datetime
-from typing import List, Dict
+from requests.adapters import HTTPAdapter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Iterator, Optional, Set
+import random
+import threading
 import time
-import re
+
+from utils.rate_limiter import TokenBucket
+from utils.records import NaverPost, collected_at_now
+from utils.text import clean_html
 
 class NaverBlogCrawler:
     """네이버 블로그 검색 API를 사용하여 블로그 URL 수집"""
     
-    def __init__(self):
+    API_RATE_LIMIT = 10  # 네이버 검색 API 호출 제한 (초당 10회)
+    RETRY_STATUS = {429, 500, 502, 503, 504}  # 재시도할 HTTP 상태 코드
+    MAX_RETRY_AFTER = 60.0  # Retry-After 헤더를 따를 최대 대기 시간 (초)
+    
+    def __init__(self, workers: int = 8, max_retries: int = 3, backoff: float = 0.5):
+        """
+        Args:
+            workers: collect_many에서 동시에 보낼 최대 요청 수 (HTTP 커넥션 풀 크기)
+            max_retries: 429/5xx/네트워크 오류 시 재시도 횟수
+            backoff: 지수 백오프 기본 대기 시간 (초, 재시도마다 2배)
+        """
         self.client_id = os.getenv('NAVER_CLIENT_ID')
         self.client_secret = os.getenv('NAVER_CLIENT_SECRET')
         self.base_url = "https://openapi.naver.com/v1/search/blog.json"
+        self.workers = workers
+        self.max_retries = max_retries
+        self.backoff = backoff
         
         if not self.client_id or not self.client_secret:
             raise ValueError("NAVER_CLIENT_ID와 NAVER_CLIENT_SECRET을 .env 파일에 설정해주세요.")
         
+        # 모든 요청이 하나의 keep-alive 커넥션 풀을 재사용
+        self.session = requests.Session()
+        self.session.headers.update({
+            'X-Naver-Client-Id': self.client_id,
+            'X-Naver-Client-Secret': self.client_secret
+        })
+        # 단일 호스트(openapi.naver.com)이므로 풀 1개, 워커 수만큼 커넥션 유지
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(workers, 1))
+        self.session.mount('https://', adapter)
+        
+        # 모든 스레드가 공유하는 호출 제한 (버스트 없이 균등 분배)
+        self.rate_limiter = TokenBucket(rate=self.API_RATE_LIMIT, capacity=1)
+        
+        # 요청 통계 (지연 시간, 재시도 횟수)
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0, 'latency_total': 0.0, 'latency_max': 0.0}
+        self._stats_lock = threading.Lock()
+        
     def search(self, keyword: str, display: int = 100, start: int = 1) -> Dict:
         """
         네이버 블로그 검색
@@ -26,13 +64,8 @@ class NaverBlogCrawler:
             start: 검색 시작 위치 (1~1000)
         
         Returns:
-            API 응답 결과
+            API 응답 결과 (재시도 후에도 실패하면 None)
         """
-        headers = {
-            'X-Naver-Client-Id': self.client_id,
-            'X-Naver-Client-Secret': self.client_secret
-        }
-        
         params = {
             'query': keyword,
             'display': display,
@@ -40,90 +73,320 @@ class NaverBlogCrawler:
             'sort': 'date'  # 날짜순 정렬 (최신순)
         }
         
-        try:
-            response = requests.get(self.base_url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"❌ API 요청 에러: {e}")
+        for attempt in range(self.max_retries + 1):
+            # API 호출 제한 대응 (초당 10회 제한)
+            self.rate_limiter.acquire()
+            
+            retry_after = None
+            started = time.perf_counter()
+            try:
+                response = self.session.get(self.base_url, params=params, timeout=10)
+                if response.status_code in self.RETRY_STATUS:
+                    retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                    error = f"HTTP {response.status_code}"
+                else:
+                    response.raise_for_status()
+                    self._record_request(time.perf_counter() - started)
+                    return response.json()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = str(e)
+            except requests.exceptions.RequestException as e:
+                # 4xx 등 재시도해도 소용없는 오류
+                self._record_request(time.perf_counter() - started, failed=True)
+                print(f"❌ API 요청 에러: {e}")
+                return None
+            
+            self._record_request(time.perf_counter() - started, retried=attempt < self.max_retries)
+            if attempt < self.max_retries:
+                # Retry-After가 있으면 따르고, 없으면 지수 백오프 + 지터
+                wait_time = retry_after if retry_after is not None else self.backoff * (2 ** attempt) * random.uniform(1.0, 1.5)
+                print(f"⚠️ API 요청 재시도 {attempt + 1}/{self.max_retries} ({error}, {wait_time:.1f}초 후): '{keyword}' {start}~")
+                time.sleep(wait_time)
+        
+        with self._stats_lock:
+            self.stats['failures'] += 1
+        print(f"❌ API 요청 에러 (재시도 {self.max_retries}회 초과): {error}")
+        return None
+    
+    def get_stats(self) -> Dict:
+        """요청 통계 (요청/재시도/실패 횟수, 평균/최대 지연 시간)"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['latency_avg'] = stats['latency_total'] / stats['requests'] if stats['requests'] else 0.0
+        return stats
+    
+    def print_stats(self):
+        """요청 통계 출력"""
+        stats = self.get_stats()
+        print(f"📡 API 요청 {stats['requests']}회 | 재시도 {stats['retries']}회 | 실패 {stats['failures']}회 | "
+              f"평균 {stats['latency_avg'] * 1000:.0f}ms | 최대 {stats['latency_max'] * 1000:.0f}ms")
+    
+    def _record_request(self, latency: float, retried: bool = False, failed: bool = False):
+        """요청 1회의 지연 시간과 결과 기록"""
+        with self._stats_lock:
+            self.stats['requests'] += 1
+            self.stats['latency_total'] += latency
+            self.stats['latency_max'] = max(self.stats['latency_max'], latency)
+            if retried:
+                self.stats['retries'] += 1
+            if failed:
+                self.stats['failures'] += 1
+    
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Retry-After 헤더 파싱 (초 또는 HTTP 날짜)"""
+        if not value:
             return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), self.MAX_RETRY_AFTER)
     
-    def collect_by_keyword(self, keyword: str, max_results: int = 1000) -> List[Dict]:
+    def collect_by_keyword(self, keyword: str, max_results: int = 1000,
+                           watermark: Optional[Dict] = None, verbose: bool = True,
+                           completed: Optional[Set[str]] = None) -> List[NaverPost]:
         """
         키워드로 블로그 포스트 URL 수집
         
         Args:
             keyword: 검색 키워드
             max_results: 최대 수집 개수 (API 제한: 최대 1000)
+            watermark: 이전 실행의 워터마크 (WatermarkStore.get). 주어지면 이미 수집한 포스트에 도달하는 즉시 중단
+            verbose: False면 페이지별 진행 로그 생략
+            completed: 주어지면 빠짐없이 수집한 경우 keyword를 추가 (워터마크에 도달했거나
+                       검색 결과 끝까지 받음). 요청이 실패했거나 워터마크에 닿기 전에
+                       max_results에서 끊기면 추가하지 않음 → 이 키워드의 워터마크는 올리면 안 됨
         
         Returns:
             블로그 포스트 정보 리스트
         """
-        all_posts = []
+        return list(self.iter_by_keyword(keyword, max_results, watermark, verbose, completed))
+    
+    def iter_by_keyword(self, keyword: str, max_results: int = 1000,
+                        watermark: Optional[Dict] = None, verbose: bool = True,
+                        completed: Optional[Set[str]] = None) -> Iterator[NaverPost]:
+        """
+        collect_by_keyword와 같지만, 페이지를 받는 대로 포스트 정보를 하나씩 내보내는 제너레이터
+        
+        Args:
+            collect_by_keyword와 동일
+        
+        Yields:
+            블로그 포스트 정보
+        """
+        collected = 0
         display = 100  # 한 번에 100개씩
         max_results = min(max_results, 1000)  # API 제한
+        log = print if verbose else (lambda *args, **kwargs: None)
         
-        print(f"\n{'='*60}")
-        print(f"📝 네이버 블로그 API 수집 시작: '{keyword}'")
-        print(f"{'='*60}")
+        log(f"\n{'='*60}")
+        log(f"📝 네이버 블로그 API 수집 시작: '{keyword}'")
+        if watermark:
+            log(f"   └ 증분 수집: {watermark['post_date']} 이후 새 포스트만")
+        log(f"{'='*60}")
         
+        # 처음 수집하는 키워드는 max_results까지가 수집 범위이므로 끝까지 받으면 완료
+        complete = not watermark
         for start in range(1, max_results + 1, display):
             current_display = min(display, max_results - start + 1)
-            print(f"📥 수집 중: {start}~{start + current_display - 1}번째...")
+            log(f"📥 수집 중: {start}~{start + current_display - 1}번째...")
             
             result = self.search(keyword, current_display, start)
             if not result or 'items' not in result:
-                print("⚠️ 더 이상 결과가 없습니다.")
+                log("⚠️ 검색 요청이 실패해 이 키워드는 일부만 수집했습니다.")
+                complete = False
                 break
             
             items = result['items']
             if not items:
-                print("⚠️ 검색 결과가 없습니다.")
+                log("⚠️ 검색 결과가 없습니다.")
+                complete = True
                 break
             
-            for item in items:
-                post_data = {
-                    'platform': '네이버 블로그',
-                    'region': '국내',
-                    'keyword': keyword,
-                    'title': self._clean_html(item['title']),
-                    'description': self._clean_html(item['description']),
-                    'blogger_name': item['bloggername'],
-                    'blogger_id': item['bloggerlink'].split('/')[-1] if item['bloggerlink'] else '',
-                    'post_url': item['link'],
-                    'post_date': self._parse_date(item['postdate']),
-                    'collected_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    # 상세 정보는 나중에 추가될 예정
-                    'views': None,
-                    'comments': None,
-                    'likes': None
-                }
-                all_posts.append(post_data)
+            new_items = self._take_new_items(items, watermark)
+            collected += len(new_items)
+            yield from self._build_posts(keyword, new_items)
             
-            # API 호출 제한 대응 (초당 10회 제한)
-            time.sleep(0.15)
+            # 이미 수집한 포스트에 도달했으면 중단
+            if len(new_items) < len(items):
+                log("⏹️  이전 실행에서 수집한 포스트에 도달했습니다.")
+                complete = True
+                break
             
             # 더 이상 결과가 없으면 중단
             if len(items) < current_display:
+                complete = True
                 break
+        else:
+            if not complete:
+                log(f"⚠️ 이전 실행에서 수집한 포스트에 도달하기 전에 최대 {max_results}개에서 멈췄습니다.")
+        
+        if complete and completed is not None:
+            completed.add(keyword)
+        log(f"✅ 네이버 블로그 수집 완료: 총 {collected}개")
+    
+    def collect_many(self, keywords: List[str], max_results: int = 1000,
+                     watermarks: Optional[Dict[str, Dict]] = None,
+                     completed: Optional[Set[str]] = None) -> List[NaverPost]:
+        """
+        여러 키워드를 동시에 수집 (키워드 × 페이지 요청을 스레드 풀로 분산)
+        
+        각 키워드의 첫 페이지로 전체 결과 수를 확인한 뒤, 나머지 페이지를
+        모든 키워드에 걸쳐 동시에 요청한다. 전체 속도는 공유 TokenBucket의
+        API 호출 제한으로만 결정된다. 워터마크가 있는 키워드는 어디서 멈출지
+        미리 알 수 없으므로 키워드 안에서는 순서대로 페이지를 넘긴다.
+        
+        Args:
+            keywords: 검색 키워드 리스트
+            max_results: 키워드당 최대 수집 개수 (API 제한: 최대 1000)
+            watermarks: 키워드별 워터마크 (증분 수집 시)
+            completed: 주어지면 빠짐없이 수집한 키워드를 추가 (collect_by_keyword 참고).
+                       워터마크는 이 키워드들만 갱신해야 함
+        
+        Returns:
+            키워드 순서대로 합쳐진 블로그 포스트 정보 리스트
+        """
+        order = {keyword: idx for idx, keyword in enumerate(keywords)}
+        posts = list(self.iter_many(keywords, max_results, watermarks, completed))
+        # 키워드 안에서는 페이지 순서대로 나오므로 키워드 순서로만 정렬 (stable)
+        return sorted(posts, key=lambda post: order[post.keyword])
+    
+    def iter_many(self, keywords: List[str], max_results: int = 1000,
+                  watermarks: Optional[Dict[str, Dict]] = None,
+                  completed: Optional[Set[str]] = None) -> Iterator[NaverPost]:
+        """
+        collect_many와 같지만, 페이지가 도착하는 대로 포스트 정보를 내보내는 제너레이터
         
-        print(f"✅ 네이버 블로그 수집 완료: 총 {len(all_posts)}개")
-        return all_posts
+        키워드 사이의 순서는 페이지 도착 순이고, 같은 키워드 안에서는 페이지 순서를 지킨다.
+        (앞 페이지가 아직 안 왔으면 뒤 페이지는 잠시 보관)
+        completed는 모든 포스트를 내보낸 뒤에 채우므로, 중간에 소비를 멈추면 비어 있다.
+        
+        Args:
+            collect_many와 동일
+        
+        Yields:
+            블로그 포스트 정보
+        """
+        display = 100
+        max_results = min(max_results, 1000)
+        watermarks = watermarks or {}
+        full_keywords = [k for k in keywords if not watermarks.get(k)]
+        
+        print(f"\n{'='*60}")
+        print(f"📝 네이버 블로그 API 동시 수집 시작: {len(keywords)}개 키워드")
+        if len(full_keywords) < len(keywords):
+            print(f"   └ 증분 수집: {len(keywords) - len(full_keywords)}개 키워드")
+        print(f"{'='*60}")
+        
+        def fetch(keyword, start):
+            return self.search(keyword, min(display, max_results - start + 1), start)
+        
+        counts = dict.fromkeys(keywords, 0)
+        # 키워드별로 다음에 내보낼 페이지 시작 위치 (None이면 끝)와 먼저 도착한 뒷 페이지
+        next_start = {k: 1 for k in full_keywords}
+        arrived: Dict[tuple, Optional[Dict]] = {}
+        # 빠짐없이 수집한 키워드 (페이지 요청이 실패한 키워드는 빠짐)
+        finished: Set[str] = set()
+        failed: Set[str] = set()
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # 0) 워터마크가 있는 키워드는 키워드 단위로 순서대로 수집
+            futures = {
+                executor.submit(self.collect_by_keyword, k, max_results, watermarks[k], False, finished): (k, None)
+                for k in keywords if watermarks.get(k)
+            }
+            # 1) 키워드별 첫 페이지 → 전체 결과 수 확인
+            futures.update({executor.submit(fetch, k, 1): (k, 1) for k in full_keywords})
+            
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    keyword, start = futures.pop(future)
+                    
+                    if start is None:
+                        posts = future.result()
+                        counts[keyword] += len(posts)
+                        yield from posts
+                        continue
+                    
+                    result = future.result()
+                    if start == 1:
+                        # 2) 나머지 페이지를 키워드 구분 없이 동시에 요청
+                        total = min((result or {}).get('total', 0), max_results)
+                        for page_start in range(1 + display, total + 1, display):
+                            page = executor.submit(fetch, keyword, page_start)
+                            futures[page] = (keyword, page_start)
+                            pending.add(page)
+                    arrived[(keyword, start)] = result
+                    
+                    while next_start[keyword] and (keyword, next_start[keyword]) in arrived:
+                        page_start = next_start[keyword]
+                        page = arrived.pop((keyword, page_start))
+                        if not page or 'items' not in page:
+                            # 재시도 후에도 실패한 페이지: 그 뒤 포스트를 놓쳤으므로 완료가 아님
+                            failed.add(keyword)
+                        items = (page or {}).get('items') or []
+                        posts = self._build_posts(keyword, items)
+                        counts[keyword] += len(posts)
+                        
+                        # 결과가 비거나 모자라면 그 뒤 페이지는 사용하지 않음
+                        short = len(items) < min(display, max_results - page_start + 1)
+                        next_start[keyword] = None if short else page_start + display
+                        yield from posts
+        
+        finished.update(k for k in full_keywords if k not in failed)
+        for keyword in keywords:
+            if keyword not in finished:
+                print(f"⚠️ '{keyword}': {counts[keyword]}개 (요청 실패 또는 워터마크 전에 중단, 일부만 수집)")
+            elif keyword in next_start:
+                print(f"✅ '{keyword}': {counts[keyword]}개")
+            else:
+                print(f"✅ '{keyword}': 새 포스트 {counts[keyword]}개")
+        if completed is not None:
+            completed.update(finished)
+        
+        print(f"✅ 네이버 블로그 수집 완료: 총 {sum(counts.values())}개")
+        self.print_stats()
+    
+    def _take_new_items(self, items: List[Dict], watermark: Optional[Dict]) -> List[Dict]:
+        """최신순 결과에서 워터마크(이미 수집한 포스트)에 도달하기 전까지의 항목만 반환"""
+        if not watermark:
+            return items
+        
+        known_date = watermark['post_date']
+        known_urls = set(watermark.get('post_urls', []))
+        
+        for idx, item in enumerate(items):
+            post_date = self._parse_date(item['postdate'])
+            if post_date < known_date or (post_date == known_date and item['link'] in known_urls):
+                return items[:idx]
+        return items
+    
+    def _build_posts(self, keyword: str, items: List[Dict]) -> List[NaverPost]:
+        """검색 API 결과를 블로그 포스트 정보로 변환 (수집일시는 페이지마다 한 번만 계산)"""
+        collected_at = collected_at_now()
+        return [
+            NaverPost(
+                keyword=keyword,
+                title=self._clean_html(item['title']),
+                description=self._clean_html(item['description']),
+                blogger_name=item['bloggername'],
+                blogger_id=item['bloggerlink'].split('/')[-1] if item['bloggerlink'] else '',
+                post_url=item['link'],
+                post_date=self._parse_date(item['postdate']),
+                collected_at=collected_at
+                # 상세 정보(views/comments/likes)는 나중에 추가될 예정
+            )
+            for item in items
+        ]
     
     def _clean_html(self, text: str) -> str:
         """HTML 태그 및 특수문자 제거"""
-        if not text:
-            return ""
-        # HTML 태그 제거
-        text = re.sub('<[^<]+?>', '', text)
-        # HTML 엔티티 변환
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&#39;', "'")
-        return text.strip()
+        return clean_html(text)
     
     def _parse_date(self, date_str: str) -> str:
         """날짜 포맷 변환 (YYYYMMDD -> YYYY-MM-DD)"""
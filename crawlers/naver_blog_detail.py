@@ -1,24 +1,68 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException
+import os
 import time
-import re
-from typing import Dict, List
+import queue
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from utils.rate_limiter import HostRateLimiter
+from utils.stats_cache import StatsCache
+from utils.checkpoint import CheckpointJournal
+from utils.chromedriver import ChromeDriverCache
+from .naver_blog_http import NaverBlogHttpExtractor
+from . import naver_blog_snapshot as snapshot_parser
 
 class NaverBlogDetailCrawler:
     """Selenium을 사용하여 네이버 블로그 상세 정보 수집"""
     
-    def __init__(self, headless: bool = True):
+    # 스냅샷 파서가 읽는 요소 중 하나라도 나타나면 추출을 시작해도 되는 상태로 판단
+    READY_SELECTOR = ", ".join(snapshot_parser.TEXT_SELECTORS + snapshot_parser.CONTENT_SELECTORS)
+    POLL_INTERVAL = 0.1  # 대기 조건 확인 주기 (초)
+    COUNTERS_TIMEOUT = 1.0  # 본문이 뜬 뒤 공감/댓글 카운터를 기다리는 최대 시간 (초, wait_timeout과 별도)
+    
+    # 통계 추출에 필요 없는 리소스는 받지 않음 (이미지는 브라우저 설정으로, 나머지는 CDP로 차단)
+    BLOCKED_CONTENT_PREFS = {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.notifications': 2,
+    }
+    BLOCKED_URL_PATTERNS = [
+        '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',  # 웹 폰트
+        '*.mp4', '*.webm',  # 동영상
+        '*adcr.naver.com*', '*veta.naver.com*', '*tivan.naver.com*', '*ssl.pstatic.net/tveta/*',  # 네이버 광고
+        '*doubleclick.net*', '*googlesyndication.com*', '*google-analytics.com*', '*googletagmanager.com*',
+    ]
+    
+    def __init__(self, headless: bool = True, use_http: bool = True, wait_timeout: float = 5.0,
+                 keep_alive: bool = False, profile_dir: Optional[str] = None, block_resources: bool = True,
+                 driver_cache: Optional[ChromeDriverCache] = None):
         """
         Args:
             headless: True면 브라우저 창 안 띄움 (서버/백그라운드 실행용)
+            use_http: True면 브라우저 없는 HTTP 추출을 먼저 시도하고, 실패한 경우에만 Selenium 사용
+            wait_timeout: 페이지/iframe 요소를 기다리는 최대 시간 (초)
+            keep_alive: True면 iter_extract가 끝나도 워커 브라우저를 닫지 않고 다음 호출에 재사용
+                        (데몬 모드용, 다 쓰면 close() 호출)
+            profile_dir: Chrome 사용자 데이터 폴더 (지정하면 실행 사이에 디스크 캐시/쿠키 유지,
+                         워커마다 하위 폴더 worker-N 사용. None이면 매번 새 프로필)
+            block_resources: True면 이미지/폰트/동영상/광고 요청 차단
+            driver_cache: ChromeDriver 경로 캐시 (None이면 data/chromedriver.json, 워커끼리 공유)
         """
         self.headless = headless
+        self.wait_timeout = wait_timeout
+        self.keep_alive = keep_alive
+        self.profile_dir = profile_dir
+        self.block_resources = block_resources
+        self.driver_cache = driver_cache or ChromeDriverCache()
         self.driver = None
+        self.http_extractor = NaverBlogHttpExtractor() if use_http else None
+        self._driver_failed = False
+        self._pool: List['NaverBlogDetailCrawler'] = []
+        self._profile_name = 'worker-0'
         
     def init_driver(self):
         """Chrome WebDriver 초기화"""
@@ -36,6 +80,9 @@ class NaverBlogDetailCrawler:
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--disable-blink-features=AutomationControlled')
         
+        # DOMContentLoaded에서 바로 반환 (필요한 요소는 extract_blog_stats에서 조건 대기)
+        options.page_load_strategy = 'eager'
+        
         # User-Agent 설정 (봇 감지 회피)
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
@@ -43,14 +90,39 @@ class NaverBlogDetailCrawler:
         options.add_argument('--log-level=3')
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
         
+        # 프로필 폴더를 유지하면 네이버 정적 리소스(js/css)를 다음 실행에서 디스크 캐시로 읽음
+        # (Chrome은 한 폴더를 한 프로세스만 쓸 수 있으므로 워커마다 따로 사용)
+        if self.profile_dir:
+            profile_path = os.path.abspath(os.path.join(self.profile_dir, self._profile_name))
+            os.makedirs(profile_path, exist_ok=True)
+            options.add_argument(f'--user-data-dir={profile_path}')
+        
+        if self.block_resources:
+            options.add_experimental_option('prefs', self.BLOCKED_CONTENT_PREFS)
+        
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            try:
+                self.driver = self._start_chrome(self.driver_cache.resolve(), options)
+            except SessionNotCreatedException:
+                # 캐시된 드라이버가 업데이트된 Chrome 버전과 맞지 않으면 한 번만 다시 받음
+                print("⚠️  ChromeDriver 버전이 Chrome과 맞지 않아 다시 받습니다.")
+                self.driver = self._start_chrome(self.driver_cache.resolve(refresh=True), options)
+            
+            if self.block_resources:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.BLOCKED_URL_PATTERNS})
             print("✅ Chrome WebDriver 초기화 완료")
         except Exception as e:
             print(f"❌ WebDriver 초기화 실패: {e}")
+            if self.driver is not None:
+                self.close_driver()
             raise
     
+    @staticmethod
+    def _start_chrome(driver_path: str, options: Options) -> webdriver.Chrome:
+        """지정한 chromedriver로 Chrome 실행"""
+        return webdriver.Chrome(service=Service(driver_path), options=options)
+    
     def close_driver(self):
         """WebDriver 종료"""
         if self.driver:
@@ -58,12 +130,89 @@ class NaverBlogDetailCrawler:
             self.driver = None
             print("🔒 Chrome WebDriver 종료")
     
-    def extract_blog_stats(self, url: str) -> Dict:
+    def close(self):
+        """자신과 재사용 중인 워커 크롤러의 WebDriver를 모두 종료"""
+        for crawler in [self] + self._pool:
+            crawler.close_driver()
+        self._pool = []
+    
+    def _worker_crawlers(self, count: int) -> List['NaverBlogDetailCrawler']:
+        """
+        워커용 크롤러 (독립된 WebDriver 세션, 드라이버는 처음 필요할 때 시작)
+        
+        keep_alive면 이전 호출에서 띄운 브라우저를 그대로 다시 사용한다.
+        """
+        def create(index: int):
+            crawler = NaverBlogDetailCrawler(headless=self.headless, use_http=self.http_extractor is not None,
+                                             wait_timeout=self.wait_timeout, profile_dir=self.profile_dir,
+                                             block_resources=self.block_resources, driver_cache=self.driver_cache)
+            crawler._profile_name = f'worker-{index}'
+            return crawler
+        
+        if not self.keep_alive:
+            return [create(i + 1) for i in range(count)]
+        while len(self._pool) < count:
+            self._pool.append(create(len(self._pool) + 1))
+        return self._pool[:count]
+    
+    def _discard_dead_driver(self):
+        """재사용하려는 브라우저가 죽었으면 버림 (다음에 필요할 때 다시 띄움)"""
+        self._driver_failed = False
+        if self.driver is None:
+            return
+        try:
+            self.driver.current_url
+        except Exception:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+    
+    def extract_stats(self, url: str) -> Dict:
+        """
+        HTTP 추출을 먼저 시도하고, 실패하면 Selenium으로 재시도
+        
+        Args:
+            url: 네이버 블로그 포스트 URL
+        
+        Returns:
+            extract_blog_stats와 같은 형식 + 'source' ('http' 또는 'selenium')
+        """
+        if self.http_extractor:
+            try:
+                result = self.http_extractor.extract_blog_stats(url)
+            except Exception as e:
+                # 예상 못 한 응답 하나로 전체 크롤링이 멈추지 않게 Selenium으로 재시도
+                print(f"  ⚠️  HTTP 추출 오류, Selenium으로 재시도: {e}")
+                result = {'success': False}
+            if result['success']:
+                result['source'] = 'http'
+                return result
+        
+        # Selenium 폴백 (드라이버는 처음 필요할 때 띄움)
+        if self._driver_failed:
+            result = {'views': 0, 'comments': 0, 'likes': 0, 'success': False,
+                      'error': 'WebDriver 초기화 실패'}
+        else:
+            try:
+                self.init_driver()
+                result = self.extract_blog_stats(url)
+            except Exception as e:
+                self._driver_failed = True
+                result = {'views': 0, 'comments': 0, 'likes': 0, 'success': False,
+                          'error': f'WebDriver 초기화 실패: {e}'}
+        
+        result['source'] = 'selenium'
+        return result
+    
+    def extract_blog_stats(self, url: str, keep_snapshot: bool = False) -> Dict:
         """
         블로그 URL에서 조회수, 댓글, 좋아요 추출
         
         Args:
             url: 네이버 블로그 포스트 URL
+            keep_snapshot: True면 파싱에 사용한 DOM 스냅샷을 result['snapshot']에 포함 (파서 검증용)
         
         Returns:
             {
@@ -71,7 +220,8 @@ class NaverBlogDetailCrawler:
                 'comments': 댓글수,
                 'likes': 좋아요수,
                 'success': 성공 여부,
-                'error': 에러 메시지 (실패 시)
+                'error': 에러 메시지 (실패 시),
+                'timings': 단계별 소요 시간 (초)
             }
         """
         result = {
@@ -79,32 +229,52 @@ class NaverBlogDetailCrawler:
             'comments': 0,
             'likes': 0,
             'success': False,
-            'error': None
+            'error': None,
+            'timings': {}
         }
+        timings = result['timings']
         
         try:
+            # 페이지 이동 후 mainFrame 또는 추출 대상 요소가 나타날 때까지만 대기
+            started = time.perf_counter()
             self.driver.get(url)
-            time.sleep(2)  # 페이지 로딩 대기
-            
-            # iframe으로 전환 시도 (신규 블로그)
             try:
-                iframe = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.ID, "mainFrame"))
-                )
-                self.driver.switch_to.frame(iframe)
-                time.sleep(1)
-            except:
-                # iframe 없는 경우 (구 블로그 또는 다른 형식)
-                pass
+                target = self._wait_until(self._find_frame_or_content)
+            except TimeoutException:
+                # 알 수 없는 형식 → 있는 그대로 추출 시도
+                target = None
+            timings['navigate'] = round(time.perf_counter() - started, 3)
+            
+            # iframe으로 전환 (신규 블로그)
+            if target is not None and target is not True:
+                started = time.perf_counter()
+                self.driver.switch_to.frame(target)
+                try:
+                    self._wait_until(lambda d: d.find_elements(By.CSS_SELECTOR, self.READY_SELECTOR))
+                except TimeoutException:
+                    pass
+                timings['frame_switch'] = round(time.perf_counter() - started, 3)
             
-            # 조회수 추출
-            result['views'] = self._extract_views()
+            # 본문이 보여도 공감/댓글 카운터는 나중에 채워지므로 숫자가 들어올 때까지 대기
+            if target is not None:
+                started = time.perf_counter()
+                self._wait_for_counters()
+                timings['counters'] = round(time.perf_counter() - started, 3)
             
-            # 댓글 수 추출
-            result['comments'] = self._extract_comments()
+            # 필요한 텍스트를 execute_script 한 번으로 수집
+            started = time.perf_counter()
+            snapshot = snapshot_parser.take_snapshot(self.driver)
+            timings['snapshot'] = round(time.perf_counter() - started, 3)
+            if keep_snapshot:
+                result['snapshot'] = snapshot
             
-            # 좋아요 수 추출 (공감)
-            result['likes'] = self._extract_likes()
+            # 조회수 / 댓글 수 / 좋아요 수(공감) 파싱
+            for field, parser in (('views', snapshot_parser.parse_views),
+                                  ('comments', snapshot_parser.parse_comments),
+                                  ('likes', snapshot_parser.parse_likes)):
+                started = time.perf_counter()
+                result[field] = parser(snapshot)
+                timings[field] = round(time.perf_counter() - started, 3)
             
             result['success'] = True
             
@@ -120,181 +290,256 @@ class NaverBlogDetailCrawler:
         
         return result
     
-    def _extract_views(self) -> int:
-        """조회수 추출 - 다양한 패턴 시도"""
-        try:
-            # 패턴 1: <span class="se-f">조회 1,234</span>
-            patterns = [
-                (By.CLASS_NAME, "se_publishDate"),
-                (By.CLASS_NAME, "se-f"),
-                (By.CLASS_NAME, "se-module-text"),
-                (By.CLASS_NAME, "blog2_series"),
-            ]
-            
-            for by, value in patterns:
-                try:
-                    elements = self.driver.find_elements(by, value)
-                    for elem in elements:
-                        text = elem.text
-                        if '조회' in text:
-                            numbers = re.findall(r'[\d,]+', text)
-                            if numbers:
-                                return int(numbers[0].replace(',', ''))
-                except:
-                    continue
-            
-            # 패턴 2: 전체 페이지 텍스트에서 "조회" 패턴 찾기
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
-            views_match = re.search(r'조회\s*([\d,]+)', page_text)
-            if views_match:
-                return int(views_match.group(1).replace(',', ''))
-            
-        except Exception as e:
-            pass
-        
-        return 0
+    def _wait_until(self, condition):
+        """짧은 주기로 condition을 확인하며 wait_timeout까지 대기"""
+        return WebDriverWait(self.driver, self.wait_timeout, poll_frequency=self.POLL_INTERVAL).until(condition)
     
-    def _extract_comments(self) -> int:
-        """댓글 수 추출"""
-        try:
-            # 패턴 1: 댓글 영역의 카운트 텍스트
-            comment_selectors = [
-                ".u_cbox_count",
-                ".cmt_count",
-                ".comment_count",
-                ".num",
-                ".u_cbox_info_txt"
-            ]
-            
-            for selector in comment_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        text = elem.text
-                        if '댓글' in text:
-                            numbers = re.findall(r'[\d,]+', text)
-                            if numbers:
-                                return int(numbers[0].replace(',', ''))
-                except:
-                    continue
-            
-            # 패턴 2: 댓글 아이템 직접 카운트
-            comment_items = self.driver.find_elements(By.CSS_SELECTOR, ".u_cbox_comment_box, .cmt_item")
-            if comment_items:
-                return len(comment_items)
-            
-            # 패턴 3: 전체 텍스트에서 추출
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
-            comments_match = re.search(r'댓글\s*([\d,]+)', page_text)
-            if comments_match:
-                return int(comments_match.group(1).replace(',', ''))
-            
-        except Exception as e:
-            pass
+    def _wait_for_counters(self):
+        """
+        공감/댓글 카운터에 숫자가 채워질 때까지 대기 (최대 COUNTERS_TIMEOUT초)
         
-        return 0
-    
-    def _extract_likes(self) -> int:
-        """좋아요(공감) 수 추출"""
+        카운터 요소가 없는 포스트는 바로 반환하고, 끝내 채워지지 않으면 있는 그대로 추출한다.
+        """
+        timeout = min(self.wait_timeout, self.COUNTERS_TIMEOUT)
         try:
-            # 패턴 1: 공감 버튼의 카운트
-            like_selectors = [
-                ".u_likeit_text",
-                ".btn_sympathy .count",
-                ".ico_like",
-                ".u_likeit_list_count"
-            ]
-            
-            for selector in like_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        text = elem.text
-                        if text:
-                            numbers = re.findall(r'[\d,]+', text)
-                            if numbers:
-                                return int(numbers[0].replace(',', ''))
-                except:
-                    continue
-            
-            # 패턴 2: 버튼 텍스트에서 추출
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            for btn in buttons:
-                text = btn.text
-                if '공감' in text or '좋아요' in text:
-                    numbers = re.findall(r'[\d,]+', text)
-                    if numbers:
-                        return int(numbers[0].replace(',', ''))
-            
-            # 패턴 3: 전체 텍스트에서 추출
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
-            likes_match = re.search(r'공감\s*([\d,]+)', page_text)
-            if likes_match:
-                return int(likes_match.group(1).replace(',', ''))
-            
-        except Exception as e:
+            WebDriverWait(self.driver, timeout, poll_frequency=self.POLL_INTERVAL).until(snapshot_parser.counters_ready)
+        except TimeoutException:
             pass
-        
-        return 0
     
-    def batch_extract(self, posts: List[Dict], delay: float = 2.0) -> List[Dict]:
+    def _find_frame_or_content(self, driver):
+        """mainFrame iframe이 있으면 그 요소, 본문이 바로 있으면 True, 둘 다 없으면 False"""
+        frames = driver.find_elements(By.ID, "mainFrame")
+        if frames:
+            return frames[0]
+        return bool(driver.find_elements(By.CSS_SELECTOR, self.READY_SELECTOR))
+    
+    def batch_extract(self, posts: List[Dict], delay: float = 2.0, workers: int = 1,
+                      cache: Optional[StatsCache] = None,
+                      journal: Optional[CheckpointJournal] = None) -> List[Dict]:
         """
         여러 블로그 포스트 일괄 상세 정보 수집
         
         Args:
-            posts: 블로그 포스트 정보 리스트 (post_url 포함)
-            delay: 각 요청 사이 대기 시간 (초)
+            posts: 블로그 포스트 정보 리스트 (post_url 포함, 키워드 간 중복 허용)
+            delay: 같은 호스트로 보내는 요청 사이 최소 간격 (초, 전체 워커 공통)
+            workers: 동시에 처리할 워커 수 (워커마다 독립된 WebDriver 세션)
+            cache: 상세 정보 캐시. 주어지면 만료되지 않은 포스트는 크롤링하지 않음
+            journal: 체크포인트 저널. 완료된 포스트를 기록하고, 이미 기록된 포스트는 건너뜀 (재개용)
         
         Returns:
             상세 정보가 추가된 포스트 리스트
         """
-        total = len(posts)
-        success_count = 0
+        for _ in self.iter_extract(posts, delay=delay, workers=workers, cache=cache, journal=journal):
+            pass
+        return posts
+    
+    def iter_extract(self, posts: Union[Iterable[Dict], queue.Queue], delay: float = 2.0, workers: int = 1,
+                     cache: Optional[StatsCache] = None,
+                     journal: Optional[CheckpointJournal] = None,
+                     max_pending: int = 100) -> Iterator[Dict]:
+        """
+        batch_extract와 같지만, 포스트를 받는 대로 크롤링하고 상세 정보가 채워진 포스트를
+        완료되는 순서대로 내보내는 제너레이터
+        
+        posts는 검색 단계의 제너레이터나 큐여도 되므로, 검색이 끝나기 전에 상세 크롤링을
+        시작할 수 있다. 크롤링 대기열이 max_pending개로 차면 posts를 더 읽지 않는다 (backpressure).
+        
+        Args:
+            posts: 포스트 이터러블, 또는 포스트를 넣고 마지막에 None을 넣는 queue.Queue
+            max_pending: 크롤링 대기열 최대 크기
+            나머지는 batch_extract와 동일
+        
+        Yields:
+            상세 정보가 추가된 포스트 (캐시/저널 적중 포스트는 읽는 즉시, 나머지는 크롤링 완료 순)
+        """
+        if isinstance(posts, queue.Queue):
+            posts = iter(posts.get, None)
+        
+        # 같은 포스트가 여러 키워드에 걸려 있으면 한 번만 크롤링하고 결과를 모든 행에 반영
+        # in_flight: 크롤링 중인 포스트의 행 목록, finished: 끝난 포스트의 상세 정보
+        in_flight: Dict[str, List[Dict]] = {}
+        finished: Dict[str, Dict] = {}
+        counts = {'rows': 0, 'resumed': 0, 'cache_hits': 0, 'queued': 0}
+        progress = {'done': 0, 'success': 0, 'http': 0, 'selenium': 0}
+        lock = threading.Lock()
+        
+        # 모든 워커가 하나의 rate limiter를 공유 → 네이버가 받는 요청 빈도는 워커 수와 무관
+        limiter = HostRateLimiter(min_interval=delay)
+        workers = max(1, workers)
+        work_queue = queue.Queue(maxsize=max(1, max_pending))
+        # 읽기 스레드/워커가 넘기는 포스트 묶음 (각 스레드 종료 시 None)
+        done_queue = queue.Queue()
+        stop = threading.Event()
+        failure = []
         
         print(f"\n{'='*60}")
-        print(f"🔍 네이버 블로그 상세 크롤링 시작")
-        print(f"{'='*60}")
-        print(f"📊 총 {total}개 포스트 크롤링 예정")
-        print(f"⏱️  예상 소요 시간: 약 {int(total * (delay + 2) / 60)}분")
+        print(f"🔍 네이버 블로그 상세 크롤링 시작 (워커 {workers}개, 대기열 최대 {work_queue.maxsize}개)")
         print(f"{'='*60}\n")
         
-        self.init_driver()
+        def put_work(item) -> bool:
+            # 대기열이 가득 차 있으면 기다리되, 중단되면 포기
+            while not stop.is_set():
+                try:
+                    work_queue.put(item, timeout=0.2)
+                    return True
+                except queue.Full:
+                    continue
+            return False
         
-        for idx, post in enumerate(posts, 1):
-            url = post['post_url']
-            print(f"[{idx}/{total}] 크롤링 중: {post['title'][:30]}...")
-            
-            stats = self.extract_blog_stats(url)
-            
-            # 결과 업데이트
-            post['views'] = stats['views']
-            post['comments'] = stats['comments']
-            post['likes'] = stats['likes']
-            post['detail_crawled'] = stats['success']
-            
-            if stats['success']:
-                success_count += 1
-                print(f"  ✅ 조회: {stats['views']:,} | 댓글: {stats['comments']} | 좋아요: {stats['likes']}")
-            else:
-                print(f"  ⚠️  상세 정보 수집 실패: {stats['error']}")
-            
-            # 진행률 표시
-            if idx % 10 == 0:
-                progress = (idx / total) * 100
-                print(f"\n📈 진행률: {progress:.1f}% ({idx}/{total}) | 성공: {success_count}/{idx}\n")
-            
-            # 다음 요청 전 대기
-            if idx < total:
-                time.sleep(delay)
+        def reader():
+            try:
+                for post in posts:
+                    if stop.is_set():
+                        break
+                    key = self.post_key(post['post_url'])
+                    with lock:
+                        counts['rows'] += 1
+                        if key in in_flight:
+                            in_flight[key].append(post)
+                            continue
+                        
+                        # 이전 실행에서 끝낸 포스트와 캐시 적중 포스트는 바로 채우고, 나머지만 크롤링
+                        stats = finished.get(key)
+                        if stats is None and journal and key in journal.completed:
+                            stats = finished[key] = journal.completed[key]
+                            counts['resumed'] += 1
+                        if stats is None and cache:
+                            stats = cache.get(key)
+                            if stats:
+                                finished[key] = stats
+                                counts['cache_hits'] += 1
+                        if stats:
+                            self._apply_stats(post, stats, success=stats.get('success', True))
+                            done_queue.put([post])
+                            continue
+                        
+                        in_flight[key] = [post]
+                        counts['queued'] += 1
+                        idx = counts['queued']
+                    if not put_work((idx, key)):
+                        break
+            except Exception as e:
+                failure.append(e)
+                stop.set()
+            finally:
+                for _ in range(workers):
+                    put_work(None)
+                done_queue.put(None)
         
-        self.close_driver()
+        # 첫 번째 워커는 자기 자신, 나머지는 독립된 WebDriver 세션을 가진 크롤러
+        crawlers = [self] + self._worker_crawlers(workers - 1)
+        if self.keep_alive:
+            for crawler in crawlers:
+                crawler._discard_dead_driver()
+        
+        def worker(crawler: 'NaverBlogDetailCrawler'):
+            try:
+                while not stop.is_set():
+                    try:
+                        item = work_queue.get(timeout=0.2)
+                    except queue.Empty:
+                        continue
+                    if item is None:
+                        break
+                    
+                    idx, key = item
+                    with lock:
+                        post = in_flight[key][0]
+                    url = post['post_url']
+                    limiter.wait(url)
+                    stats = crawler.extract_stats(url)
+                    
+                    # 결과 업데이트 (같은 포스트의 모든 키워드 행, 크롤링 중 추가로 들어온 행 포함)
+                    with lock:
+                        rows = in_flight.pop(key)
+                        for row in rows:
+                            self._apply_stats(row, stats, success=stats['success'])
+                        # 실패도 기록해 같은 포스트의 다른 키워드 행이 뒤늦게 와도 다시 크롤링하지 않음
+                        finished[key] = stats
+                    if stats['success']:
+                        if cache:
+                            cache.put(key, stats)
+                        if journal:
+                            journal.record(key, stats)
+                    done_queue.put(rows)
+                    
+                    with lock:
+                        progress['done'] += 1
+                        if stats['success']:
+                            progress['success'] += 1
+                            progress[stats['source']] += 1
+                        done, success_count, queued = progress['done'], progress['success'], counts['queued']
+                        
+                        shared = f" (키워드 {len(rows)}개)" if len(rows) > 1 else ""
+                        print(f"[{idx}/{queued}] {post['title'][:30]}...{shared}")
+                        if stats['success']:
+                            print(f"  ✅ 조회: {stats['views']:,} | 댓글: {stats['comments']} | 좋아요: {stats['likes']}")
+                        else:
+                            print(f"  ⚠️  상세 정보 수집 실패: {stats['error']}")
+                        
+                        # 진행률 표시 (검색이 아직 진행 중이면 분모가 늘어남)
+                        if done % 10 == 0:
+                            print(f"\n📈 진행률: {done / queued * 100:.1f}% ({done}/{queued}) | 성공: {success_count}/{done}\n")
+            except Exception as e:
+                # 읽기 스레드가 가득 찬 대기열에서 멈추지 않도록 전체 중단
+                failure.append(e)
+                stop.set()
+            finally:
+                if not self.keep_alive:
+                    crawler.close_driver()
+                done_queue.put(None)
+        
+        threads = [threading.Thread(target=reader, name='detail-reader', daemon=True)]
+        threads += [threading.Thread(target=worker, args=(c,), daemon=True) for c in crawlers]
+        for t in threads:
+            t.start()
+        
+        try:
+            running = len(threads)
+            while running:
+                rows = done_queue.get()
+                if rows is None:
+                    running -= 1
+                    continue
+                yield from rows
+        finally:
+            # 중단(Ctrl-C, 예외, 소비 중단)되더라도 그때까지 끝난 포스트는 저널에 남김
+            stop.set()
+            if journal:
+                journal.flush()
+        
+        if failure:
+            raise failure[0]
+        
+        total = counts['queued']
+        success_count = progress['success']
         
         print(f"\n{'='*60}")
         print(f"✅ 네이버 블로그 상세 크롤링 완료")
         print(f"{'='*60}")
         print(f"📊 전체: {total}개")
-        print(f"✅ 성공: {success_count}개 ({success_count/total*100:.1f}%)")
-        print(f"❌ 실패: {total - success_count}개 ({(total-success_count)/total*100:.1f}%)")
+        if total:
+            print(f"✅ 성공: {success_count}개 ({success_count/total*100:.1f}%)")
+            print(f"   └ HTTP: {progress['http']}개 | Selenium: {progress['selenium']}개")
+            print(f"❌ 실패: {total - success_count}개 ({(total-success_count)/total*100:.1f}%)")
+        if counts['rows']:
+            unique = total + counts['resumed'] + counts['cache_hits']
+            print(f"🔗 고유 포스트: {unique}/{counts['rows']}행 ({unique / counts['rows'] * 100:.1f}%)")
+            if counts['resumed']:
+                print(f"⏯️  이전 실행에서 완료: {counts['resumed']}개 (건너뜀)")
+            if cache:
+                print(f"💾 캐시 적중: {counts['cache_hits']}개 (적중률 {counts['cache_hits'] / unique * 100:.1f}%)")
         print(f"{'='*60}\n")
-        
-        return posts
+    
+    @staticmethod
+    def post_key(url: str) -> str:
+        """포스트 식별 키 (blogId/logNo)"""
+        return NaverBlogHttpExtractor.post_key(url)
+    
+    @staticmethod
+    def _apply_stats(post: Dict, stats: Dict, success: bool):
+        """상세 정보를 포스트에 반영"""
+        post['views'] = stats['views']
+        post['comments'] = stats['comments']
+        post['likes'] = stats['likes']
+        post['detail_crawled'] = success
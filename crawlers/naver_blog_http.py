@@ -0,0 +1,146 @@
+import requests
+from bs4 import BeautifulSoup
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from . import naver_blog_snapshot as snapshot_parser
+
+class NaverBlogHttpExtractor:
+    """브라우저 없이 PostView HTML과 공감 API로 네이버 블로그 상세 정보 수집"""
+
+    POST_VIEW_URL = "https://blog.naver.com/PostView.naver"
+    LIKE_API_URL = "https://blog.like.naver.com/v1/search/contents"
+
+    # 본문 영역 (이 중 하나라도 있어야 정상적인 포스트 페이지로 판단)
+    CONTENT_SELECTORS = snapshot_parser.CONTENT_SELECTORS + ["#viewTypeSelector"]
+
+    def __init__(self, timeout: float = 5.0):
+        """
+        Args:
+            timeout: HTTP 요청 타임아웃 (초)
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Referer': 'https://blog.naver.com/',
+        })
+
+    @staticmethod
+    def parse_post_id(url: str) -> Optional[Tuple[str, str]]:
+        """
+        포스트 URL에서 (blogId, logNo) 추출
+
+        지원 형식:
+            https://blog.naver.com/{blogId}/{logNo}
+            https://m.blog.naver.com/{blogId}/{logNo}
+            https://blog.naver.com/PostView.naver?blogId=...&logNo=...
+
+        Returns:
+            (blogId, logNo) 또는 네이버 블로그 URL이 아니면 None
+        """
+        if not url:
+            return None
+
+        parsed = urlparse(url)
+        if not parsed.netloc.endswith('blog.naver.com'):
+            return None
+
+        query = parse_qs(parsed.query)
+        if 'blogId' in query and 'logNo' in query:
+            return query['blogId'][0], query['logNo'][0]
+
+        parts = [p for p in parsed.path.split('/') if p]
+        if len(parts) >= 2 and parts[1].isdigit():
+            return parts[0], parts[1]
+
+        return None
+
+    @classmethod
+    def post_key(cls, url: str) -> str:
+        """
+        같은 포스트를 가리키는 URL들이 공유하는 식별 키
+
+        Returns:
+            네이버 블로그면 'blogId/logNo', 아니면 쿼리/프래그먼트를 뺀 URL
+        """
+        post_id = cls.parse_post_id(url)
+        if post_id:
+            return f"{post_id[0].lower()}/{post_id[1]}"
+
+        parsed = urlparse(url or '')
+        return f"{parsed.netloc}{parsed.path}".rstrip('/')
+
+    def extract_blog_stats(self, url: str) -> Dict:
+        """
+        블로그 URL에서 조회수, 댓글, 좋아요 추출 (HTTP 전용)
+
+        Args:
+            url: 네이버 블로그 포스트 URL
+
+        Returns:
+            NaverBlogDetailCrawler.extract_blog_stats와 같은 형식의 결과
+        """
+        result = {
+            'views': 0,
+            'comments': 0,
+            'likes': 0,
+            'success': False,
+            'error': None
+        }
+
+        post_id = self.parse_post_id(url)
+        if not post_id:
+            result['error'] = "네이버 블로그 URL 형식이 아님"
+            return result
+        blog_id, log_no = post_id
+
+        try:
+            response = self.session.get(
+                self.POST_VIEW_URL,
+                params={'blogId': blog_id, 'logNo': log_no, 'redirect': 'Dlog', 'widgetTypeCall': 'true'},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            result['error'] = f"PostView 요청 실패: {e}"
+            return result
+
+        soup = BeautifulSoup(response.text, 'html.parser')
+        if not any(soup.select_one(selector) for selector in self.CONTENT_SELECTORS):
+            result['error'] = "PostView 본문을 찾을 수 없음"
+            return result
+
+        snapshot = snapshot_parser.snapshot_from_soup(soup)
+
+        result['views'] = snapshot_parser.parse_views(snapshot)
+        result['comments'] = snapshot_parser.parse_comments(snapshot)
+
+        likes = self._fetch_likes(blog_id, log_no)
+        result['likes'] = likes if likes is not None else snapshot_parser.parse_likes(snapshot)
+
+        result['success'] = True
+        return result
+
+    def _fetch_likes(self, blog_id: str, log_no: str) -> Optional[int]:
+        """공감 JSON API에서 공감 수 조회 (실패 시 None)"""
+        try:
+            response = self.session.get(
+                self.LIKE_API_URL,
+                params={
+                    'suppress_response_codes': 'true',
+                    'pool': 'blogid',
+                    'q': f'BLOG[{blog_id}_{log_no}]',
+                },
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            contents = response.json().get('contents') or []
+            if not contents:
+                return None
+
+            reactions = contents[0].get('reactions') or []
+            return sum(int(r.get('count', 0)) for r in reactions)
+        except (requests.exceptions.RequestException, TypeError, AttributeError, ValueError):
+            # 응답 형식이 예상과 다르면(리스트 응답, 숫자가 아닌 count 등) 본문의 공감 수 사용
+            return None
@@ -0,0 +1,179 @@
+"""
+네이버 블로그 DOM 스냅샷 수집 및 파싱
+
+스냅샷 형식:
+    {
+        'selectors': {CSS 선택자: [요소 텍스트, ...]},
+        'counts': {CSS 선택자: 요소 개수},
+        'buttons': [button 텍스트, ...],
+        'body': 페이지 전체 텍스트
+    }
+
+Selenium에서는 SNAPSHOT_SCRIPT 한 번으로, HTTP 경로에서는 snapshot_from_soup으로
+같은 형식을 만들고, 조회수/댓글/공감 파싱은 순수 Python 함수로 처리한다.
+저장해 둔 스냅샷(JSON)만으로 파서를 오프라인 검증할 수 있다.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# 조회수: <span class="se-f">조회 1,234</span> 형태
+VIEW_SELECTORS = [".se_publishDate", ".se-f", ".se-module-text", ".blog2_series"]
+# 댓글: '댓글' 문구와 숫자가 함께 있는 영역
+COMMENT_SELECTORS = [".u_cbox_count", ".cmt_count", ".comment_count", ".num", ".u_cbox_info_txt"]
+# 댓글: 숫자만 들어 있는 PostView의 댓글 수 요소
+COMMENT_COUNT_SELECTORS = ["#commentCount", "._commentCount"]
+# 댓글 아이템 (텍스트 없이 개수만 수집)
+COMMENT_ITEM_SELECTOR = ".u_cbox_comment_box, .cmt_item"
+# 공감 버튼의 카운트
+LIKE_SELECTORS = [".u_likeit_text", ".btn_sympathy .count", ".ico_like", ".u_likeit_list_count"]
+# 본문 영역
+CONTENT_SELECTORS = [".se-main-container", "#postViewArea", ".se_component_wrap"]
+
+# 본문보다 늦게 비동기로 채워지는 카운터 (그룹마다 숫자가 들어간 요소가 하나라도 있으면 준비 완료,
+# 공감/댓글을 막아 둔 포스트처럼 그룹의 요소가 아예 없으면 기다리지 않음)
+COUNTER_GROUPS = [
+    LIKE_SELECTORS,
+    COMMENT_COUNT_SELECTORS + [".u_cbox_count", ".cmt_count", ".comment_count"],
+]
+
+TEXT_SELECTORS = VIEW_SELECTORS + COMMENT_SELECTORS + COMMENT_COUNT_SELECTORS + LIKE_SELECTORS
+COUNT_SELECTORS = [COMMENT_ITEM_SELECTOR]
+
+# arguments[0]: 텍스트를 수집할 선택자, arguments[1]: 개수만 셀 선택자
+SNAPSHOT_SCRIPT = """
+const textSelectors = arguments[0];
+const countSelectors = arguments[1];
+const selectors = {};
+const counts = {};
+for (const sel of textSelectors) {
+    selectors[sel] = Array.from(document.querySelectorAll(sel), e => e.innerText || '');
+}
+for (const sel of countSelectors) {
+    counts[sel] = document.querySelectorAll(sel).length;
+}
+return {
+    selectors: selectors,
+    counts: counts,
+    buttons: Array.from(document.querySelectorAll('button'), e => e.innerText || ''),
+    body: document.body ? document.body.innerText : ''
+};
+"""
+
+# arguments[0]: 선택자 그룹 목록 → 페이지에 있는 그룹마다 숫자가 채워진 요소가 있으면 true
+COUNTERS_READY_SCRIPT = """
+const groups = arguments[0];
+return groups.every(group => {
+    const elements = group.flatMap(sel => Array.from(document.querySelectorAll(sel)));
+    return elements.length === 0 || elements.some(e => /\\d/.test(e.innerText || ''));
+});
+"""
+
+NUMBER_PATTERN = re.compile(r'[\d,]+')
+VIEWS_PATTERN = re.compile(r'조회\s*([\d,]+)')
+COMMENTS_PATTERN = re.compile(r'댓글\s*([\d,]+)')
+LIKES_PATTERN = re.compile(r'공감\s*([\d,]+)')
+
+
+def take_snapshot(driver) -> Dict:
+    """현재 프레임의 DOM 스냅샷을 execute_script 한 번으로 수집"""
+    return driver.execute_script(SNAPSHOT_SCRIPT, TEXT_SELECTORS, COUNT_SELECTORS)
+
+
+def counters_ready(driver) -> bool:
+    """페이지에 있는 공감/댓글 카운터에 숫자가 채워졌는지 (WebDriverWait 조건용)"""
+    return bool(driver.execute_script(COUNTERS_READY_SCRIPT, COUNTER_GROUPS))
+
+
+def snapshot_from_soup(soup) -> Dict:
+    """BeautifulSoup 문서에서 SNAPSHOT_SCRIPT와 같은 형식의 스냅샷 생성"""
+    return {
+        'selectors': {
+            sel: [e.get_text(' ', strip=True) for e in soup.select(sel)]
+            for sel in TEXT_SELECTORS
+        },
+        'counts': {sel: len(soup.select(sel)) for sel in COUNT_SELECTORS},
+        'buttons': [b.get_text(' ', strip=True) for b in soup.find_all('button')],
+        'body': soup.get_text(' ', strip=True),
+    }
+
+
+def _first_number(text: str) -> Optional[int]:
+    """텍스트에서 첫 번째 숫자(콤마 허용) 추출"""
+    for match in NUMBER_PATTERN.findall(text or ''):
+        digits = match.replace(',', '')
+        if digits:
+            return int(digits)
+    return None
+
+
+def _texts(snapshot: Dict, selectors: List[str]):
+    """선택자 순서대로 스냅샷의 요소 텍스트 순회"""
+    collected = snapshot.get('selectors') or {}
+    for selector in selectors:
+        for text in collected.get(selector) or []:
+            yield text
+
+
+def _search_body(snapshot: Dict, pattern) -> Optional[int]:
+    """페이지 전체 텍스트에서 패턴으로 숫자 추출"""
+    match = pattern.search(snapshot.get('body') or '')
+    if match:
+        return _first_number(match.group(1))
+    return None
+
+
+def parse_views(snapshot: Dict) -> int:
+    """조회수 파싱 - 다양한 패턴 시도"""
+    # 패턴 1: 조회수 영역 텍스트
+    for text in _texts(snapshot, VIEW_SELECTORS):
+        if '조회' in text:
+            number = _first_number(text)
+            if number is not None:
+                return number
+
+    # 패턴 2: 전체 페이지 텍스트에서 "조회" 패턴 찾기
+    return _search_body(snapshot, VIEWS_PATTERN) or 0
+
+
+def parse_comments(snapshot: Dict) -> int:
+    """댓글 수 파싱"""
+    # 패턴 1: PostView의 댓글 수 요소
+    for text in _texts(snapshot, COMMENT_COUNT_SELECTORS):
+        number = _first_number(text)
+        if number is not None:
+            return number
+
+    # 패턴 2: 댓글 영역의 카운트 텍스트
+    for text in _texts(snapshot, COMMENT_SELECTORS):
+        if '댓글' in text:
+            number = _first_number(text)
+            if number is not None:
+                return number
+
+    # 패턴 3: 댓글 아이템 직접 카운트
+    item_count = (snapshot.get('counts') or {}).get(COMMENT_ITEM_SELECTOR, 0)
+    if item_count:
+        return item_count
+
+    # 패턴 4: 전체 텍스트에서 추출
+    return _search_body(snapshot, COMMENTS_PATTERN) or 0
+
+
+def parse_likes(snapshot: Dict) -> int:
+    """좋아요(공감) 수 파싱"""
+    # 패턴 1: 공감 버튼의 카운트
+    for text in _texts(snapshot, LIKE_SELECTORS):
+        number = _first_number(text)
+        if number is not None:
+            return number
+
+    # 패턴 2: 버튼 텍스트에서 추출
+    for text in snapshot.get('buttons') or []:
+        if '공감' in text or '좋아요' in text:
+            number = _first_number(text)
+            if number is not None:
+                return number
+
+    # 패턴 3: 전체 텍스트에서 추출
+    return _search_body(snapshot, LIKES_PATTERN) or 0
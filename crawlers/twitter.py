@@ -1,22 +1,110 @@
 from ntscraper import Nitter
+import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict
-import re
+from typing import List, Dict, Iterator, Optional
+from urllib.parse import quote
+from utils.bloom_filter import BloomFilter
+from utils.instance_health import InstanceHealthStore
+from utils.records import Region, Tweet, collected_at_now
+from utils.text import classify_regions, contains_korean
+
+class SearchNitter(Nitter):
+    """검색 결과가 없는 페이지("No items found")를 오류와 구분하는 Nitter
+    
+    ntscraper는 오류 페이지, 응답 없음, 결과 없음을 모두 빈 결과로 돌려주므로
+    인스턴스가 정상적으로 "결과 없음" 페이지를 보냈는지 no_results에 기록한다.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.no_results = False
+    
+    def _check_error_page(self, soup):
+        if soup.find(class_='timeline-none'):
+            self.no_results = True
+        return super()._check_error_page(soup)
 
 class TwitterCrawler:
     """ntscraper를 사용하여 트위터(X) 데이터 수집"""
     
-    def __init__(self):
+    # 공개 Nitter 인스턴스 목록 (ntscraper가 사용하는 것과 같은 목록)
+    INSTANCE_LIST_URL = 'https://raw.githubusercontent.com/libredirect/instances/main/data.json'
+    
+    def __init__(self, instances: Optional[List[str]] = None, workers: int = 4,
+                 per_instance: int = 2, max_attempts: int = 3,
+                 health: Optional[InstanceHealthStore] = None, max_instances: int = 8):
+        """
+        Args:
+            instances: 사용할 Nitter 인스턴스 URL 리스트 (None이면 인스턴스 상태표에서 선택)
+            workers: collect_many에서 동시에 검색할 최대 키워드 수
+            per_instance: 인스턴스 하나에 동시에 보낼 최대 검색 수
+            max_attempts: 검색이 실패했을 때 시도할 최대 인스턴스 수 (결과 없음은 재시도하지 않음)
+            health: 인스턴스 상태표 (None이면 data/nitter_instances.json)
+            max_instances: 상태표에서 고를 최대 인스턴스 수 (빠른 순)
+        """
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.health = health or InstanceHealthStore()
+        
+        if not instances:
+            instances = self._select_instances(max_instances)
+        
+        # 인스턴스는 이미 골랐으므로 ntscraper의 시작 시 전체 점검은 건너뜀
+        self.scraper = None
+        self.instances = []
+        if not instances:
+            print("⚠️ 사용할 수 있는 Nitter 인스턴스가 없습니다.")
+        else:
+            try:
+                self.scraper = Nitter(instances=instances, log_level=1, skip_instance_check=True)
+                self.instances = list(self.scraper.working_instances)
+            except Exception as e:
+                print(f"⚠️ ntscraper 초기화 실패: {e}")
+        
+        # 인스턴스별 동시 검색 수 제한, 키워드마다 시작 인스턴스를 돌려가며 부하 분산
+        self._slots = {instance: threading.BoundedSemaphore(per_instance) for instance in self.instances}
+        self._lock = threading.Lock()
+        self._next_instance = 0
+    
+    def _select_instances(self, limit: int) -> List[str]:
+        """
+        상태표가 TTL 안이면 그대로, 아니면 공개 인스턴스를 동시에 점검해서 빠른 순으로 선택
+        
+        Args:
+            limit: 최대 인스턴스 수
+        
+        Returns:
+            인스턴스 URL 리스트
+        """
+        if self.health.is_fresh:
+            ranked = self.health.ranked(limit=limit)
+            if ranked:
+                print(f"✅ Nitter 인스턴스 {len(ranked)}개 선택 (상태표 캐시: {self.health.path})")
+                return ranked
+        
+        print("🔍 Nitter 인스턴스 점검 중...")
+        candidates = self._fetch_instance_list() or list(self.health.instances)
+        ranked = self.health.probe(candidates)[:limit]
+        self.health.save()
+        print(f"✅ Nitter 인스턴스 {len(ranked)}개 선택 (정상 {len(self.health.ranked(candidates))}/{len(candidates)}개)")
+        return ranked
+    
+    def _fetch_instance_list(self) -> List[str]:
+        """공개 Nitter 인스턴스 목록 가져오기 (실패하면 빈 리스트)"""
         try:
-            self.scraper = Nitter(log_level=1, skip_instance_check=False)
-        except Exception as e:
-            print(f"⚠️ ntscraper 초기화 실패: {e}")
-            self.scraper = None
+            r = requests.get(self.INSTANCE_LIST_URL, timeout=10)
+            r.raise_for_status()
+            return r.json()['nitter']['clearnet']
+        except (requests.RequestException, ValueError, KeyError) as e:
+            print(f"⚠️ Nitter 인스턴스 목록 가져오기 실패: {e}")
+            return []
     
     def search(self, keyword: str, max_tweets: int = 100) -> List[Dict]:
         """
-        트위터 검색
+        트위터 검색 (인스턴스 오류 시 다음 인스턴스로 넘어감, 검색 결과가 없으면 그대로 반환)
         
         Args:
             keyword: 검색 키워드 (해시태그는 #포함)
@@ -25,18 +113,64 @@ class TwitterCrawler:
         Returns:
             트윗 리스트
         """
-        if not self.scraper:
+        if not self.scraper or not self.instances:
             print("❌ ntscraper가 초기화되지 않았습니다.")
             return []
         
-        try:
-            tweets = self.scraper.get_tweets(keyword, mode='term', number=max_tweets)
-            return tweets.get('tweets', [])
-        except Exception as e:
-            print(f"❌ 트위터 검색 실패: {e}")
-            return []
+        tried = []
+        for _ in range(min(self.max_attempts, len(self.instances))):
+            instance = self._acquire_instance(tried)
+            tried.append(instance)
+            
+            try:
+                # Nitter 객체는 요청 세션/재시도 상태를 가지므로 검색마다 새로 만듦 (인스턴스 점검 없음)
+                scraper = SearchNitter(instances=instance, log_level=1, skip_instance_check=True)
+                # ntscraper는 검색어를 URL에 그대로 붙이므로 '#'이 fragment가 되지 않게 인코딩
+                tweets = scraper.get_tweets(quote(keyword, safe=''), mode='term', number=max_tweets, instance=instance)
+            except Exception as e:
+                print(f"⚠️ 트위터 검색 실패 ({instance}): {e}")
+                self.health.record(instance, False)
+                continue
+            finally:
+                self._slots[instance].release()
+            
+            # 결과가 있거나 인스턴스가 "결과 없음" 페이지를 보냈으면 정상 응답
+            # (검색 시간은 페이지 사이 대기가 섞여 있으므로 응답 시간으로는 기록하지 않음)
+            if tweets.get('tweets') or scraper.no_results:
+                self.health.record(instance, True)
+                return tweets.get('tweets') or []
+            
+            # 오류 페이지/응답 없음도 ntscraper는 빈 결과로 돌려주므로 실패로 기록하고 다음 인스턴스로 재시도
+            self.health.record(instance, False)
+        
+        print(f"❌ 트위터 검색 실패: {keyword} (인스턴스 {len(tried)}개 시도)")
+        return []
+    
+    def _acquire_instance(self, exclude: List[str]) -> str:
+        """
+        여유가 있는 인스턴스 하나를 골라 슬롯 확보 (모두 사용 중이면 첫 후보를 기다림)
+        
+        Args:
+            exclude: 이번 검색에서 이미 시도한 인스턴스
+        
+        Returns:
+            슬롯을 확보한 인스턴스 URL (사용 후 self._slots[instance].release() 필요)
+        """
+        with self._lock:
+            start = self._next_instance
+            self._next_instance += 1
+        
+        ordered = self.instances[start % len(self.instances):] + self.instances[:start % len(self.instances)]
+        candidates = [i for i in ordered if i not in exclude] or ordered
+        
+        for instance in candidates:
+            if self._slots[instance].acquire(blocking=False):
+                return instance
+        
+        self._slots[candidates[0]].acquire()
+        return candidates[0]
     
-    def collect_by_keyword(self, keyword: str, max_results: int = 500) -> List[Dict]:
+    def collect_by_keyword(self, keyword: str, max_results: int = 500) -> List[Tweet]:
         """
         키워드로 트윗 수집
         
@@ -47,56 +181,206 @@ class TwitterCrawler:
         Returns:
             트윗 정보 리스트
         """
+        return list(self.iter_by_keyword(keyword, max_results))
+    
+    def iter_by_keyword(self, keyword: str, max_results: int = 500) -> Iterator[Tweet]:
+        """
+        collect_by_keyword와 같지만, 트윗 정보를 하나씩 내보내는 제너레이터
+        
+        Args:
+            keyword: 검색 키워드
+            max_results: 최대 수집 개수
+        
+        Yields:
+            트윗 정보
+        """
         print(f"\n{'='*60}")
         print(f"🐦 Twitter 수집 시작: '{keyword}'")
         print(f"{'='*60}")
         
-        # 해시태그 형식으로 변환
-        search_term = keyword if keyword.startswith('#') else f"#{keyword}"
+        search_term = self._search_term(keyword)
         
         print(f"🔍 검색어: {search_term}")
         raw_tweets = self.search(search_term, max_results)
         
         if not raw_tweets:
             print("⚠️ 트윗을 찾을 수 없습니다.")
-            return []
+            return
         
-        all_tweets = []
+        # 페이지가 겹쳐 같은 트윗이 두 번 나오면 한 번만 내보냄
+        unique_tweets = []
+        seen_ids = set()
         for tweet in raw_tweets:
-            # 국내/해외 구분 (한글 포함 여부로 판단)
-            text = tweet.get('text', '')
-            region = '국내' if self._contains_korean(text) else '해외'
-            
-            tweet_data = {
-                'platform': 'Twitter(X)',
-                'region': region,
-                'keyword': keyword,
-                'channel_name': tweet.get('user', {}).get('name', ''),
-                'channel_id': tweet.get('user', {}).get('username', ''),
-                'tweet_id': tweet.get('link', '').split('/')[-1] if tweet.get('link') else '',
-                'text': text,
-                'post_url': tweet.get('link', ''),
-                'post_date': self._parse_date(tweet.get('date', '')),
-                'views': tweet.get('stats', {}).get('views', 0),
-                'likes': tweet.get('stats', {}).get('likes', 0),
-                'comments': tweet.get('stats', {}).get('replies', 0),
-                'retweets': tweet.get('stats', {}).get('retweets', 0),
-                'collected_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            all_tweets.append(tweet_data)
-        
-        print(f"✅ Twitter 수집 완료: 총 {len(all_tweets)}개")
-        print(f"   └ 국내: {sum(1 for t in all_tweets if t['region'] == '국내')}개")
-        print(f"   └ 해외: {sum(1 for t in all_tweets if t['region'] == '해외')}개")
-        
-        return all_tweets
+            tweet_id = self._tweet_id(tweet)
+            if tweet_id:
+                if tweet_id in seen_ids:
+                    continue
+                seen_ids.add(tweet_id)
+            unique_tweets.append(tweet)
+        
+        # 국내/해외 구분은 한 번에 (한글 포함 여부로 판단)
+        regions = classify_regions(tweet.get('text', '') for tweet in unique_tweets)
+        
+        collected_at = collected_at_now()
+        
+        counts = {'국내': 0, '해외': 0}
+        for tweet, region in zip(unique_tweets, regions):
+            counts[region] += 1
+            yield self._build_tweet([keyword], tweet, region, collected_at)
+        
+        self.health.save()
+        
+        print(f"✅ Twitter 수집 완료: 총 {counts['국내'] + counts['해외']}개")
+        print(f"   └ 국내: {counts['국내']}개")
+        print(f"   └ 해외: {counts['해외']}개")
+    
+    def collect_many(self, keywords: List[str], max_results: int = 500,
+                     seen: Optional[BloomFilter] = None) -> List[Tweet]:
+        """
+        여러 키워드를 인스턴스 풀에 나눠 동시에 수집
+        
+        여러 키워드에 걸린 같은 트윗은 한 행으로 합치고, 걸린 키워드는 keywords에 모은다.
+        
+        Args:
+            keywords: 검색 키워드 리스트
+            max_results: 키워드당 최대 수집 개수
+            seen: 이전 실행에서 본 tweet_id 블룸 필터 (있으면 건너뛰고 새 ID를 추가)
+        
+        Returns:
+            키워드 순서대로 합쳐진 트윗 정보 리스트
+        """
+        return list(self.iter_many(keywords, max_results, seen))
+    
+    def iter_many(self, keywords: List[str], max_results: int = 500,
+                  seen: Optional[BloomFilter] = None) -> Iterator[Tweet]:
+        """
+        collect_many와 같지만, 트윗 정보를 하나씩 내보내는 제너레이터
+        
+        키워드 검색은 workers개까지 동시에 실행되고, 각 검색은 인스턴스당
+        per_instance개 제한 안에서 여유 있는 인스턴스로 배정된다.
+        모든 검색이 끝나면 tweet_id로 중복을 제거하고 키워드 순서대로 내보낸다.
+        
+        Args:
+            keywords: 검색 키워드 리스트
+            max_results: 키워드당 최대 수집 개수
+            seen: 이전 실행에서 본 tweet_id 블룸 필터 (있으면 건너뛰고 새 ID를 추가)
+        
+        Yields:
+            트윗 정보 ('keyword'는 처음 걸린 키워드, 'keywords'는 걸린 키워드 전체)
+        """
+        print(f"\n{'='*60}")
+        print(f"🐦 Twitter 동시 수집 시작: {len(keywords)}개 키워드, 인스턴스 {len(self.instances)}개")
+        print(f"{'='*60}")
+        
+        started = time.time()
+        results = {}
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(self.search, self._search_term(keyword), max_results): keyword
+                    for keyword in keywords
+                }
+                
+                for future in as_completed(futures):
+                    keyword = futures[future]
+                    results[keyword] = future.result()
+                    print(f"✅ Twitter '{keyword}': {len(results[keyword])}개")
+        finally:
+            # 이번 실행의 검색 결과를 다음 실행의 인스턴스 선택에 반영
+            self.health.save()
+        
+        # 레코드를 만들기 전에 tweet_id로 합쳐, 여러 키워드에 걸린 트윗을 한 번만 변환
+        rows = []
+        matched_by_id: Dict[str, List[str]] = {}
+        skipped_ids = set()
+        total = 0
+        for keyword in dict.fromkeys(keywords):
+            for tweet in results.get(keyword, []):
+                total += 1
+                tweet_id = self._tweet_id(tweet)
+                if tweet_id in skipped_ids:
+                    continue
+                if tweet_id in matched_by_id:
+                    if keyword not in matched_by_id[tweet_id]:
+                        matched_by_id[tweet_id].append(keyword)
+                    continue
+                if tweet_id and seen is not None and tweet_id in seen:
+                    skipped_ids.add(tweet_id)
+                    continue
+                
+                matched = [keyword]
+                if tweet_id:
+                    matched_by_id[tweet_id] = matched
+                rows.append((tweet_id, tweet, matched))
+        
+        # 국내/해외 구분은 한 번에 (한글 포함 여부로 판단)
+        regions = classify_regions(tweet.get('text', '') for _, tweet, _ in rows)
+        
+        collected_at = collected_at_now()
+        
+        counts = {'국내': 0, '해외': 0}
+        for (tweet_id, tweet, matched), region in zip(rows, regions):
+            counts[region] += 1
+            if seen is not None and tweet_id:
+                seen.add(tweet_id)
+            yield self._build_tweet(matched, tweet, region, collected_at)
+        
+        unique = counts['국내'] + counts['해외']
+        print(f"✅ Twitter 수집 완료: 총 {unique}개 ({time.time() - started:.1f}초)")
+        print(f"   └ 국내: {counts['국내']}개")
+        print(f"   └ 해외: {counts['해외']}개")
+        if total > unique:
+            print(f"   └ 중복 제외: {total - unique}개 (이전 실행에서 수집한 트윗 {len(skipped_ids)}개 포함)")
+    
+    @staticmethod
+    def _search_term(keyword: str) -> str:
+        """해시태그 형식으로 변환"""
+        return keyword if keyword.startswith('#') else f"#{keyword}"
+    
+    @staticmethod
+    def _tweet_id(tweet: Dict) -> str:
+        """트윗 링크에서 ID 추출 (없으면 빈 문자열)"""
+        link = tweet.get('link') or ''
+        return link.split('#')[0].rstrip('/').split('/')[-1] if link else ''
+    
+    def _build_tweet(self, keywords: List[str], tweet: Dict, region: Optional[str] = None,
+                     collected_at: Optional[str] = None) -> Tweet:
+        """
+        ntscraper 트윗을 수집 레코드로 변환
+        
+        Args:
+            keywords: 이 트윗이 걸린 키워드
+            tweet: ntscraper 트윗
+            region: 미리 분류한 국내/해외 (None이면 한글 포함 여부로 판단)
+            collected_at: 배치에서 한 번 계산한 수집일시 (None이면 지금)
+        """
+        text = tweet.get('text', '')
+        if region is None:
+            region = Region.DOMESTIC if self._contains_korean(text) else Region.OVERSEAS
+        user = tweet.get('user', {})
+        stats = tweet.get('stats', {})
+        
+        return Tweet(
+            region=region,
+            keyword=keywords[0],
+            keywords=keywords,
+            channel_name=user.get('name', ''),
+            channel_id=user.get('username', ''),
+            tweet_id=self._tweet_id(tweet),
+            text=text,
+            post_url=tweet.get('link', ''),
+            post_date=self._parse_date(tweet.get('date', '')),
+            views=stats.get('views', 0),
+            likes=stats.get('likes', 0),
+            comments=stats.get('replies', 0),
+            retweets=stats.get('retweets', 0),
+            collected_at=collected_at or collected_at_now()
+        )
     
     def _contains_korean(self, text: str) -> bool:
         """텍스트에 한글이 포함되어 있는지 확인"""
-        if not text:
-            return False
-        korean_pattern = re.compile('[ㄱ-ㅎㅏ-ㅣ가-힣]')
-        return bool(korean_pattern.search(text))
+        return contains_korean(text)
     
     def _parse_date(self, date_str: str) -> str:
         """날짜 포맷 정리"""
@@ -114,7 +398,8 @@ class TwitterCrawler:
             return {}
         
         try:
-            profile = self.scraper.get_profile_info(username)
+            # 인스턴스 점검을 건너뛰었으므로 ntscraper가 고르지 못해 직접 지정
+            profile = self.scraper.get_profile_info(username, instance=self.instances[0])
             return profile
         except Exception as e:
             print(f"❌ 프로필 가져오기 실패 ({username}): {e}")
@@ -6,20 +6,128 @@ SNS KPI 모니터링 - 네이버 블로그 + 트위터 샘플
 
 import os
 import sys
+import argparse
+import glob
+import queue
+import random
+import threading
+import time
+import traceback
 from dotenv import load_dotenv
-from crawlers.naver_blog import NaverBlogCrawler
-from crawlers.naver_blog_detail import NaverBlogDetailCrawler
-from crawlers.twitter import TwitterCrawler
-from utils.excel_generator import ExcelGenerator
-import json
 from datetime import datetime
 
+# 크롤러/리포트 모듈은 selenium, ntscraper, pandas 등 무거운 의존성을 불러오므로
+# 파일 맨 위가 아니라 그 단계를 실행하는 함수 안에서 import 한다.
+# (리포트만 다시 만들거나 네이버 API 검색만 할 때 시작이 빨라짐: python -X importtime main.py report)
+
 # 환경변수 로드
 load_dotenv()
 
-def main():
+# ========================================
+# 수집 설정
+# ========================================
+
+# 수집할 키워드 설정 (여기를 수정하세요!)
+KEYWORDS = [
+    "테스트해시태그1",
+    "테스트해시태그2",
+    "테스트해시태그3",
+    "테스트해시태그4"
+]
+
+# 수집 개수 설정
+MAX_NAVER_PER_KEYWORD = 100  # 네이버 블로그: 키워드당 최대 100개
+MAX_TWITTER_PER_KEYWORD = 100  # 트위터: 키워드당 최대 100개
+
+# 상세 크롤링 설정
+DETAIL_WORKERS = 4  # 동시에 띄울 Chrome WebDriver 수
+DETAIL_DELAY = 2.0  # 네이버 블로그 요청 사이 최소 간격 (초, 전체 워커 공통)
+DETAIL_QUEUE_SIZE = 200  # 검색 → 상세 크롤링 사이 대기열 크기 (가득 차면 검색이 기다림)
+TWITTER_WORKERS = 4  # 동시에 검색할 Twitter 키워드 수 (Nitter 인스턴스당 2개까지)
+
+# 상세 크롤링 체크포인트 저널
+CHECKPOINT_PATH = 'data/detail_checkpoint.jsonl'
+
+# 증분 수집에서 이전 실행에 수집한 트윗 ID 블룸 필터
+SEEN_TWEETS_PATH = 'data/seen_tweets.bloom'
+
+def parse_args(argv=None):
+    """명령행 인자 파싱 (하위 명령 없이 실행하면 전체 수집)"""
+    def shared_options(subcommand: bool):
+        """
+        전체 수집과 하위 명령이 같이 쓰는 옵션 묶음
+        
+        하위 명령용은 기본값을 넣지 않아, 명령 앞에 준 옵션(main.py --incremental twitter)을
+        하위 명령의 기본값이 덮어쓰지 않게 함 (기본값은 최상위 파서가 채움)
+        """
+        def default(value):
+            return argparse.SUPPRESS if subcommand else value
+        
+        incremental_options = argparse.ArgumentParser(add_help=False)
+        incremental_options.add_argument('--incremental', action='store_true', default=default(False),
+                                         help='키워드별 워터마크 이후의 새 네이버 블로그 포스트와 이전 실행에서 못 본 트윗만 수집')
+        incremental_options.add_argument('--watermark-file', default=default('data/watermarks.json'),
+                                         help='증분 수집 워터마크 파일 경로 (기본: data/watermarks.json)')
+        
+        detail_options = argparse.ArgumentParser(add_help=False)
+        detail_options.add_argument('--no-cache', action='store_true', default=default(False),
+                                    help='상세 정보 캐시를 사용하지 않고 모든 포스트를 다시 크롤링')
+        detail_options.add_argument('--cache-ttl', type=float, default=default(24.0),
+                                    help='상세 정보 캐시 유효 시간 (시간, 기본: 24)')
+        detail_options.add_argument('--resume', action='store_true', default=default(False),
+                                    help='중단된 상세 크롤링을 체크포인트 저널에서 이어서 진행')
+        detail_options.add_argument('--browser-profile', metavar='DIR', default=default(None),
+                                    help='상세 크롤링 Chrome 프로필 폴더 (지정하면 실행 사이에 디스크 캐시 유지, 예: data/chrome_profile)')
+        
+        report_options = argparse.ArgumentParser(add_help=False)
+        report_options.add_argument('--rolling-report', action='store_true', default=default(False),
+                                    help='실행마다 새 리포트 대신 누적 리포트(output/SNS_KPI_Report_rolling.xlsx)에 이번 실행분만 반영')
+        
+        lock_options = argparse.ArgumentParser(add_help=False)
+        lock_options.add_argument('--lock-file', default=default('data/main.lock'),
+                                  help='실행이 겹치지 않게 막는 lock 파일 (기본: data/main.lock)')
+        return incremental_options, detail_options, report_options, lock_options
+    
+    parser = argparse.ArgumentParser(description='SNS KPI 모니터링 시스템', parents=shared_options(subcommand=False))
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help='시작 확인 없이 바로 실행 (cron 등 비대화형 실행용)')
+    parser.add_argument('--daemon', action='store_true',
+                        help='종료하지 않고 --interval분마다 수집 반복 (브라우저/세션 유지, 확인 없이 실행)')
+    parser.add_argument('--interval', type=float, default=60.0,
+                        help='데몬 모드 수집 간격 (분, 기본: 60)')
+    parser.add_argument('--jitter', type=float, default=60.0,
+                        help='데몬 모드에서 매 사이클 시작을 늦출 최대 무작위 시간 (초, 기본: 60)')
+    
+    # 단계별 실행 (필요한 의존성만 불러옴, 공용 옵션은 하위 명령 앞뒤 어디에 지정해도 됨)
+    incremental_options, detail_options, report_options, lock_options = shared_options(subcommand=True)
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND',
+                                     help='한 단계만 실행 (생략하면 전체 수집)')
+    commands.add_parser('collect-naver', parents=[incremental_options],
+                        help='네이버 블로그 검색만 (API만 사용) → data/naver_search_*.jsonl')
+    detail = commands.add_parser('detail', parents=[detail_options, lock_options],
+                                 help='검색 결과 JSONL의 상세 정보 크롤링 (Chrome) → data/naver_data_*.jsonl')
+    detail.add_argument('input', nargs='?',
+                        help='검색 결과 JSONL (기본: data/의 가장 최근 naver_search_*.jsonl)')
+    commands.add_parser('twitter', parents=[incremental_options],
+                        help='Twitter(X) 수집만 → data/twitter_data_*.jsonl')
+    report = commands.add_parser('report', parents=[report_options],
+                                 help='저장된 JSONL로 Excel 리포트만 다시 생성')
+    report.add_argument('--naver', help='네이버 JSONL (기본: data/의 가장 최근 naver_data_*.jsonl)')
+    report.add_argument('--twitter', help='트위터 JSONL (기본: data/의 가장 최근 twitter_data_*.jsonl)')
+    args = parser.parse_args(argv)
+    
+    # 누적 리포트는 같은 게시물을 다시 반영하면 중복 집계되므로 증분 수집과 함께만 사용
+    if args.command is None and args.rolling_report and not args.incremental:
+        parser.error('--rolling-report는 --incremental과 함께 사용해야 합니다 (다시 수집한 게시물이 중복 집계됨)')
+    return args
+
+def main(args):
     """메인 실행 함수"""
     
+    if args.command:
+        COMMANDS[args.command](args)
+        return
+    
     print("\n")
     print("="*70)
     print("  SNS KPI 모니터링 시스템")
@@ -27,29 +135,48 @@ def main():
     print("="*70)
     print()
     
-    # ========================================
-    # 1. 설정
-    # ========================================
-    
-    # 수집할 키워드 설정 (여기를 수정하세요!)
-    keywords = [
-        "테스트해시태그1",
-        "테스트해시태그2",
-        "테스트해시태그3",
-        "테스트해시태그4"
-    ]
-    
-    # 수집 개수 설정
-    MAX_NAVER_PER_KEYWORD = 100  # 네이버 블로그: 키워드당 최대 100개
-    MAX_TWITTER_PER_KEYWORD = 100  # 트위터: 키워드당 최대 100개
-    
     print("📌 수집 설정")
-    print(f"   키워드: {', '.join(keywords)}")
+    print(f"   키워드: {', '.join(KEYWORDS)}")
     print(f"   네이버 블로그: 키워드당 최대 {MAX_NAVER_PER_KEYWORD}개")
     print(f"   Twitter: 키워드당 최대 {MAX_TWITTER_PER_KEYWORD}개")
+    print(f"   상세 크롤링: 워커 {DETAIL_WORKERS}개, 요청 간격 {DETAIL_DELAY}초")
+    if args.incremental:
+        print(f"   증분 수집: 워터마크 {args.watermark_file}")
     print()
     
-    # API 키 확인
+    check_naver_api_keys()
+    
+    # 검색과 상세 크롤링이 동시에 진행되므로 시작 전에 한 번만 확인
+    if not args.yes and not args.daemon:
+        print("⚠️  주의: 상세 크롤링 단계는 시간이 오래 걸립니다. (확인 없이 실행: --yes)")
+        response = input("계속하시겠습니까? (y/n): ").lower()
+        if response != 'y':
+            print("❌ 사용자가 취소했습니다.")
+            sys.exit(0)
+        print()
+    
+    from crawlers.naver_blog import NaverBlogCrawler
+    from crawlers.naver_blog_detail import NaverBlogDetailCrawler
+    from utils.run_lock import AlreadyRunningError, RunLock
+    
+    naver_crawler = NaverBlogCrawler()
+    # 데몬 모드에서는 워커 브라우저를 사이클 사이에 유지
+    detail_crawler = NaverBlogDetailCrawler(headless=True, keep_alive=args.daemon,
+                                            profile_dir=args.browser_profile)
+    try:
+        if args.daemon:
+            run_daemon(args, naver_crawler, detail_crawler)
+        else:
+            # cron 실행이 이전 실행과 겹치면 건너뜀
+            with RunLock(args.lock_file):
+                run_cycle(args, naver_crawler, detail_crawler)
+    except AlreadyRunningError as e:
+        print(f"⏭️  {e} → 이번 실행은 건너뜁니다.")
+    finally:
+        detail_crawler.close()
+
+def check_naver_api_keys():
+    """네이버 API 키 확인 (없으면 안내 후 종료)"""
     naver_client_id = os.getenv('NAVER_CLIENT_ID')
     naver_client_secret = os.getenv('NAVER_CLIENT_SECRET')
     
@@ -62,65 +189,192 @@ def main():
     
     print("✅ 네이버 API 키 확인 완료")
     print()
+
+def run_daemon(args, naver_crawler: 'NaverBlogCrawler', detail_crawler: 'NaverBlogDetailCrawler'):
+    """
+    interval분마다 수집 사이클을 반복 (Ctrl-C로 종료)
+    
+    프로세스, import, HTTP 세션, 브라우저, Nitter 인스턴스 상태표를 사이클 사이에 유지한다.
+    사이클이 interval보다 오래 걸리면 놓친 회차는 건너뛰고, 다른 프로세스가
+    lock 파일을 잡고 있으면 그 사이클은 건너뛴다.
+    """
+    from utils.run_lock import AlreadyRunningError, RunLock
+    
+    interval = max(args.interval, 0.0) * 60
+    cycle = 0
+    next_run = time.monotonic()
+    
+    print(f"🔁 데몬 모드: {args.interval:g}분 간격 (지터 최대 {args.jitter:g}초, 잠금 {args.lock_file})")
+    
+    while True:
+        cycle += 1
+        started = time.monotonic()
+        print("\n" + "#"*70)
+        print(f"🔁 사이클 {cycle} 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print("#"*70)
+        
+        try:
+            with RunLock(args.lock_file):
+                run_cycle(args, naver_crawler, detail_crawler)
+        except AlreadyRunningError as e:
+            print(f"⏭️  {e} → 이번 사이클은 건너뜁니다.")
+        except Exception as e:
+            # 한 사이클이 실패해도 데몬은 계속
+            print(f"❌ 사이클 {cycle} 실패: {e}")
+            traceback.print_exc()
+        
+        now = time.monotonic()
+        print(f"⏱️  사이클 {cycle} 소요 시간: {now - started:.1f}초")
+        
+        next_run += interval
+        if next_run < now:
+            skipped = int((now - next_run) // interval) + 1 if interval else 0
+            next_run += skipped * interval
+            if skipped:
+                print(f"⚠️  사이클이 간격보다 오래 걸려 {skipped}회를 건너뜁니다.")
+        delay = max(next_run - now, 0.0) + random.uniform(0, max(args.jitter, 0.0))
+        wait_text = f"{delay / 60:.1f}분" if delay >= 60 else f"{delay:.0f}초"
+        print(f"😴 다음 사이클까지 {wait_text} 대기 (Ctrl-C로 종료)")
+        time.sleep(delay)
+
+def run_cycle(args, naver_crawler: 'NaverBlogCrawler', detail_crawler: 'NaverBlogDetailCrawler'):
+    """수집 1회 (네이버 검색 → 상세 크롤링, 트위터, 아카이브, 리포트)"""
+    from crawlers.twitter import TwitterCrawler
+    from utils.bloom_filter import BloomFilter
+    from utils.checkpoint import CheckpointJournal
+    from utils.jsonl_writer import JsonlWriter
+    from utils.stats_cache import StatsCache
+    from utils.watermark import LatestPostTracker, WatermarkStore
+    
+    # 수집 결과는 만들어지는 대로 JSONL 파일에 한 줄씩 기록 (실행 중 tail -f로 확인 가능)
+    os.makedirs('data', exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    naver_jsonl_path = f'data/naver_data_{timestamp}.jsonl'
+    twitter_jsonl_path = f'data/twitter_data_{timestamp}.jsonl'
+    
+    # ========================================
+    # 1. 트위터 수집 (네이버 단계와 동시에 백그라운드로)
+    # ========================================
+    
+    print("🐦 Twitter 수집을 백그라운드에서 시작합니다 (네이버 수집과 동시 진행)")
+    
+    twitter_regions = {'국내': 0, '해외': 0}
+    twitter_writer = JsonlWriter(twitter_jsonl_path)
+    
+    # 증분 수집: 이전 실행에서 수집한 트윗은 건너뜀 (결과 저장 후 필터도 저장)
+    seen_tweets = BloomFilter.load(SEEN_TWEETS_PATH) if args.incremental else None
+    
+    def collect_twitter():
+        try:
+            twitter_crawler = TwitterCrawler(workers=TWITTER_WORKERS)
+            tweets = twitter_crawler.iter_many(KEYWORDS, MAX_TWITTER_PER_KEYWORD, seen=seen_tweets)
+            for tweet in twitter_writer.write_all(tweets):
+                twitter_regions[tweet['region']] = twitter_regions.get(tweet['region'], 0) + 1
+        except Exception as e:
+            print(f"❌ Twitter 수집 실패: {e}")
+        finally:
+            twitter_writer.close()
+    
+    twitter_thread = threading.Thread(target=collect_twitter, name='twitter-collector', daemon=True)
+    twitter_thread.start()
     
     # ========================================
-    # 2. 네이버 블로그 수집
+    # 2. 네이버 블로그 검색 (백그라운드, 페이지가 오는 대로 대기열에 넣음)
     # ========================================
     
     print("\n" + "="*70)
-    print("📝 STEP 1: 네이버 블로그 데이터 수집")
+    print("📝 STEP 1-2: 네이버 블로그 검색 + 상세 정보 크롤링 (동시 진행)")
     print("="*70)
     
-    naver_crawler = NaverBlogCrawler()
-    all_naver_data = []
-    
-    for keyword in keywords:
+    # 증분 수집: 키워드별로 이전 실행에서 본 가장 최근 포스트까지만 수집
+    watermark_store = WatermarkStore(args.watermark_file) if args.incremental else None
+    watermarks = {k: watermark_store.get(k) for k in KEYWORDS} if watermark_store else None
+    # 검색이 빠짐없이 끝난 키워드 (이 키워드들만 워터마크 갱신)
+    completed_keywords = set()
+    
+    # 검색 결과를 상세 크롤링으로 넘기는 대기열. 상세 크롤링이 밀리면 검색이 기다림 (backpressure)
+    post_queue = queue.Queue(maxsize=DETAIL_QUEUE_SIZE)
+    # 상세 크롤링이 먼저 끝나면(오류, 중단) 검색도 멈춤
+    search_stop = threading.Event()
+    
+    def put_post(item) -> bool:
+        # 대기열이 가득 차 있으면 기다리되, 상세 크롤링이 끝났으면 포기
+        while not search_stop.is_set():
+            try:
+                post_queue.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def search_naver():
         try:
-            posts = naver_crawler.collect_by_keyword(keyword, MAX_NAVER_PER_KEYWORD)
-            all_naver_data.extend(posts)
+            # 모든 키워드 × 페이지를 동시에 요청 (API 호출 제한 내에서)
+            for post in naver_crawler.iter_many(KEYWORDS, MAX_NAVER_PER_KEYWORD, watermarks=watermarks,
+                                                completed=completed_keywords):
+                if not put_post(post):
+                    break
         except Exception as e:
-            print(f"❌ 네이버 블로그 수집 실패 ({keyword}): {e}")
+            print(f"❌ 네이버 블로그 검색 실패: {e}")
+        finally:
+            put_post(None)
     
-    print(f"\n📊 네이버 블로그 1단계 완료: 총 {len(all_naver_data)}개 URL 수집")
+    naver_thread = threading.Thread(target=search_naver, name='naver-search', daemon=True)
+    naver_thread.start()
     
     # ========================================
-    # 3. 네이버 블로그 상세 정보 수집
+    # 3. 네이버 블로그 상세 정보 수집 (대기열에서 받는 대로)
     # ========================================
     
-    if all_naver_data:
-        print("\n" + "="*70)
-        print("🔍 STEP 2: 네이버 블로그 상세 정보 크롤링")
-        print("="*70)
-        print("⚠️  주의: 이 단계는 시간이 오래 걸립니다.")
-        print(f"   예상 소요 시간: 약 {len(all_naver_data) * 4 / 60:.0f}분")
-        print()
-        
-        # 사용자 확인
-        response = input("계속하시겠습니까? (y/n): ").lower()
-        if response != 'y':
-            print("❌ 사용자가 취소했습니다.")
-            sys.exit(0)
-        
-        detail_crawler = NaverBlogDetailCrawler(headless=True)
-        all_naver_data = detail_crawler.batch_extract(all_naver_data, delay=2.0)
+    # 워터마크 갱신용으로 키워드별 가장 최근 포스트만 기록 (전체 포스트는 JSONL에만)
+    latest_posts = LatestPostTracker()
+    naver_detail_success = 0
+    
+    # 최근에 수집한 포스트는 캐시에서 채우고 나머지만 크롤링
+    stats_cache = None if args.no_cache else StatsCache('data/stats_cache.sqlite', ttl_hours=args.cache_ttl)
+    
+    # 진행 상황을 10개마다 저널에 기록 (--resume으로 이어서 진행)
+    checkpoint = CheckpointJournal(CHECKPOINT_PATH, flush_every=10, resume=args.resume)
+    
+    try:
+        with JsonlWriter(naver_jsonl_path) as naver_writer:
+            posts = detail_crawler.iter_extract(
+                post_queue, delay=DETAIL_DELAY, workers=DETAIL_WORKERS,
+                cache=stats_cache, journal=checkpoint
+            )
+            for post in naver_writer.write_all(posts):
+                latest_posts.add(post)
+                if post.get('detail_crawled'):
+                    naver_detail_success += 1
+        naver_count = naver_writer.count
+    except Exception:
+        # 실패해도 백그라운드 수집 스레드가 끝난 뒤에 반환 (데몬이 lock을 풀고 다음 사이클을
+        # 시작하면 이전 사이클의 트위터 수집이 아직 JSONL을 쓰고 있을 수 있음)
+        search_stop.set()
+        print("⏳ 백그라운드 수집이 끝나기를 기다린 뒤 사이클을 종료합니다...")
+        naver_thread.join()
+        twitter_thread.join()
+        print(f"⚠️  아카이브/리포트에 반영되지 않은 트위터 데이터: {twitter_jsonl_path}")
+        raise
+    finally:
+        search_stop.set()
+        checkpoint.close()
+        if stats_cache:
+            stats_cache.close()
+    naver_thread.join()
     
     # ========================================
-    # 4. 트위터 수집
+    # 4. 트위터 수집 완료 대기
     # ========================================
     
     print("\n" + "="*70)
     print("🐦 STEP 3: Twitter 데이터 수집")
     print("="*70)
     
-    twitter_crawler = TwitterCrawler()
-    all_twitter_data = []
-    
-    for keyword in keywords:
-        try:
-            tweets = twitter_crawler.collect_by_keyword(keyword, MAX_TWITTER_PER_KEYWORD)
-            all_twitter_data.extend(tweets)
-        except Exception as e:
-            print(f"❌ Twitter 수집 실패 ({keyword}): {e}")
+    if twitter_thread.is_alive():
+        print("⏳ 백그라운드 Twitter 수집이 끝나기를 기다리는 중...")
+    twitter_thread.join()
+    twitter_count = twitter_writer.count
     
     # ========================================
     # 5. 결과 요약
@@ -129,33 +383,34 @@ def main():
     print("\n" + "="*70)
     print("📊 수집 결과 요약")
     print("="*70)
-    print(f"네이버 블로그: {len(all_naver_data)}개")
-    print(f"   └ 상세 크롤링 성공: {sum(1 for d in all_naver_data if d.get('detail_crawled'))}개")
-    print(f"Twitter: {len(all_twitter_data)}개")
-    print(f"   └ 국내: {sum(1 for d in all_twitter_data if d.get('region') == '국내')}개")
-    print(f"   └ 해외: {sum(1 for d in all_twitter_data if d.get('region') == '해외')}개")
-    print(f"총 게시물: {len(all_naver_data) + len(all_twitter_data)}개")
+    print(f"네이버 블로그: {naver_count}개")
+    print(f"   └ 상세 크롤링 성공: {naver_detail_success}개")
+    print(f"Twitter: {twitter_count}개")
+    print(f"   └ 국내: {twitter_regions['국내']}개")
+    print(f"   └ 해외: {twitter_regions['해외']}개")
+    print(f"총 게시물: {naver_count + twitter_count}개")
     print()
     
     # ========================================
-    # 6. JSON 백업 저장
+    # 6. JSONL 백업
     # ========================================
     
-    print("💾 JSON 백업 저장 중...")
-    os.makedirs('data', exist_ok=True)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    print(f"✅ 네이버 데이터 저장: {naver_jsonl_path}")
+    print(f"✅ 트위터 데이터 저장: {twitter_jsonl_path}")
+    
+    archive_jsonl(naver_jsonl_path, 'naver')
+    archive_jsonl(twitter_jsonl_path, 'twitter')
     
-    # 네이버 데이터 저장
-    naver_json_path = f'data/naver_data_{timestamp}.json'
-    with open(naver_json_path, 'w', encoding='utf-8') as f:
-        json.dump(all_naver_data, f, ensure_ascii=False, indent=2)
-    print(f"✅ 네이버 데이터 저장: {naver_json_path}")
+    # 결과가 저장되었으므로 체크포인트는 더 이상 필요 없음
+    checkpoint.clear()
     
-    # 트위터 데이터 저장
-    twitter_json_path = f'data/twitter_data_{timestamp}.json'
-    with open(twitter_json_path, 'w', encoding='utf-8') as f:
-        json.dump(all_twitter_data, f, ensure_ascii=False, indent=2)
-    print(f"✅ 트위터 데이터 저장: {twitter_json_path}")
+    # 결과가 저장된 뒤에 워터마크 갱신 (중간에 실패하면 다음 실행에서 다시 수집)
+    if watermark_store:
+        update_watermarks(watermark_store, latest_posts, completed_keywords)
+    
+    if seen_tweets is not None:
+        seen_tweets.save(SEEN_TWEETS_PATH)
+        print(f"✅ 수집한 트윗 ID 기록: {SEEN_TWEETS_PATH} ({len(seen_tweets):,}개)")
     
     # ========================================
     # 7. Excel 리포트 생성
@@ -165,12 +420,7 @@ def main():
     print("📊 STEP 4: Excel 리포트 생성")
     print("="*70)
     
-    excel_generator = ExcelGenerator(output_dir='output')
-    report_path = excel_generator.generate_report(
-        all_naver_data, 
-        all_twitter_data, 
-        keywords
-    )
+    report_path = write_report(naver_jsonl_path, twitter_jsonl_path, args.rolling_report)
     
     # ========================================
     # 8. 완료
@@ -180,15 +430,15 @@ def main():
     print("✅ 모든 작업 완료!")
     print("="*70)
     print(f"📁 Excel 파일: {report_path}")
-    print(f"📁 JSON 백업: data/ 폴더")
+    print(f"📁 JSONL 백업: data/ 폴더")
     print("="*70)
     print()
     
     # 통계 출력
     print("📈 최종 통계:")
-    print(f"   총 수집 게시물: {len(all_naver_data) + len(all_twitter_data)}개")
-    print(f"   네이버 블로그: {len(all_naver_data)}개")
-    print(f"   Twitter: {len(all_twitter_data)}개")
+    print(f"   총 수집 게시물: {naver_count + twitter_count}개")
+    print(f"   네이버 블로그: {naver_count}개")
+    print(f"   Twitter: {twitter_count}개")
     print()
     
     print("💡 다음 단계:")
@@ -197,14 +447,172 @@ def main():
     print("   3. 필요시 키워드 조정 후 재실행")
     print()
 
+def archive_jsonl(path: str, platform: str):
+    """JSONL 결과를 기간별 조회용 Parquet 아카이브(플랫폼/수집일 파티션)에 누적"""
+    from utils.jsonl_writer import read_jsonl
+    from utils.parquet_archive import ParquetArchive
+    
+    archive = ParquetArchive('data/archive')
+    archive.append(read_jsonl(path), platform)
+    print(f"✅ Parquet 아카이브 추가: {archive.root}/{platform}")
+
+def write_report(naver_jsonl_path: str, twitter_jsonl_path: str, rolling: bool = False) -> str:
+    """JSONL 결과로 Excel 리포트 생성 (rolling이면 누적 리포트에 반영)"""
+    from utils.excel_generator import ExcelGenerator
+    from utils.jsonl_writer import read_jsonl
+    
+    # 리포트에 필요한 시점에만 JSONL에서 읽어 옴
+    excel_generator = ExcelGenerator(output_dir='output')
+    report = excel_generator.update_report if rolling else excel_generator.generate_report
+    return report(
+        list(read_jsonl(naver_jsonl_path)) if naver_jsonl_path else [],
+        list(read_jsonl(twitter_jsonl_path)) if twitter_jsonl_path else [],
+        KEYWORDS
+    )
+
+def update_watermarks(watermark_store: 'WatermarkStore', latest_posts: 'LatestPostTracker', completed: set):
+    """빠짐없이 수집한 키워드만 워터마크 갱신 (일부만 수집한 키워드는 다음 실행에서 다시 수집)"""
+    for keyword in KEYWORDS:
+        if keyword in completed:
+            watermark_store.update(keyword, latest_posts.posts(keyword))
+        else:
+            print(f"⚠️ '{keyword}': 일부만 수집되어 워터마크를 유지합니다")
+    watermark_store.save()
+    print(f"✅ 워터마크 갱신: {watermark_store.path}")
+
+def latest_jsonl(prefix: str) -> str:
+    """data/에서 가장 최근 {prefix}_*.jsonl 경로 (없으면 빈 문자열)"""
+    # 파일명의 타임스탬프(YYYYmmdd_HHMMSS)가 시간순으로 정렬됨
+    paths = sorted(glob.glob(os.path.join('data', f'{prefix}_*.jsonl')))
+    return paths[-1] if paths else ''
+
+# ========================================
+# 단계별 실행 (python main.py COMMAND)
+# ========================================
+
+def run_collect_naver(args):
+    """네이버 블로그 검색만 실행 (API만 사용, 브라우저 없음)"""
+    from crawlers.naver_blog import NaverBlogCrawler
+    from utils.jsonl_writer import JsonlWriter
+    from utils.watermark import LatestPostTracker, WatermarkStore
+    
+    check_naver_api_keys()
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_path = f'data/naver_search_{timestamp}.jsonl'
+    
+    watermark_store = WatermarkStore(args.watermark_file) if args.incremental else None
+    watermarks = {k: watermark_store.get(k) for k in KEYWORDS} if watermark_store else None
+    
+    latest_posts = LatestPostTracker()
+    completed_keywords = set()
+    with JsonlWriter(output_path) as writer:
+        posts = NaverBlogCrawler().iter_many(KEYWORDS, MAX_NAVER_PER_KEYWORD, watermarks=watermarks,
+                                             completed=completed_keywords)
+        for post in writer.write_all(posts):
+            latest_posts.add(post)
+    print(f"✅ 네이버 검색 결과 저장: {output_path} ({writer.count}개)")
+    
+    if watermark_store:
+        update_watermarks(watermark_store, latest_posts, completed_keywords)
+    
+    print(f"💡 다음 단계: python3 main.py detail {output_path}")
+
+def run_detail(args):
+    """검색 결과 JSONL의 포스트 상세 정보 크롤링"""
+    input_path = args.input or latest_jsonl('naver_search')
+    if not input_path or not os.path.exists(input_path):
+        print("❌ 검색 결과 JSONL이 없습니다. 먼저 python3 main.py collect-naver 를 실행하세요.")
+        sys.exit(1)
+    
+    from crawlers.naver_blog_detail import NaverBlogDetailCrawler
+    from utils.checkpoint import CheckpointJournal
+    from utils.jsonl_writer import JsonlWriter, read_jsonl
+    from utils.run_lock import AlreadyRunningError, RunLock
+    from utils.stats_cache import StatsCache
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_path = f'data/naver_data_{timestamp}.jsonl'
+    print(f"📖 입력: {input_path}")
+    
+    try:
+        # 전체 수집과 같은 체크포인트 저널을 쓰므로 동시에 실행되지 않게 잠금
+        with RunLock(args.lock_file):
+            stats_cache = None if args.no_cache else StatsCache('data/stats_cache.sqlite', ttl_hours=args.cache_ttl)
+            checkpoint = CheckpointJournal(CHECKPOINT_PATH, flush_every=10, resume=args.resume)
+            detail_crawler = NaverBlogDetailCrawler(headless=True, profile_dir=args.browser_profile)
+            try:
+                with JsonlWriter(output_path) as writer:
+                    posts = detail_crawler.iter_extract(
+                        read_jsonl(input_path), delay=DETAIL_DELAY, workers=DETAIL_WORKERS,
+                        cache=stats_cache, journal=checkpoint
+                    )
+                    for _ in writer.write_all(posts):
+                        pass
+            finally:
+                detail_crawler.close()
+                checkpoint.close()
+                if stats_cache:
+                    stats_cache.close()
+            
+            print(f"✅ 네이버 데이터 저장: {output_path} ({writer.count}개)")
+            archive_jsonl(output_path, 'naver')
+            checkpoint.clear()
+    except AlreadyRunningError as e:
+        print(f"⏭️  {e} → 이번 실행은 건너뜁니다.")
+
+def run_twitter(args):
+    """Twitter(X) 수집만 실행"""
+    from crawlers.twitter import TwitterCrawler
+    from utils.bloom_filter import BloomFilter
+    from utils.jsonl_writer import JsonlWriter
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_path = f'data/twitter_data_{timestamp}.jsonl'
+    
+    seen_tweets = BloomFilter.load(SEEN_TWEETS_PATH) if args.incremental else None
+    
+    with JsonlWriter(output_path) as writer:
+        tweets = TwitterCrawler(workers=TWITTER_WORKERS).iter_many(KEYWORDS, MAX_TWITTER_PER_KEYWORD, seen=seen_tweets)
+        for _ in writer.write_all(tweets):
+            pass
+    print(f"✅ 트위터 데이터 저장: {output_path} ({writer.count}개)")
+    archive_jsonl(output_path, 'twitter')
+    
+    if seen_tweets is not None:
+        seen_tweets.save(SEEN_TWEETS_PATH)
+        print(f"✅ 수집한 트윗 ID 기록: {SEEN_TWEETS_PATH} ({len(seen_tweets):,}개)")
+
+def run_report(args):
+    """저장된 JSONL로 Excel 리포트만 다시 생성 (pandas/xlsxwriter만 사용)"""
+    naver_path = args.naver or latest_jsonl('naver_data')
+    twitter_path = args.twitter or latest_jsonl('twitter_data')
+    if not naver_path and not twitter_path:
+        print("❌ data/ 폴더에 리포트를 만들 JSONL이 없습니다.")
+        sys.exit(1)
+    
+    print(f"📖 네이버: {naver_path or '(없음)'}")
+    print(f"📖 트위터: {twitter_path or '(없음)'}")
+    if args.rolling_report:
+        print("⚠️  누적 리포트에는 반영한 적 없는 --incremental 수집 결과만 넣으세요. "
+              "같은 게시물(같은 파일)을 다시 반영하면 중복 집계됩니다.")
+    report_path = write_report(naver_path, twitter_path, args.rolling_report)
+    print(f"📁 Excel 파일: {report_path}")
+
+COMMANDS = {
+    'collect-naver': run_collect_naver,
+    'detail': run_detail,
+    'twitter': run_twitter,
+    'report': run_report,
+}
+
 if __name__ == "__main__":
     try:
-        main()
+        main(parse_args())
     except KeyboardInterrupt:
         print("\n\n❌ 사용자가 프로그램을 중단했습니다.")
         sys.exit(0)
     except Exception as e:
         print(f"\n\n❌ 오류 발생: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+# 저장소 루트(crawlers/, utils/ 패키지)를 import 경로에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def nitter_stub():
+    """로컬 Nitter 스텁 서버를 띄우는 팩토리 (테스트가 끝나면 모두 종료)"""
+    from nitter_stub import StubNitter
+
+    stubs = []
+
+    def start(mode='ok', tweets=5, delay=0.0):
+        stub = StubNitter(mode=mode, tweets=tweets, delay=delay).start()
+        stubs.append(stub)
+        return stub
+
+    yield start
+    for stub in stubs:
+        stub.stop()
+
+
+@pytest.fixture
+def no_scraper_sleep(monkeypatch):
+    """ntscraper의 요청 사이 대기(2초 등)를 없앰"""
+    import ntscraper.nitter
+
+    monkeypatch.setattr(ntscraper.nitter, 'sleep', lambda seconds: None)
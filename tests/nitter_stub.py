@@ -0,0 +1,166 @@
+"""
+로컬 Nitter 스텁 서버 (오프라인 테스트/벤치마크용)
+
+Nitter 검색/프로필 페이지와 같은 HTML을 돌려주는 HTTP 서버를 127.0.0.1에 띄운다.
+인스턴스마다 동작(mode)과 응답 지연을 정할 수 있고, 동시에 처리 중인 검색 요청 수를 기록한다.
+
+    mode='ok'     검색어마다 트윗 tweets개
+    mode='empty'  "No items found" 페이지 (정상 응답, 결과 없음)
+    mode='error'  Nitter 오류 패널 (rate limit 등)
+    mode='down'   연결 거부 (포트만 잡았다가 닫음)
+
+벤치마크:
+    python tests/nitter_stub.py --instances 4 --delay 0.5
+    → 출력된 URL을 TwitterCrawler(instances=[...])에 넘겨 실행
+"""
+
+import argparse
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+PROFILE_PAGE = """<html><body>
+<div class="profile-card"><a class="profile-card-avatar" href="/pic/avatar.jpg"><img src="/pic/avatar.jpg"></a></div>
+<div class="timeline">{tweets}</div>
+</body></html>"""
+
+SEARCH_PAGE = """<html><body><div class="timeline">{tweets}</div></body></html>"""
+
+EMPTY_PAGE = """<html><body><div class="timeline">
+<div class="timeline-header"><h2 class="timeline-none">No items found</h2></div>
+</div></body></html>"""
+
+ERROR_PAGE = """<html><body>
+<div class="error-panel"><span>Instance has been rate limited.</span></div>
+</body></html>"""
+
+TWEET_ITEM = """<div class="timeline-item">
+<div class="tweet-body">
+<div class="tweet-header">
+<a class="tweet-avatar" href="/user{n}"><img class="avatar round" src="/pic/profile_images/{n}/avatar.jpg"></a>
+<a class="fullname" href="/user{n}">User {n}</a><a class="username" href="/user{n}">@user{n}</a>
+<span class="tweet-date"><a href="/user{n}/status/{tweet_id}#m" title="Jan 2, 2024 · 10:00 AM UTC">1h</a></span>
+</div>
+<div class="tweet-content media-body">{text}</div>
+<div class="tweet-stats">
+<span class="tweet-stat"><div class="icon-container">1</div></span>
+<span class="tweet-stat"><div class="icon-container">2</div></span>
+<span class="tweet-stat"><div class="icon-container">0</div></span>
+<span class="tweet-stat"><div class="icon-container">{likes}</div></span>
+</div>
+</div>
+</div>"""
+
+
+def tweet_id(query: str, n: int) -> str:
+    """검색어와 순번으로 정해지는 트윗 ID (같은 검색어면 인스턴스가 달라도 같은 ID)"""
+    return str(zlib.crc32(query.encode('utf-8')) * 1000 + n)
+
+
+class StubNitter:
+    """Nitter 인스턴스 하나를 흉내 내는 로컬 HTTP 서버"""
+
+    def __init__(self, mode: str = 'ok', tweets: int = 5, delay: float = 0.0):
+        """
+        Args:
+            mode: 'ok', 'empty', 'error', 'down'
+            tweets: mode='ok'일 때 검색어마다 돌려줄 트윗 수
+            delay: 검색 요청마다 응답 전에 기다릴 시간 (초)
+        """
+        self.mode = mode
+        self.tweets = tweets
+        self.delay = delay
+        self.queries: List[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self._thread = None
+
+    def start(self) -> 'StubNitter':
+        if self.mode == 'down':
+            # 포트를 닫아 연결이 거부되게 함
+            self.server.server_close()
+            return self
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread:
+            self.server.shutdown()
+            self.server.server_close()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _render_tweets(self, query: str, count: int) -> str:
+        return ''.join(
+            TWEET_ITEM.format(n=n, tweet_id=tweet_id(query, n), text=f'{query} 트윗 {n}', likes=n)
+            for n in range(count)
+        )
+
+    def _search(self, query: str) -> str:
+        with self._lock:
+            self.queries.append(query)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.mode == 'empty':
+                return EMPTY_PAGE
+            if self.mode == 'error':
+                return ERROR_PAGE
+            return SEARCH_PAGE.format(tweets=self._render_tweets(query, self.tweets))
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == '/search':
+                    body = stub._search(parse_qs(url.query).get('q', [''])[0])
+                else:
+                    body = PROFILE_PAGE.format(tweets=stub._render_tweets('profile', 1))
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='로컬 Nitter 스텁 서버')
+    parser.add_argument('--instances', type=int, default=4, help='띄울 인스턴스 수')
+    parser.add_argument('--tweets', type=int, default=20, help='검색어마다 돌려줄 트윗 수')
+    parser.add_argument('--delay', type=float, default=0.5, help='검색 응답 지연 (초)')
+    args = parser.parse_args()
+
+    stubs = [StubNitter(tweets=args.tweets, delay=args.delay).start() for _ in range(args.instances)]
+    print('Nitter 스텁 인스턴스:', ' '.join(stub.url for stub in stubs))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        for stub in stubs:
+            stub.stop()
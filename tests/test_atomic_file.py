@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from utils.atomic_file import atomic_write, save_json
+
+
+def test_save_json_creates_directory(tmp_path):
+    path = tmp_path / 'data' / 'state.json'
+
+    save_json(str(path), {'키워드': ['테스트1']})
+
+    assert json.loads(path.read_text(encoding='utf-8')) == {'키워드': ['테스트1']}
+    assert '테스트1' in path.read_text(encoding='utf-8')
+    assert not (tmp_path / 'data' / 'state.json.tmp').exists()
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    path = tmp_path / 'seen.bin'
+    with atomic_write(str(path), 'wb') as f:
+        f.write(b'old')
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path), 'wb') as f:
+            f.write(b'new')
+            raise RuntimeError('interrupted')
+
+    assert path.read_bytes() == b'old'
+    assert not (tmp_path / 'seen.bin.tmp').exists()
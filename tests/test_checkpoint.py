@@ -0,0 +1,51 @@
+import pytest
+
+from utils.checkpoint import CheckpointJournal
+
+STATS = {'views': 10, 'comments': 1, 'likes': 2}
+
+
+@pytest.mark.parametrize('tail', [
+    '{"key": "tester/3", "vie',  # 기록 도중 중단
+    '',
+])
+def test_resume_after_truncated_tail(tmp_path, tail):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = CheckpointJournal(path, flush_every=1)
+    journal.record('tester/1', STATS)
+    journal.record('tester/2', STATS)
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(tail)
+
+    journal = CheckpointJournal(path, flush_every=1, resume=True)
+    assert set(journal.completed) == {'tester/1', 'tester/2'}
+    journal.record('tester/4', STATS)
+    journal.close()
+
+    # 이어 쓴 첫 기록이 잘린 조각에 붙지 않고 다음 재개에서 읽힘
+    journal = CheckpointJournal(path, resume=True)
+    assert set(journal.completed) == {'tester/1', 'tester/2', 'tester/4'}
+    journal.close()
+
+
+def test_resume_keeps_last_entry_missing_newline(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    path.write_text('{"key": "tester/1", "views": 1}\n{"key": "tester/2", "views": 2}', encoding='utf-8')
+
+    journal = CheckpointJournal(str(path), flush_every=1, resume=True)
+    journal.record('tester/3', STATS)
+    journal.close()
+
+    journal = CheckpointJournal(str(path), resume=True)
+    assert set(journal.completed) == {'tester/1', 'tester/2', 'tester/3'}
+    journal.close()
+
+
+def test_without_resume_starts_over(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = CheckpointJournal(path)
+    journal.record('tester/1', STATS)
+    journal.close()
+
+    assert CheckpointJournal(path).completed == {}
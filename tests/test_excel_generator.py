@@ -0,0 +1,49 @@
+import os
+
+import pandas as pd
+import pytest
+
+from utils.excel_generator import ExcelGenerator, StreamingExcelWriter
+
+KEYWORDS = ['테스트1', '테스트2']
+
+
+@pytest.fixture
+def generator(tmp_path):
+    return ExcelGenerator(output_dir=str(tmp_path / 'output'))
+
+
+def test_generate_report_with_no_data(generator):
+    filepath = generator.generate_report([], [], KEYWORDS)
+
+    assert os.path.exists(filepath)
+    assert pd.read_excel(filepath, sheet_name='통합 데이터').empty
+
+
+def test_update_report_with_no_data(generator, tmp_path):
+    state_path = str(tmp_path / 'report_state.json')
+
+    # 새로 만들기와 이어 쓰기 모두 빈 실행분을 처리해야 함
+    first = generator.update_report([], [], KEYWORDS, state_path=state_path)
+    second = generator.update_report([], [], KEYWORDS, state_path=state_path)
+
+    assert first == second
+    assert os.path.exists(state_path)
+    assert pd.read_excel(second, sheet_name='통합 데이터').empty
+
+
+def test_streaming_writer_writes_frame_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(StreamingExcelWriter, 'CHUNK_ROWS', 3)
+    frame = pd.DataFrame({
+        '조회수': [1, None, 3, 4, None, 6, 7],
+        '제목': ['a', 'b', None, 'd', 'e', 'f', 'g'],
+    })
+    path = str(tmp_path / 'stream.xlsx')
+
+    with StreamingExcelWriter(path) as writer:
+        writer.write_frame(frame, '시트')
+
+    saved = pd.read_excel(path, sheet_name='시트')
+    assert len(saved) == len(frame)
+    assert saved['조회수'].isna().tolist() == frame['조회수'].isna().tolist()
+    assert saved['제목'].fillna('').tolist() == frame['제목'].fillna('').tolist()
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 헤비 의존성은 해당 단계에서만 불러와야 함 (report --help는 어느 단계도 실행하지 않음)
+HEAVY_MODULES = {'selenium', 'ntscraper', 'pyarrow'}
+# report --help 전체 import 시간 상한 (µs). 지금은 0.1초 안팎이고,
+# selenium/ntscraper/pyarrow/pandas를 모두 불러오면 0.7초 이상 걸림
+IMPORT_BUDGET_US = 500_000
+
+
+def importtime(*args):
+    """python -X importtime main.py ... 결과를 [(모듈, 누적 시간 µs, 최상위 여부), ...]로"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', os.path.join(ROOT, 'main.py'), *args],
+        cwd=ROOT, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules.append((name.strip(), int(cumulative), not name[1:].startswith(' ')))
+    return modules
+
+
+def test_report_help_skips_heavy_imports():
+    modules = importtime('report', '--help')
+    imported = {name.split('.')[0] for name, _, _ in modules}
+
+    assert not imported & HEAVY_MODULES
+    assert sum(cumulative for _, cumulative, top_level in modules if top_level) < IMPORT_BUDGET_US
@@ -0,0 +1,34 @@
+import pytest
+
+from main import parse_args
+
+
+@pytest.mark.parametrize('argv, option, value', [
+    (['--incremental', 'twitter'], 'incremental', True),
+    (['twitter', '--incremental'], 'incremental', True),
+    (['--watermark-file', 'w.json', 'collect-naver'], 'watermark_file', 'w.json'),
+    (['--no-cache', 'detail'], 'no_cache', True),
+    (['--cache-ttl', '3', 'detail'], 'cache_ttl', 3.0),
+    (['--rolling-report', 'report'], 'rolling_report', True),
+    (['report', '--rolling-report'], 'rolling_report', True),
+])
+def test_shared_options_before_or_after_command(argv, option, value):
+    assert getattr(parse_args(argv), option) == value
+
+
+@pytest.mark.parametrize('argv', [['twitter'], ['detail'], ['report']])
+def test_command_without_options_uses_defaults(argv):
+    args = parse_args(argv)
+
+    assert args.incremental is False
+    assert args.no_cache is False
+    assert args.cache_ttl == 24.0
+    assert args.rolling_report is False
+    assert args.watermark_file == 'data/watermarks.json'
+    assert args.lock_file == 'data/main.lock'
+
+
+def test_rolling_report_requires_incremental_for_full_run():
+    with pytest.raises(SystemExit):
+        parse_args(['--rolling-report'])
+    assert parse_args(['--incremental', '--rolling-report']).rolling_report is True
@@ -0,0 +1,83 @@
+import pytest
+
+from crawlers.naver_blog import NaverBlogCrawler
+
+# 최신순 300개: 1~100번째는 2024-01-10, 101~300번째는 2024-01-05
+TOTAL = 300
+
+
+def make_item(keyword, n):
+    return {
+        'title': f'<b>{keyword}</b> 포스트 {n}',
+        'description': '',
+        'bloggername': '테스터',
+        'bloggerlink': 'blog.naver.com/tester',
+        'link': f'https://blog.naver.com/tester/{n}',
+        'postdate': '20240110' if n <= 100 else '20240105',
+    }
+
+
+@pytest.fixture
+def crawler(monkeypatch):
+    monkeypatch.setenv('NAVER_CLIENT_ID', 'test-id')
+    monkeypatch.setenv('NAVER_CLIENT_SECRET', 'test-secret')
+    return NaverBlogCrawler(workers=4)
+
+
+def stub_search(crawler, monkeypatch, failing_pages=()):
+    """검색 API 대신 고정 결과를 돌려줌 (failing_pages의 시작 위치는 재시도 후 실패한 것처럼 None)"""
+    def search(keyword, display=100, start=1):
+        if start in failing_pages:
+            return None
+        end = min(start + display - 1, TOTAL)
+        return {'total': TOTAL, 'items': [make_item(keyword, n) for n in range(start, end + 1)]}
+
+    monkeypatch.setattr(crawler, 'search', search)
+
+
+# 101~300번째(2024-01-05) 중 맨 마지막 포스트까지 이전 실행에서 수집한 상태
+OLD_WATERMARK = {'post_date': '2024-01-05', 'post_urls': [f'https://blog.naver.com/tester/{TOTAL}']}
+
+
+@pytest.mark.parametrize('watermark', [None, OLD_WATERMARK])
+def test_keyword_with_failed_page_is_not_completed(crawler, monkeypatch, watermark):
+    stub_search(crawler, monkeypatch, failing_pages={101})
+    completed = set()
+
+    posts = crawler.collect_many(['테스트1'], watermarks={'테스트1': watermark}, completed=completed)
+
+    assert len(posts) == 100
+    assert completed == set()
+
+
+@pytest.mark.parametrize('watermark', [None, OLD_WATERMARK])
+def test_keyword_collected_to_watermark_or_end_is_completed(crawler, monkeypatch, watermark):
+    stub_search(crawler, monkeypatch)
+    completed = set()
+
+    posts = crawler.collect_many(['테스트1'], watermarks={'테스트1': watermark}, completed=completed)
+
+    assert len(posts) == TOTAL - (1 if watermark else 0)
+    assert completed == {'테스트1'}
+
+
+def test_max_results_before_watermark_is_not_completed(crawler, monkeypatch):
+    stub_search(crawler, monkeypatch)
+    completed = set()
+
+    # 처음 수집이면 max_results까지가 범위지만, 워터마크가 있으면 그 사이 포스트를 놓친 것
+    crawler.collect_many(['처음', '증분'], max_results=200,
+                         watermarks={'증분': OLD_WATERMARK}, completed=completed)
+
+    assert completed == {'처음'}
+
+
+def test_completed_is_empty_when_consumer_stops_early(crawler, monkeypatch):
+    stub_search(crawler, monkeypatch)
+    completed = set()
+
+    posts = crawler.iter_many(['테스트1'], completed=completed)
+    next(posts)
+    posts.close()
+
+    assert completed == set()
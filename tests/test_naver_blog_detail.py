@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+
+from crawlers.naver_blog_detail import NaverBlogDetailCrawler
+
+
+def make_posts(count):
+    return [
+        {'post_url': f'https://blog.naver.com/tester/{100000 + i}', 'title': f'포스트 {i}'}
+        for i in range(count)
+    ]
+
+
+def test_worker_error_stops_extraction(monkeypatch):
+    def broken(self, url):
+        raise RuntimeError('extract failed')
+
+    monkeypatch.setattr(NaverBlogDetailCrawler, 'extract_stats', broken)
+    crawler = NaverBlogDetailCrawler(use_http=False)
+    result = {}
+
+    def run():
+        try:
+            crawler.batch_extract(make_posts(300), delay=0, workers=2)
+        except Exception as e:
+            result['error'] = e
+
+    # 대기열(100개)보다 포스트가 많아도 워커 오류가 읽기 스레드를 멈추고 예외로 올라와야 함
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert isinstance(result.get('error'), RuntimeError)
+
+
+class FakeDriver:
+    """counters_ready 스크립트에 정해진 순서대로 답하는 드라이버"""
+
+    def __init__(self, answers):
+        self.answers = list(answers)
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        return self.answers.pop(0) if len(self.answers) > 1 else self.answers[0]
+
+
+def wait_for_counters(driver):
+    crawler = NaverBlogDetailCrawler(use_http=False, wait_timeout=5.0)
+    crawler.driver = driver
+    started = time.monotonic()
+    crawler._wait_for_counters()
+    return time.monotonic() - started
+
+
+def test_counters_wait_returns_when_ready():
+    driver = FakeDriver([False, False, True])
+
+    elapsed = wait_for_counters(driver)
+
+    assert driver.calls == 3
+    assert elapsed < 1.0
+
+
+def test_counters_wait_is_capped_below_wait_timeout():
+    # 카운터가 끝내 채워지지 않아도 wait_timeout(5초)이 아니라 COUNTERS_TIMEOUT에서 멈춤
+    elapsed = wait_for_counters(FakeDriver([False]))
+
+    assert NaverBlogDetailCrawler.COUNTERS_TIMEOUT <= elapsed < NaverBlogDetailCrawler.COUNTERS_TIMEOUT + 0.5
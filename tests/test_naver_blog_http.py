@@ -0,0 +1,82 @@
+import pytest
+
+from crawlers.naver_blog_detail import NaverBlogDetailCrawler
+from crawlers.naver_blog_http import NaverBlogHttpExtractor
+
+POST_URL = 'https://blog.naver.com/tester/223000000001'
+POST_VIEW = """
+<div class="se-main-container"><p class="se-f">조회 1,234</p></div>
+<em id="commentCount">12</em>
+<span class="u_likeit_text">공감</span><em class="u_likeit_list_count">35</em>
+"""
+
+
+class FakeResponse:
+    def __init__(self, text='', payload=None):
+        self.text = text
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """PostView는 고정 HTML, 공감 API는 주어진 JSON을 돌려줌"""
+
+    def __init__(self, like_payload):
+        self.like_payload = like_payload
+
+    def get(self, url, params=None, timeout=None):
+        if url == NaverBlogHttpExtractor.LIKE_API_URL:
+            return FakeResponse(payload=self.like_payload)
+        return FakeResponse(text=POST_VIEW)
+
+
+def make_extractor(like_payload):
+    extractor = NaverBlogHttpExtractor()
+    extractor.session = FakeSession(like_payload)
+    return extractor
+
+
+def test_like_api_count_is_used():
+    payload = {'contents': [{'reactions': [{'count': 30}, {'count': '7'}]}]}
+    result = make_extractor(payload).extract_blog_stats(POST_URL)
+
+    assert result['success']
+    assert (result['views'], result['comments'], result['likes']) == (1234, 12, 37)
+
+
+@pytest.mark.parametrize('payload', [
+    [{'reactions': [{'count': 3}]}],
+    {'contents': [{'reactions': [{'count': 'many'}]}]},
+    {'contents': ['unexpected']},
+    {'contents': [{'reactions': [{'count': None}]}]},
+])
+def test_unexpected_like_api_reply_falls_back_to_page(payload):
+    # 공감 API 응답이 이상해도 예외 없이 본문의 공감 수 사용
+    result = make_extractor(payload).extract_blog_stats(POST_URL)
+
+    assert result['success']
+    assert result['likes'] == 35
+
+
+def test_http_error_falls_back_to_selenium(monkeypatch):
+    crawler = NaverBlogDetailCrawler()
+
+    def broken(url):
+        raise KeyError('unexpected')
+
+    def selenium(url):
+        return {'views': 1, 'comments': 2, 'likes': 3, 'success': True, 'error': None}
+
+    monkeypatch.setattr(crawler.http_extractor, 'extract_blog_stats', broken)
+    monkeypatch.setattr(crawler, 'init_driver', lambda: None)
+    monkeypatch.setattr(crawler, 'extract_blog_stats', selenium)
+
+    result = crawler.extract_stats(POST_URL)
+
+    assert result['success']
+    assert result['source'] == 'selenium'
@@ -0,0 +1,67 @@
+import json
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+from crawlers import naver_blog_snapshot as snapshot_parser
+
+# 형식에 맞춰 손으로 만든 합성 스냅샷 (fixtures/snapshots/README.md 참고)
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_snapshot(name):
+    with open(os.path.join(FIXTURES, 'snapshots', f'{name}.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize('name, views, comments, likes', [
+    ('smarteditor_one', 1234, 12, 35),
+    ('comment_count_empty', 87, 5, 9),
+    ('legacy_editor', 56, 3, 8),
+    ('no_counters', 0, 0, 0),
+])
+def test_parse_saved_snapshots(name, views, comments, likes):
+    snapshot = load_snapshot(name)
+
+    assert snapshot_parser.parse_views(snapshot) == views
+    assert snapshot_parser.parse_comments(snapshot) == comments
+    assert snapshot_parser.parse_likes(snapshot) == likes
+
+
+def test_comment_count_element_takes_precedence():
+    # 댓글 영역 텍스트(댓글 7)와 아이템 개수(7)보다 #commentCount(12)를 먼저 사용
+    snapshot = load_snapshot('smarteditor_one')
+    assert snapshot['selectors']['.u_cbox_count'] == ['댓글 7']
+    assert snapshot['counts'][snapshot_parser.COMMENT_ITEM_SELECTOR] == 7
+
+    assert snapshot_parser.parse_comments(snapshot) == 12
+
+    snapshot['selectors']['#commentCount'] = []
+    assert snapshot_parser.parse_comments(snapshot) == 7
+
+
+def test_comment_items_counted_before_body_text():
+    snapshot = load_snapshot('legacy_editor')
+    assert snapshot_parser.parse_comments(snapshot) == 3
+
+    snapshot['counts'][snapshot_parser.COMMENT_ITEM_SELECTOR] = 0
+    assert snapshot_parser.parse_comments(snapshot) == 10
+
+
+def test_snapshot_from_soup_matches_saved_format():
+    html = """
+    <div class="se-main-container"><p class="se-f">조회 1,234</p></div>
+    <em id="commentCount">12</em>
+    <span class="u_cbox_count">댓글 7</span>
+    <span class="u_likeit_text">공감</span><em class="u_likeit_list_count">35</em>
+    <button>공유</button>
+    """
+    snapshot = snapshot_parser.snapshot_from_soup(BeautifulSoup(html, 'html.parser'))
+    saved = load_snapshot('smarteditor_one')
+
+    assert set(snapshot['selectors']) == set(saved['selectors'])
+    assert set(snapshot['counts']) == set(saved['counts'])
+    assert snapshot_parser.parse_views(snapshot) == 1234
+    assert snapshot_parser.parse_comments(snapshot) == 12
+    assert snapshot_parser.parse_likes(snapshot) == 35
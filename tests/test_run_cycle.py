@@ -0,0 +1,46 @@
+import threading
+import time
+
+import pytest
+
+import crawlers.twitter
+import main
+
+
+class SlowTwitterCrawler:
+    """트윗 하나를 천천히 내보내는 트위터 크롤러 (끝났는지 기록)"""
+
+    finished = threading.Event()
+
+    def __init__(self, workers=4):
+        pass
+
+    def iter_many(self, keywords, max_results, seen=None):
+        time.sleep(0.5)
+        yield {'tweet_id': '1', 'region': '국내'}
+        SlowTwitterCrawler.finished.set()
+
+
+class EmptyNaverCrawler:
+    def iter_many(self, keywords, max_results, watermarks=None, completed=None):
+        return iter(())
+
+
+class BrokenDetailCrawler:
+    def iter_extract(self, posts, **kwargs):
+        raise RuntimeError('detail failed')
+        yield
+
+
+def test_failed_cycle_waits_for_background_collection(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(crawlers.twitter, 'TwitterCrawler', SlowTwitterCrawler)
+    SlowTwitterCrawler.finished.clear()
+    args = main.parse_args(['--no-cache'])
+
+    with pytest.raises(RuntimeError):
+        main.run_cycle(args, EmptyNaverCrawler(), BrokenDetailCrawler())
+
+    # 사이클이 끝났을 때(데몬이 lock을 풀기 전) 트위터 수집도 끝나 있어야 함
+    assert SlowTwitterCrawler.finished.is_set()
+    assert not [t for t in threading.enumerate() if t.name in ('twitter-collector', 'naver-search')]
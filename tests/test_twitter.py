@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from crawlers.twitter import TwitterCrawler
+from utils.instance_health import InstanceHealthStore
+
+pytestmark = pytest.mark.usefixtures('no_scraper_sleep')
+
+KEYWORDS = ['테스트1', '테스트2', '테스트3', '테스트4']
+
+
+def make_crawler(tmp_path, stubs, **kwargs):
+    health = InstanceHealthStore(str(tmp_path / 'nitter_instances.json'))
+    return TwitterCrawler(instances=[stub.url for stub in stubs], health=health, **kwargs)
+
+
+def test_iter_many_searches_keywords_concurrently(tmp_path, nitter_stub):
+    stubs = [nitter_stub(tweets=3, delay=0.3) for _ in range(2)]
+    crawler = make_crawler(tmp_path, stubs, workers=4, per_instance=2)
+
+    started = time.monotonic()
+    tweets = list(crawler.iter_many(KEYWORDS, max_results=3))
+    elapsed = time.monotonic() - started
+
+    # 4개 검색이 동시에 진행되어 순차 실행(4 × 0.3초)보다 빨라야 함
+    assert elapsed < 4 * 0.3
+    assert sum(stub.max_active for stub in stubs) == 4
+    assert len(tweets) == 4 * 3
+    assert [t.keyword for t in tweets] == [k for k in KEYWORDS for _ in range(3)]
+    # '#'까지 인코딩된 검색어가 인스턴스에 전달됨
+    assert sorted(q for stub in stubs for q in stub.queries) == sorted(f'#{k}' for k in KEYWORDS)
+
+
+def test_per_instance_concurrency_cap(tmp_path, nitter_stub):
+    stub = nitter_stub(tweets=1, delay=0.2)
+    crawler = make_crawler(tmp_path, [stub], workers=6, per_instance=2)
+
+    tweets = crawler.collect_many(KEYWORDS + ['테스트5', '테스트6'], max_results=1)
+
+    assert len(tweets) == 6
+    assert stub.max_active == 2
+
+
+@pytest.mark.parametrize('mode', ['error', 'down'])
+def test_failover_to_next_instance_on_error(tmp_path, nitter_stub, mode):
+    broken = nitter_stub(mode=mode)
+    healthy = nitter_stub(tweets=2)
+    crawler = make_crawler(tmp_path, [broken, healthy], workers=1)
+
+    tweets = crawler.collect_many(['테스트1'], max_results=2)
+
+    assert len(tweets) == 2
+    assert healthy.queries == ['#테스트1']
+    assert crawler.health.instances[broken.url]['success_rate'] == 0.0
+    assert crawler.health.instances[healthy.url]['success_rate'] == 1.0
+
+
+def test_empty_result_is_not_retried_or_penalized(tmp_path, nitter_stub):
+    empty = nitter_stub(mode='empty')
+    healthy = nitter_stub(tweets=2)
+    crawler = make_crawler(tmp_path, [empty, healthy], workers=1)
+
+    tweets = crawler.collect_many(['결과없는태그'], max_results=2)
+
+    assert tweets == []
+    assert empty.queries == ['#결과없는태그']
+    assert healthy.queries == []
+    assert crawler.health.instances[empty.url]['success_rate'] == 1.0
+
+
+def test_tweets_matched_by_several_keywords_are_merged(tmp_path, nitter_stub):
+    stub = nitter_stub(tweets=2)
+    crawler = make_crawler(tmp_path, [stub], workers=2)
+
+    # 같은 검색어('#테스트1')로 두 번 검색되므로 같은 트윗이 두 키워드에 걸림
+    tweets = crawler.collect_many(['테스트1', '#테스트1'], max_results=2)
+
+    assert len(tweets) == 2
+    assert all(t.keywords == ['테스트1', '#테스트1'] for t in tweets)
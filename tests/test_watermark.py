@@ -0,0 +1,40 @@
+from utils.watermark import LatestPostTracker, WatermarkStore
+
+POSTS = [
+    {'keyword': '테스트1', 'post_date': '2024-01-02', 'post_url': 'https://blog.naver.com/a/1'},
+    {'keyword': '테스트1', 'post_date': '2024-01-03', 'post_url': 'https://blog.naver.com/a/2'},
+    {'keyword': '테스트2', 'post_date': '2024-01-01', 'post_url': 'https://blog.naver.com/b/1'},
+    {'keyword': '테스트1', 'post_date': '2024-01-03', 'post_url': 'https://blog.naver.com/a/3'},
+    {'keyword': '테스트1', 'post_date': '2024-01-01', 'post_url': 'https://blog.naver.com/a/4'},
+    {'keyword': '테스트2', 'post_date': '', 'post_url': 'https://blog.naver.com/b/2'},
+]
+
+
+def test_tracker_keeps_only_latest_posts():
+    tracker = LatestPostTracker()
+    for post in POSTS:
+        tracker.add(post)
+
+    assert tracker.posts('테스트1') == [
+        {'post_date': '2024-01-03', 'post_url': 'https://blog.naver.com/a/2'},
+        {'post_date': '2024-01-03', 'post_url': 'https://blog.naver.com/a/3'},
+    ]
+    assert tracker.posts('테스트2') == [{'post_date': '2024-01-01', 'post_url': 'https://blog.naver.com/b/1'}]
+    assert tracker.posts('없는키워드') == []
+
+
+def test_tracker_gives_same_watermarks_as_full_post_list(tmp_path):
+    full = WatermarkStore(str(tmp_path / 'full.json'))
+    tracked = WatermarkStore(str(tmp_path / 'tracked.json'))
+    tracker = LatestPostTracker()
+    for post in POSTS:
+        tracker.add(post)
+
+    for keyword in ['테스트1', '테스트2', '없는키워드']:
+        full.update(keyword, [p for p in POSTS if p['keyword'] == keyword])
+        tracked.update(keyword, tracker.posts(keyword))
+
+    def without_time(store):
+        return {k: {**v, 'updated_at': None} for k, v in store.watermarks.items()}
+
+    assert without_time(tracked) == without_time(full)
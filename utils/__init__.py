@@ -1,4 +1,39 @@
 # utils package
-from .excel_generator import ExcelGenerator
+# pandas/pyarrow/xlsxwriter가 필요한 모듈도 있으므로, 실제로 사용하는 모듈만 처음 접근할 때 불러옴
+import importlib
 
-__all__ = ['ExcelGenerator']
+_LAZY = {
+    'BloomFilter': '.bloom_filter',
+    'CheckpointJournal': '.checkpoint',
+    'ChromeDriverCache': '.chromedriver',
+    'ExcelGenerator': '.excel_generator',
+    'InstanceHealthStore': '.instance_health',
+    'JsonlWriter': '.jsonl_writer',
+    'read_jsonl': '.jsonl_writer',
+    'ParquetArchive': '.parquet_archive',
+    'HostRateLimiter': '.rate_limiter',
+    'TokenBucket': '.rate_limiter',
+    'NaverPost': '.records',
+    'Platform': '.records',
+    'Region': '.records',
+    'Tweet': '.records',
+    'AlreadyRunningError': '.run_lock',
+    'RunLock': '.run_lock',
+    'StatsCache': '.stats_cache',
+    'LatestPostTracker': '.watermark',
+    'WatermarkStore': '.watermark',
+}
+
+__all__ = ['BloomFilter', 'CheckpointJournal', 'ChromeDriverCache', 'ExcelGenerator', 'InstanceHealthStore', 'JsonlWriter', 'read_jsonl', 'ParquetArchive', 'HostRateLimiter', 'TokenBucket', 'NaverPost', 'Platform', 'Region', 'Tweet', 'AlreadyRunningError', 'RunLock', 'StatsCache', 'LatestPostTracker', 'WatermarkStore']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,45 @@
+import json
+import os
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'w') -> Iterator[IO]:
+    """
+    임시 파일(path.tmp)에 쓴 뒤 블록이 끝나면 path로 교체
+
+    쓰는 도중 예외가 나면 임시 파일을 지우고 기존 파일은 그대로 둔다. 폴더가 없으면 만든다.
+
+    Args:
+        path: 저장할 파일 경로
+        mode: 'w'(UTF-8 텍스트) 또는 'wb'(바이너리)
+
+    Yields:
+        임시 파일 객체
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, mode, encoding=None if 'b' in mode else 'utf-8') as f:
+            yield f
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+def save_json(path: str, data):
+    """
+    JSON 파일로 원자적으로 저장 (상태/캐시 파일 공통 형식: 한글 그대로, 들여쓰기 2칸)
+
+    Args:
+        path: 저장할 파일 경로
+        data: json.dump 가능한 객체
+    """
+    with atomic_write(path) as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
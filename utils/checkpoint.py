@@ -0,0 +1,98 @@
+import json
+import os
+import threading
+from typing import Dict
+
+
+class CheckpointJournal:
+    """상세 크롤링 진행 상황을 기록하는 append-only JSONL 저널
+
+    한 줄에 포스트 하나({'key', 'views', 'comments', 'likes'})를 기록하고,
+    flush_every개마다 디스크에 확정한다. 중단된 뒤 resume=True로 다시 열면
+    이미 끝난 포스트를 completed에서 찾아 건너뛸 수 있다.
+    """
+
+    def __init__(self, path: str = 'data/detail_checkpoint.jsonl', flush_every: int = 10,
+                 resume: bool = False):
+        """
+        Args:
+            path: 저널 파일 경로
+            flush_every: 몇 개마다 디스크에 기록할지
+            resume: True면 기존 저널을 이어서 사용, False면 새로 시작
+        """
+        self.path = path
+        self.flush_every = max(1, flush_every)
+        self.completed: Dict[str, Dict] = {}
+        self._buffer = []
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if resume:
+            self._load()
+        elif os.path.exists(path):
+            os.remove(path)
+
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _load(self):
+        """기존 저널 읽기 (중단 시점에 잘린 마지막 줄은 잘라내서 이어 쓸 기록과 붙지 않게 함)"""
+        if not os.path.exists(self.path):
+            return
+
+        # 마지막으로 온전히 기록된 줄의 끝 위치
+        end = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    if line.endswith(b'\n'):
+                        end += len(line)
+                    continue
+                self.completed[entry.pop('key')] = entry
+                end += len(line)
+
+        if end < os.path.getsize(self.path):
+            os.truncate(self.path, end)
+        elif end and not line.endswith(b'\n'):
+            # 줄바꿈만 빠진 마지막 기록은 살리고 줄바꿈을 채움
+            with open(self.path, 'ab') as f:
+                f.write(b'\n')
+
+    def record(self, key: str, stats: Dict):
+        """완료된 포스트 기록"""
+        entry = {'views': stats.get('views'), 'comments': stats.get('comments'), 'likes': stats.get('likes')}
+
+        with self._lock:
+            self.completed[key] = entry
+            self._buffer.append(json.dumps({'key': key, **entry}, ensure_ascii=False))
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self):
+        """버퍼에 남은 기록을 디스크에 확정"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer or self._file.closed:
+            return
+        self._file.write('\n'.join(self._buffer) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._buffer = []
+
+    def close(self):
+        """남은 기록을 확정하고 파일 닫기"""
+        with self._lock:
+            self._flush_locked()
+            self._file.close()
+
+    def clear(self):
+        """작업이 모두 끝났을 때 저널 삭제"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
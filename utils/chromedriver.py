@@ -0,0 +1,96 @@
+import json
+import os
+import re
+import subprocess
+import threading
+from datetime import datetime
+from typing import Optional
+
+from .atomic_file import save_json
+
+
+class ChromeDriverCache:
+    """ChromeDriver 경로 캐시 (버전 고정, 네트워크 없이 재사용)
+
+    ChromeDriverManager().install()은 호출할 때마다 최신 드라이버 버전을 네트워크로 조회한다.
+    한 번 받은 드라이버의 경로와 버전을 JSON 파일에 기록해 두고, 다음부터는 파일만 확인해서
+    바로 사용한다. 네트워크는 캐시가 없거나, 고정한 버전과 다르거나, Chrome이 업데이트되어
+    드라이버로 세션을 열 수 없을 때(refresh)만 사용한다.
+
+    환경 변수:
+        CHROMEDRIVER_PATH: 직접 설치한 chromedriver 경로 (설정하면 다운로드하지 않음)
+        CHROMEDRIVER_VERSION: 사용할 드라이버 버전 (예: 120.0.6099.109)
+    """
+
+    def __init__(self, path: str = 'data/chromedriver.json', version: Optional[str] = None):
+        """
+        Args:
+            path: 드라이버 경로/버전을 기록할 JSON 파일 경로
+            version: 고정할 드라이버 버전 (None이면 CHROMEDRIVER_VERSION, 그것도 없으면 캐시된 버전 사용)
+        """
+        self.path = path
+        self.version = version or os.getenv('CHROMEDRIVER_VERSION') or None
+        self.driver_path = os.getenv('CHROMEDRIVER_PATH') or None
+        self.entry: dict = {}
+        self._refreshed = False
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entry = json.load(f)
+
+    def resolve(self, refresh: bool = False) -> str:
+        """
+        chromedriver 실행 파일 경로 (여러 워커가 동시에 호출해도 다운로드는 한 번)
+
+        Args:
+            refresh: True면 캐시를 무시하고 다시 받음 (Chrome 업데이트로 버전이 안 맞을 때,
+                     여러 워커가 요청해도 프로세스당 한 번만)
+
+        Returns:
+            chromedriver 경로
+        """
+        if self.driver_path:
+            return self.driver_path
+
+        with self._lock:
+            cached = self.entry.get('path')
+            usable = (
+                (not refresh or self._refreshed)
+                and cached and os.path.isfile(cached)
+                and (not self.version or self.entry.get('version') == self.version)
+            )
+            if usable:
+                return cached
+
+            path = self._install()
+            if refresh:
+                self._refreshed = True
+            self.entry = {
+                'path': path,
+                'version': self.version or self._driver_version(path),
+                'installed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            }
+            self._save()
+            print(f"✅ ChromeDriver 준비: {self.entry['version'] or '버전 미확인'} ({path})")
+            return path
+
+    def _install(self) -> str:
+        """webdriver_manager로 드라이버 다운로드 (이미 받은 버전은 ~/.wdm 캐시 사용)"""
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        return ChromeDriverManager(driver_version=self.version).install()
+
+    @staticmethod
+    def _driver_version(path: str) -> Optional[str]:
+        """chromedriver --version 출력에서 버전 읽기"""
+        try:
+            output = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        match = re.search(r'(\d+(?:\.\d+)+)', output)
+        return match.group(1) if match else None
+
+    def _save(self):
+        """캐시 파일 저장"""
+        save_json(self.path, self.entry)
@@ -1,285 +1,743 @@
+import json
 import pandas as pd
+import time
+import xlsxwriter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
 import os
 
+from .atomic_file import save_json
+from .records import records_to_frame
+
+
+class StreamingExcelWriter:
+    """xlsxwriter constant_memory 워크북에 DataFrame을 행 순서대로 바로 기록
+
+    셀 객체를 메모리에 쌓지 않고 행 단위로 디스크에 내보내므로
+    수십만 행 리포트도 메모리 사용량이 거의 일정하다.
+    (constant_memory 모드에서는 시트마다 위에서 아래로만 기록할 수 있음)
+    """
+
+    CHUNK_ROWS = 5000  # NA 변환용 object 복사본을 만들 행 수 (시트 전체를 한 번에 복사하지 않음)
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 출력 xlsx 파일 경로
+        """
+        self.path = path
+        # 본문/URL이 수식·하이퍼링크로 바뀌지 않도록 문자열은 그대로 기록
+        self.workbook = xlsxwriter.Workbook(path, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        self.header_format = self.workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+        self.sheets = {}
+
+    def write_frame(self, frame: pd.DataFrame, sheet_name: str, startrow: int = 0):
+        """
+        DataFrame을 헤더와 함께 기록
+
+        Args:
+            frame: 기록할 DataFrame
+            sheet_name: 시트 이름 (없으면 새로 만듦)
+            startrow: 시작 행 (이미 기록한 행보다 아래여야 함)
+        """
+        worksheet = self.sheets.get(sheet_name)
+        if worksheet is None:
+            worksheet = self.sheets[sheet_name] = self.workbook.add_worksheet(sheet_name)
+
+        worksheet.write_row(startrow, 0, [str(c) for c in frame.columns], self.header_format)
+
+        # NA/NaN은 빈 셀로 기록
+        row = startrow + 1
+        for start in range(0, len(frame), self.CHUNK_ROWS):
+            chunk = frame.iloc[start:start + self.CHUNK_ROWS]
+            values = chunk.astype(object).where(chunk.notna(), None)
+            for record in values.itertuples(index=False, name=None):
+                worksheet.write_row(row, 0, record)
+                row += 1
+
+    def close(self):
+        """워크북 저장"""
+        self.workbook.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
 class ExcelGenerator:
     """SNS KPI 데이터를 Excel 파일로 생성"""
-    
-    def __init__(self, output_dir: str = 'output'):
+
+    NAVER = 'naver'
+    TWITTER = 'twitter'
+
+    # 정규화 프레임 컬럼 (네이버/트위터 레코드 필드의 합집합)
+    FIELDS = [
+        'region', 'keyword', 'keywords', 'title', 'description', 'text',
+        'blogger_name', 'blogger_id', 'channel_name', 'channel_id',
+        'post_url', 'post_date', 'collected_at',
+        'views', 'likes', 'comments', 'retweets', 'detail_crawled'
+    ]
+    TEXT_FIELDS = [
+        'keyword', 'title', 'description', 'text', 'blogger_name', 'blogger_id',
+        'channel_name', 'channel_id', 'post_url', 'post_date', 'collected_at'
+    ]
+    METRIC_FIELDS = ['views', 'likes', 'comments', 'retweets']
+
+    # 플랫폼별 region 기본값
+    DEFAULT_REGION = {NAVER: '국내', TWITTER: '미분류'}
+
+    # Excel 시트 최대 행 수 1,048,576 - 헤더 1행
+    MAX_SHEET_ROWS = 1_048_575
+
+    # constant_memory=None일 때 이 행 수 이상이면 스트리밍 모드 사용
+    STREAMING_ROWS = 50_000
+
+    # 누적 집계 테이블별 병합 키와 컬럼 (update_report 상태 파일에 저장)
+    AGGREGATE_KEYS = {
+        'region_counts': ['source', 'region'],
+        'keyword_stats': ['source', 'keyword'],
+        'daily_counts': ['날짜', '플랫폼', '키워드', '국내/해외'],
+    }
+    AGGREGATE_COLUMNS = {
+        'region_counts': ['source', 'region', 'count'],
+        'keyword_stats': ['source', 'keyword', 'count', 'views', 'likes', 'comments', 'retweets',
+                          'views_collected', 'views_collected_sum'],
+        'daily_counts': ['날짜', '플랫폼', '키워드', '국내/해외', '게시물 수'],
+    }
+
+    # 누적 집계로 다시 쓰는 시트 (나머지 상세 시트는 행을 이어 씀)
+    AGGREGATE_SHEETS = ['전체 요약', '해시태그 분석', '일별 트렌드']
+
+    def __init__(self, output_dir: str = 'output', constant_memory: Optional[bool] = None,
+                 sidecar_format: Optional[str] = 'parquet', workers: int = 4):
+        """
+        Args:
+            output_dir: 출력 디렉터리
+            constant_memory: True면 xlsxwriter constant_memory 모드로 행을 바로 디스크에 기록,
+                False면 openpyxl, None이면 게시물 수(STREAMING_ROWS)에 따라 자동 선택
+            sidecar_format: 시트 행 제한을 넘을 때 전체 데이터를 함께 저장할 형식
+                ('parquet', 'csv', None이면 저장 안 함)
+            workers: 시트 DataFrame을 동시에 구성할 스레드 수
+        """
+        if sidecar_format not in (None, 'parquet', 'csv'):
+            raise ValueError(f"지원하지 않는 sidecar 형식: {sidecar_format} (parquet 또는 csv)")
+
         self.output_dir = output_dir
+        self.constant_memory = constant_memory
+        self.sidecar_format = sidecar_format
+        self.workers = max(1, workers)
         os.makedirs(output_dir, exist_ok=True)
-    
-    def generate_report(self, naver_data: List[Dict], twitter_data: List[Dict], 
+
+    def generate_report(self, naver_data: List[Dict], twitter_data: List[Dict],
                        keywords: List[str]) -> str:
         """
         통합 KPI 리포트 생성
-        
+
         Args:
             naver_data: 네이버 블로그 데이터
             twitter_data: 트위터 데이터
             keywords: 수집한 키워드 리스트
-        
+
         Returns:
             생성된 Excel 파일 경로
         """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'SNS_KPI_Report_{timestamp}.xlsx'
         filepath = os.path.join(self.output_dir, filename)
-        
+
         print(f"\n{'='*60}")
         print(f"📊 Excel 리포트 생성 중...")
         print(f"{'='*60}")
-        
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            # 1. 전체 요약 시트
-            print("📄 '전체 요약' 시트 생성 중...")
-            self._create_summary_sheet(writer, naver_data, twitter_data, keywords)
-            
-            # 2. 통합 데이터 시트 (모든 SNS 합침)
-            print("📄 '통합 데이터' 시트 생성 중...")
-            self._create_integrated_sheet(writer, naver_data, twitter_data)
-            
-            # 3. 네이버 블로그 시트
-            if naver_data:
-                print("📄 '네이버 블로그' 시트 생성 중...")
-                self._create_naver_sheet(writer, naver_data)
-            
-            # 4. 트위터 시트
-            if twitter_data:
-                print("📄 'Twitter' 시트 생성 중...")
-                self._create_twitter_sheet(writer, twitter_data)
-            
-            # 5. 해시태그 분석 시트
-            print("📄 '해시태그 분석' 시트 생성 중...")
-            self._create_hashtag_analysis_sheet(writer, naver_data, twitter_data, keywords)
-            
-            # 6. 일별 트렌드 시트
-            print("📄 '일별 트렌드' 시트 생성 중...")
-            self._create_daily_trends_sheet(writer, naver_data, twitter_data)
-        
+
+        # 모든 시트가 공유하는 정규화 프레임 (레코드당 한 번만 변환)
+        df = self._build_frame(naver_data, twitter_data)
+        sidecar_path = self._write_report(filepath, df, self._aggregate(df), keywords)
+
         print(f"{'='*60}")
         print(f"✅ Excel 리포트 생성 완료!")
         print(f"📁 파일 위치: {filepath}")
+        if sidecar_path:
+            print(f"📁 전체 데이터: {sidecar_path}")
         print(f"{'='*60}\n")
-        
+
         return filepath
-    
-    def _create_summary_sheet(self, writer, naver_data, twitter_data, keywords):
-        """전체 요약 시트"""
-        # 플랫폼별 요약
+
+    def update_report(self, naver_data: List[Dict], twitter_data: List[Dict], keywords: List[str],
+                      filename: str = 'SNS_KPI_Report_rolling.xlsx',
+                      state_path: str = 'data/report_state.json') -> str:
+        """
+        캠페인 누적 리포트에 이번 실행분만 반영
+
+        - 전체 요약 / 해시태그 분석 / 일별 트렌드: 상태 파일의 누적 집계에
+          이번 실행분 집계만 더한 뒤 해당 시트만 다시 씀
+        - 통합 데이터 / 네이버 블로그 / Twitter: 이번 실행분 행만 시트 끝에 이어 씀
+
+        리포트나 상태 파일이 없으면 이번 실행분으로 새로 만든다.
+
+        Args:
+            naver_data: 이번 실행의 네이버 블로그 데이터
+            twitter_data: 이번 실행의 트위터 데이터
+            keywords: 이번 실행의 키워드 리스트 (이전 키워드와 합쳐짐)
+            filename: 누적 리포트 파일 이름 (output_dir 기준)
+            state_path: 누적 집계 상태 JSON 경로
+
+        Returns:
+            누적 리포트 파일 경로
+        """
+        filepath = os.path.join(self.output_dir, filename)
+
+        print(f"\n{'='*60}")
+        print(f"📊 누적 Excel 리포트 갱신 중...")
+        print(f"{'='*60}")
+
+        df = self._build_frame(naver_data, twitter_data)
+        delta = self._aggregate(df)
+
+        # 리포트와 상태 파일이 함께 있어야 이어서 갱신할 수 있음
+        state = self._load_state(state_path) if os.path.exists(filepath) else None
+
+        sidecar_path = None
+        if state is None:
+            print("🆕 누적 리포트가 없어 이번 실행분으로 새로 만듭니다")
+            keywords = list(dict.fromkeys(keywords))
+            aggregates = delta
+            sidecar_path = self._write_report(filepath, df, aggregates, keywords)
+        else:
+            keywords = list(dict.fromkeys(state['keywords'] + list(keywords)))
+            aggregates = self._merge_aggregates(state['aggregates'], delta)
+            print(f"➕ 이번 실행분 {len(df):,}행 반영")
+            self._append_report(filepath, df, aggregates, keywords)
+
+        self._save_state(state_path, keywords, aggregates)
+
+        print(f"{'='*60}")
+        print(f"✅ 누적 Excel 리포트 갱신 완료!")
+        print(f"📁 파일 위치: {filepath}")
+        if sidecar_path:
+            print(f"📁 전체 데이터: {sidecar_path}")
+        print(f"{'='*60}\n")
+
+        return filepath
+
+    def _write_report(self, filepath: str, df: pd.DataFrame, aggregates: Dict[str, pd.DataFrame],
+                      keywords: List[str]) -> Optional[str]:
+        """
+        전체 워크북 새로 쓰기
+
+        Returns:
+            sidecar 파일 경로 (저장하지 않았으면 None)
+        """
+        streaming = self.constant_memory
+        if streaming is None:
+            streaming = len(df) >= self.STREAMING_ROWS
+        if streaming:
+            print(f"💾 스트리밍 모드 (constant_memory, {len(df):,}행)")
+
+        # 1. 시트별 DataFrame 구성 (공유 프레임을 읽기만 하므로 스레드 풀에서 동시에)
+        sheets = self._build_sheets(self._sheet_builders(df, aggregates, keywords))
+
+        # 2. 워크북 기록은 시트 순서대로 직렬로
+        with self._open_writer(filepath, streaming) as writer:
+            for sheet_name, frame in sheets.items():
+                if frame is None:
+                    continue
+
+                print(f"📄 '{sheet_name}' 시트 기록 중...")
+                self._write_built_sheet(writer, sheet_name, frame)
+
+        # 시트 하나에 다 들어가지 않으면 전체 데이터를 분석용 파일로도 저장
+        if self.sidecar_format and len(df) > self.MAX_SHEET_ROWS:
+            return self._write_sidecar(df, filepath)
+        return None
+
+    def _append_report(self, filepath: str, df: pd.DataFrame, aggregates: Dict[str, pd.DataFrame],
+                       keywords: List[str]):
+        """기존 워크북에서 집계 시트만 다시 쓰고 상세 시트에는 이번 실행분 행을 이어 씀"""
+        sheets = self._build_sheets(self._sheet_builders(df, aggregates, keywords))
+
+        with pd.ExcelWriter(filepath, engine='openpyxl', mode='a', if_sheet_exists='overlay') as writer:
+            for sheet_name, frame in sheets.items():
+                if frame is None:
+                    continue
+
+                if sheet_name in self.AGGREGATE_SHEETS:
+                    print(f"📄 '{sheet_name}' 시트 다시 쓰는 중...")
+                    self._reset_sheet(writer.book, sheet_name)
+                    self._write_built_sheet(writer, sheet_name, frame)
+                elif not frame.empty:
+                    print(f"📄 '{sheet_name}' 시트에 {len(frame):,}행 추가 중...")
+                    self._append_rows(writer, sheet_name, frame)
+
+    def _sheet_builders(self, df: pd.DataFrame, aggregates: Dict[str, pd.DataFrame],
+                        keywords: List[str]) -> Dict[str, Callable]:
+        """시트 이름 -> 구성 함수 (시트 순서대로)"""
+        sources = set(df['source'])
+
+        builders = {'전체 요약': lambda: self._build_summary_frames(aggregates, keywords)}
+        builders['통합 데이터'] = lambda: self._build_integrated_frame(df)
+        if self.NAVER in sources:
+            builders['네이버 블로그'] = lambda: self._build_naver_frame(df)
+        if self.TWITTER in sources:
+            builders['Twitter'] = lambda: self._build_twitter_frame(df)
+        builders['해시태그 분석'] = lambda: self._build_hashtag_analysis_frame(aggregates, keywords)
+        builders['일별 트렌드'] = lambda: self._build_daily_trends_frame(aggregates)
+        return builders
+
+    def _build_sheets(self, builders: Dict[str, Callable]) -> Dict[str, object]:
+        """
+        시트 DataFrame들을 스레드 풀에서 동시에 구성하고 시트별 소요 시간 출력
+
+        Args:
+            builders: {시트 이름: 인자 없는 구성 함수}
+
+        Returns:
+            {시트 이름: 구성 결과} (builders와 같은 순서)
+        """
+        def timed(builder):
+            started = time.perf_counter()
+            return builder(), time.perf_counter() - started
+
+        print(f"📄 시트 {len(builders)}개 구성 중 (동시 {min(self.workers, len(builders))}개)...")
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {name: executor.submit(timed, builder) for name, builder in builders.items()}
+
+            sheets = {}
+            for name, future in futures.items():
+                sheets[name], elapsed = future.result()
+                print(f"   ⏱️ {name}: {elapsed:.2f}초")
+
+        print(f"   ⏱️ 전체 구성: {time.perf_counter() - started:.2f}초")
+        return sheets
+
+    @staticmethod
+    def _open_writer(filepath: str, streaming: bool):
+        """스트리밍 모드면 StreamingExcelWriter, 아니면 openpyxl 기반 pandas ExcelWriter"""
+        if streaming:
+            return StreamingExcelWriter(filepath)
+        return pd.ExcelWriter(filepath, engine='openpyxl')
+
+    def _write_sheet(self, writer, sheet_name: str, frame: pd.DataFrame, startrow: int = 0,
+                     first_part: int = 1):
+        """
+        DataFrame을 시트에 기록 (행 제한을 넘으면 '시트명 (2)', '시트명 (3)'...으로 분할)
+
+        Args:
+            writer: pd.ExcelWriter 또는 StreamingExcelWriter
+            sheet_name: 시트 이름
+            frame: 기록할 DataFrame
+            startrow: 시작 행 (같은 시트에 이어 쓸 때)
+            first_part: 첫 조각의 분할 번호 (기존 분할 시트 뒤에 이어 만들 때)
+        """
+        limit = self.MAX_SHEET_ROWS - startrow
+        chunks = [frame.iloc[i:i + limit] for i in range(0, len(frame), limit)] or [frame]
+
+        if len(chunks) > 1:
+            print(f"   ↳ {len(frame):,}행 → 시트 {len(chunks)}개로 분할")
+
+        for part, chunk in enumerate(chunks, first_part):
+            name = sheet_name if part == 1 else f"{sheet_name} ({part})"
+            if isinstance(writer, StreamingExcelWriter):
+                writer.write_frame(chunk, name, startrow=startrow)
+                continue
+
+            # 기존 워크북에 이어 쓸 때도 분할 시트가 앞 조각 바로 뒤에 오도록 미리 생성
+            previous = sheet_name if part == 2 else f"{sheet_name} ({part - 1})"
+            if part > 1 and name not in writer.book.sheetnames and previous in writer.book.sheetnames:
+                writer.book.create_sheet(name, writer.book.sheetnames.index(previous) + 1)
+            chunk.to_excel(writer, sheet_name=name, startrow=startrow, index=False)
+
+    def _write_built_sheet(self, writer, sheet_name: str, frame):
+        """구성된 시트 기록 (전체 요약은 두 표를 한 시트에)"""
+        if sheet_name == '전체 요약':
+            df_summary, df_keywords = frame
+            self._write_sheet(writer, sheet_name, df_summary)
+            # 같은 시트에 이어서 기록 (빈 줄 2개 후)
+            self._write_sheet(writer, sheet_name, df_keywords, startrow=len(df_summary) + 3)
+        else:
+            self._write_sheet(writer, sheet_name, frame)
+
+    @staticmethod
+    def _sheet_parts(book, sheet_name: str) -> List[str]:
+        """시트와 분할된 후속 시트('시트명 (2)'...) 이름 목록"""
+        prefix = f"{sheet_name} ("
+        return [name for name in book.sheetnames
+                if name == sheet_name or (name.startswith(prefix) and name.endswith(')'))]
+
+    def _reset_sheet(self, book, sheet_name: str):
+        """시트를 같은 위치의 빈 시트로 교체 (분할된 후속 시트는 삭제)"""
+        parts = self._sheet_parts(book, sheet_name)
+        if not parts:
+            book.create_sheet(sheet_name)
+            return
+
+        index = book.sheetnames.index(parts[0])
+        for name in parts:
+            book.remove(book[name])
+        book.create_sheet(sheet_name, index)
+
+    def _append_rows(self, writer, sheet_name: str, frame: pd.DataFrame):
+        """
+        상세 시트 끝에 행 추가 (마지막 분할 시트가 차면 다음 분할 시트로)
+
+        Args:
+            writer: mode='a', if_sheet_exists='overlay'로 연 pd.ExcelWriter
+            sheet_name: 시트 이름
+            frame: 추가할 DataFrame
+        """
+        book = writer.book
+        parts = self._sheet_parts(book, sheet_name)
+
+        if not parts:
+            # 이번 실행에서 처음 생긴 시트는 집계 시트 앞에 헤더와 함께 추가
+            index = len(book.sheetnames)
+            if '해시태그 분석' in book.sheetnames:
+                index = book.sheetnames.index('해시태그 분석')
+            book.create_sheet(sheet_name, index)
+            self._write_sheet(writer, sheet_name, frame)
+            return
+
+        # 헤더 포함 1,048,576행까지
+        last = parts[-1]
+        used = book[last].max_row
+        room = max(0, self.MAX_SHEET_ROWS + 1 - used)
+        head, rest = frame.iloc[:room], frame.iloc[room:]
+
+        if not head.empty:
+            head.to_excel(writer, sheet_name=last, startrow=used, header=False, index=False)
+
+        if not rest.empty:
+            self._write_sheet(writer, sheet_name, rest, first_part=len(parts) + 1)
+
+    def _load_state(self, path: str) -> Optional[Dict]:
+        """
+        누적 집계 상태 읽기
+
+        Returns:
+            {'keywords': [...], 'aggregates': {테이블 이름: DataFrame}} 또는 파일이 없으면 None
+        """
+        if not os.path.exists(path):
+            return None
+
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+        aggregates = {
+            name: pd.DataFrame.from_records(state['aggregates'].get(name, []), columns=columns)
+            for name, columns in self.AGGREGATE_COLUMNS.items()
+        }
+        return {'keywords': state['keywords'], 'aggregates': aggregates}
+
+    @staticmethod
+    def _save_state(path: str, keywords: List[str], aggregates: Dict[str, pd.DataFrame]):
+        """누적 집계 상태 저장"""
+        state = {
+            'keywords': keywords,
+            'aggregates': {
+                name: json.loads(frame.to_json(orient='records', force_ascii=False))
+                for name, frame in aggregates.items()
+            },
+            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+        save_json(path, state)
+
+    def _write_sidecar(self, df: pd.DataFrame, filepath: str) -> str:
+        """
+        정규화 프레임 전체를 리포트 옆에 Parquet/CSV로 저장
+
+        Returns:
+            저장한 파일 경로
+        """
+        base = os.path.splitext(filepath)[0]
+        if self.sidecar_format == 'csv':
+            path = f"{base}.csv"
+            # Excel에서 한글이 깨지지 않도록 BOM 포함
+            df.to_csv(path, index=False, encoding='utf-8-sig')
+        else:
+            path = f"{base}.parquet"
+            df.to_parquet(path, index=False)
+        return path
+
+    def _build_frame(self, naver_data, twitter_data) -> pd.DataFrame:
+        """
+        네이버/트위터 레코드(dict 또는 NaverPost/Tweet)를 하나의 정규화 DataFrame으로 변환
+
+        - source: 'naver' / 'twitter'
+        - 문자열 필드의 누락값은 '', region은 플랫폼별 기본값
+        - keywords: 게시물이 걸린 키워드 리스트 (없으면 [keyword])
+        - 지표는 nullable 정수(Int64)라 미수집(None)이 NA로 남음
+
+        Returns:
+            FIELDS + ['source'] 컬럼을 가진 DataFrame
+        """
+        frames = []
+        for source, records in ((self.NAVER, naver_data), (self.TWITTER, twitter_data)):
+            if not records:
+                continue
+            frame = records_to_frame(records, self.FIELDS)
+            frame['source'] = source
+            frame['region'] = frame['region'].fillna(self.DEFAULT_REGION[source])
+            frames.append(frame)
+
+        if not frames:
+            df = pd.DataFrame(columns=self.FIELDS + ['source'])
+        else:
+            df = pd.concat(frames, ignore_index=True)
+
+        df[self.TEXT_FIELDS] = df[self.TEXT_FIELDS].fillna('').astype(str)
+        df['keywords'] = [
+            list(matched) if pd.api.types.is_list_like(matched) and len(matched) else [keyword]
+            for matched, keyword in zip(df['keywords'], df['keyword'])
+        ]
+        for col in self.METRIC_FIELDS:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+        df['detail_crawled'] = df['detail_crawled'].fillna(False).astype(bool)
+        return df
+
+    @staticmethod
+    def _or_unavailable(metric: pd.Series) -> pd.Series:
+        """미수집(NA) 지표를 '수집불가'로 표시"""
+        return metric.astype(object).where(metric.notna(), '수집불가')
+
+    @staticmethod
+    def _sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+        """작성일 기준 최신순 정렬"""
+        if df.empty:
+            return df
+        return df.sort_values('작성일', ascending=False)
+
+    def _aggregate(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        정규화 프레임을 더할 수 있는 집계 테이블로 요약
+
+        - region_counts: 플랫폼 x 국내/해외 게시물 수
+        - keyword_stats: 플랫폼 x 키워드 게시물 수, 지표 합계,
+          조회수가 수집된(0 초과) 게시물 수와 그 조회수 합계
+        - daily_counts: 날짜 x 플랫폼 x 키워드 x 국내/해외 게시물 수
+
+        여러 키워드에 걸린 게시물은 키워드별 집계에서 키워드마다 한 번씩 센다.
+
+        Returns:
+            {테이블 이름: DataFrame} (AGGREGATE_COLUMNS 순서)
+        """
+        region_counts = (
+            df.groupby(['source', 'region'], as_index=False).size()
+            .rename(columns={'size': 'count'})
+        )
+
+        tagged = df.drop(columns='keyword').explode('keywords').rename(columns={'keywords': 'keyword'})
+        collected_views = tagged['views'].where((tagged['views'] > 0).fillna(False))
+        keyword_stats = (
+            tagged.assign(collected_views=collected_views)
+            .groupby(['source', 'keyword'], as_index=False)
+            .agg(
+                count=('post_url', 'size'),
+                views=('views', 'sum'),
+                likes=('likes', 'sum'),
+                comments=('comments', 'sum'),
+                retweets=('retweets', 'sum'),
+                views_collected=('collected_views', 'count'),
+                views_collected_sum=('collected_views', 'sum'),
+            )
+        )
+
+        trends = pd.DataFrame({
+            '날짜': tagged['post_date'],
+            '플랫폼': tagged['source'].map({self.NAVER: '네이버 블로그', self.TWITTER: 'Twitter'}),
+            '키워드': tagged['keyword'],
+            '국내/해외': tagged['region']
+        })
+        # 날짜별, 플랫폼별, 키워드별 집계
+        daily_counts = (
+            trends.groupby(['날짜', '플랫폼', '키워드', '국내/해외'], as_index=False).size()
+            .rename(columns={'size': '게시물 수'})
+        )
+
+        aggregates = {'region_counts': region_counts, 'keyword_stats': keyword_stats,
+                      'daily_counts': daily_counts}
+        return {name: aggregates[name][columns] for name, columns in self.AGGREGATE_COLUMNS.items()}
+
+    def _merge_aggregates(self, old: Dict[str, pd.DataFrame],
+                          new: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """누적 집계에 이번 실행분 집계를 더함 (같은 키끼리 합산)"""
+        merged = {}
+        for name, keys in self.AGGREGATE_KEYS.items():
+            frames = [frame for frame in (old[name], new[name]) if not frame.empty]
+            if len(frames) < 2:
+                merged[name] = frames[0] if frames else new[name]
+                continue
+            merged[name] = pd.concat(frames, ignore_index=True).groupby(keys, as_index=False).sum()
+        return merged
+
+    def _build_summary_frames(self, aggregates, keywords):
+        """전체 요약 시트: (플랫폼별 요약, 키워드별 게시물 수)"""
+        sources = [self.NAVER, self.TWITTER]
+
+        region_counts = aggregates['region_counts']
+        keyword_stats = aggregates['keyword_stats']
+
+        # 플랫폼별 요약: 플랫폼 x 국내/해외 교차표
+        totals = region_counts.groupby('source')['count'].sum().reindex(sources, fill_value=0)
+        by_region = self._pivot(region_counts, 'source', 'region', 'count', sources, ['국내', '해외'])
+
         summary_data = {
             '플랫폼': ['네이버 블로그', 'Twitter(X)', '전체'],
-            '총 게시물 수': [
-                len(naver_data),
-                len(twitter_data),
-                len(naver_data) + len(twitter_data)
-            ],
-            '국내 게시물': [
-                sum(1 for d in naver_data if d.get('region') == '국내'),
-                sum(1 for d in twitter_data if d.get('region') == '국내'),
-                sum(1 for d in naver_data if d.get('region') == '국내') + 
-                sum(1 for d in twitter_data if d.get('region') == '국내')
-            ],
-            '해외 게시물': [
-                sum(1 for d in naver_data if d.get('region') == '해외'),
-                sum(1 for d in twitter_data if d.get('region') == '해외'),
-                sum(1 for d in naver_data if d.get('region') == '해외') + 
-                sum(1 for d in twitter_data if d.get('region') == '해외')
-            ],
+            '총 게시물 수': [*totals.tolist(), int(totals.sum())],
+            '국내 게시물': [*by_region['국내'].tolist(), int(by_region['국내'].sum())],
+            '해외 게시물': [*by_region['해외'].tolist(), int(by_region['해외'].sum())],
             '수집 키워드 수': [len(keywords)] * 3,
             '수집 완료 시간': [datetime.now().strftime('%Y-%m-%d %H:%M:%S')] * 3
         }
-        
+
         df_summary = pd.DataFrame(summary_data)
-        df_summary.to_excel(writer, sheet_name='전체 요약', index=False)
-        
+
         # 키워드별 게시물 수
-        keyword_summary = []
-        for keyword in keywords:
-            naver_count = len([d for d in naver_data if d.get('keyword') == keyword])
-            twitter_count = len([d for d in twitter_data if d.get('keyword') == keyword])
-            
-            keyword_summary.append({
-                '키워드': keyword,
-                '네이버 블로그': naver_count,
-                'Twitter': twitter_count,
-                '합계': naver_count + twitter_count
-            })
-        
-        df_keywords = pd.DataFrame(keyword_summary)
-        
-        # 기존 시트에 추가 (빈 줄 2개 후)
-        startrow = len(df_summary) + 3
-        df_keywords.to_excel(writer, sheet_name='전체 요약', 
-                            startrow=startrow, index=False)
-    
-    def _create_integrated_sheet(self, writer, naver_data, twitter_data):
+        by_keyword = self._pivot(keyword_stats, 'keyword', 'source', 'count', keywords, sources)
+        df_keywords = pd.DataFrame({
+            '키워드': keywords,
+            '네이버 블로그': by_keyword[self.NAVER].to_numpy(),
+            'Twitter': by_keyword[self.TWITTER].to_numpy(),
+            '합계': by_keyword.sum(axis=1).to_numpy()
+        })
+
+        return df_summary, df_keywords
+
+    def _build_integrated_frame(self, df):
         """통합 데이터 시트 - 고객 요구사항에 맞춘 포맷"""
-        integrated = []
-        
-        # 네이버 블로그 데이터 추가
-        for item in naver_data:
-            integrated.append({
-                '국내/해외': item.get('region', '국내'),
-                '플랫폼': '네이버 블로그',
-                '채널명(ID)': item.get('blogger_name', ''),
-                '원문 링크': item.get('post_url', ''),
-                '조회수': item.get('views', 0) if item.get('views') is not None else '수집불가',
-                '좋아요 수': item.get('likes', 0) if item.get('likes') is not None else '수집불가',
-                '댓글 수': item.get('comments', 0) if item.get('comments') is not None else '수집불가',
-                '키워드': item.get('keyword', ''),
-                '제목': item.get('title', ''),
-                '작성일': item.get('post_date', ''),
-                '수집일시': item.get('collected_at', '')
-            })
-        
-        # 트위터 데이터 추가
-        for item in twitter_data:
-            integrated.append({
-                '국내/해외': item.get('region', '미분류'),
-                '플랫폼': 'Twitter(X)',
-                '채널명(ID)': f"@{item.get('channel_id', '')}",
-                '원문 링크': item.get('post_url', ''),
-                '조회수': item.get('views', 0),
-                '좋아요 수': item.get('likes', 0),
-                '댓글 수': item.get('comments', 0),
-                '키워드': item.get('keyword', ''),
-                '제목': item.get('text', '')[:100] + '...' if len(item.get('text', '')) > 100 else item.get('text', ''),
-                '작성일': item.get('post_date', ''),
-                '수집일시': item.get('collected_at', '')
-            })
-        
-        df = pd.DataFrame(integrated)
-        
+        is_naver = df['source'] == self.NAVER
+
+        # 네이버는 미수집 지표를 '수집불가'로, 트위터는 0으로 표시
+        def metric(col):
+            return self._or_unavailable(df[col]).where(is_naver, df[col].fillna(0).astype(object))
+
+        # 트위터는 트윗 본문을 100자로 잘라 제목으로 사용
+        text = df['text'].where(df['text'].str.len() <= 100, df['text'].str[:100] + '...')
+
+        integrated = pd.DataFrame({
+            '국내/해외': df['region'],
+            '플랫폼': is_naver.map({True: '네이버 블로그', False: 'Twitter(X)'}),
+            '채널명(ID)': df['blogger_name'].where(is_naver, '@' + df['channel_id']),
+            '원문 링크': df['post_url'],
+            '조회수': metric('views'),
+            '좋아요 수': metric('likes'),
+            '댓글 수': metric('comments'),
+            '키워드': df['keywords'].map(', '.join),
+            '제목': df['title'].where(is_naver, text),
+            '작성일': df['post_date'],
+            '수집일시': df['collected_at']
+        })
+
         # 날짜순 정렬 (최신순)
-        if not df.empty and '작성일' in df.columns:
-            df = df.sort_values('작성일', ascending=False)
-        
-        df.to_excel(writer, sheet_name='통합 데이터', index=False)
-    
-    def _create_naver_sheet(self, writer, naver_data):
+        return self._sort_by_date(integrated)
+
+    def _build_naver_frame(self, df):
         """네이버 블로그 상세 시트"""
-        naver_formatted = []
-        
-        for item in naver_data:
-            naver_formatted.append({
-                '국내/해외': item.get('region', '국내'),
-                '블로거명': item.get('blogger_name', ''),
-                '블로그 ID': item.get('blogger_id', ''),
-                '원문 링크': item.get('post_url', ''),
-                '제목': item.get('title', ''),
-                '내용 미리보기': item.get('description', ''),
-                '조회수': item.get('views', 0) if item.get('views') is not None else '수집불가',
-                '좋아요 수': item.get('likes', 0) if item.get('likes') is not None else '수집불가',
-                '댓글 수': item.get('comments', 0) if item.get('comments') is not None else '수집불가',
-                '키워드': item.get('keyword', ''),
-                '작성일': item.get('post_date', ''),
-                '수집일시': item.get('collected_at', ''),
-                '상세크롤링': '성공' if item.get('detail_crawled') else '실패'
-            })
-        
-        df = pd.DataFrame(naver_formatted)
-        
+        naver = df[df['source'] == self.NAVER]
+
+        naver_formatted = pd.DataFrame({
+            '국내/해외': naver['region'],
+            '블로거명': naver['blogger_name'],
+            '블로그 ID': naver['blogger_id'],
+            '원문 링크': naver['post_url'],
+            '제목': naver['title'],
+            '내용 미리보기': naver['description'],
+            '조회수': self._or_unavailable(naver['views']),
+            '좋아요 수': self._or_unavailable(naver['likes']),
+            '댓글 수': self._or_unavailable(naver['comments']),
+            '키워드': naver['keywords'].map(', '.join),
+            '작성일': naver['post_date'],
+            '수집일시': naver['collected_at'],
+            '상세크롤링': naver['detail_crawled'].map({True: '성공', False: '실패'})
+        })
+
         # 날짜순 정렬
-        if not df.empty and '작성일' in df.columns:
-            df = df.sort_values('작성일', ascending=False)
-        
-        df.to_excel(writer, sheet_name='네이버 블로그', index=False)
-    
-    def _create_twitter_sheet(self, writer, twitter_data):
+        return self._sort_by_date(naver_formatted)
+
+    def _build_twitter_frame(self, df):
         """트위터 상세 시트"""
-        twitter_formatted = []
-        
-        for item in twitter_data:
-            twitter_formatted.append({
-                '국내/해외': item.get('region', '미분류'),
-                '사용자명': item.get('channel_name', ''),
-                '사용자 ID': f"@{item.get('channel_id', '')}",
-                '원문 링크': item.get('post_url', ''),
-                '트윗 내용': item.get('text', ''),
-                '조회수': item.get('views', 0),
-                '좋아요 수': item.get('likes', 0),
-                '댓글 수': item.get('comments', 0),
-                '리트윗 수': item.get('retweets', 0),
-                '키워드': item.get('keyword', ''),
-                '작성일': item.get('post_date', ''),
-                '수집일시': item.get('collected_at', '')
-            })
-        
-        df = pd.DataFrame(twitter_formatted)
-        
+        twitter = df[df['source'] == self.TWITTER]
+
+        twitter_formatted = pd.DataFrame({
+            '국내/해외': twitter['region'],
+            '사용자명': twitter['channel_name'],
+            '사용자 ID': '@' + twitter['channel_id'],
+            '원문 링크': twitter['post_url'],
+            '트윗 내용': twitter['text'],
+            '조회수': twitter['views'].fillna(0),
+            '좋아요 수': twitter['likes'].fillna(0),
+            '댓글 수': twitter['comments'].fillna(0),
+            '리트윗 수': twitter['retweets'].fillna(0),
+            '키워드': twitter['keywords'].map(', '.join),
+            '작성일': twitter['post_date'],
+            '수집일시': twitter['collected_at']
+        })
+
         # 날짜순 정렬
-        if not df.empty and '작성일' in df.columns:
-            df = df.sort_values('작성일', ascending=False)
-        
-        df.to_excel(writer, sheet_name='Twitter', index=False)
-    
-    def _create_hashtag_analysis_sheet(self, writer, naver_data, twitter_data, keywords):
+        return self._sort_by_date(twitter_formatted)
+
+    def _build_hashtag_analysis_frame(self, aggregates, keywords):
         """해시태그별 분석 시트"""
-        analysis = []
-        
-        for keyword in keywords:
-            naver_posts = [d for d in naver_data if d.get('keyword') == keyword]
-            twitter_posts = [d for d in twitter_data if d.get('keyword') == keyword]
-            
-            # 트위터 참여 지표
-            total_views = sum([t.get('views', 0) for t in twitter_posts])
-            total_likes = sum([t.get('likes', 0) for t in twitter_posts])
-            total_comments = sum([t.get('comments', 0) for t in twitter_posts])
-            total_retweets = sum([t.get('retweets', 0) for t in twitter_posts])
-            
-            # 네이버 참여 지표 (수집된 것만)
-            naver_views = [n.get('views', 0) for n in naver_posts if n.get('views') is not None and n.get('views') > 0]
-            naver_likes = [n.get('likes', 0) for n in naver_posts if n.get('likes') is not None and n.get('likes') > 0]
-            naver_comments = [n.get('comments', 0) for n in naver_posts if n.get('comments') is not None and n.get('comments') > 0]
-            
-            analysis.append({
-                '키워드': keyword,
-                '네이버 게시물 수': len(naver_posts),
-                '트위터 게시물 수': len(twitter_posts),
-                '총 게시물 수': len(naver_posts) + len(twitter_posts),
-                '트위터 총 조회수': total_views,
-                '트위터 총 좋아요': total_likes,
-                '트위터 총 댓글': total_comments,
-                '트위터 총 리트윗': total_retweets,
-                '트위터 평균 조회수': round(total_views / len(twitter_posts), 1) if twitter_posts else 0,
-                '네이버 조회수 수집': f"{len(naver_views)}/{len(naver_posts)}",
-                '네이버 평균 조회수': round(sum(naver_views) / len(naver_views), 1) if naver_views else 0
-            })
-        
-        df = pd.DataFrame(analysis)
-        df.to_excel(writer, sheet_name='해시태그 분석', index=False)
-    
-    def _create_daily_trends_sheet(self, writer, naver_data, twitter_data):
-        """일별 트렌드 시트"""
-        all_data = []
-        
-        # 네이버 데이터
-        for item in naver_data:
-            all_data.append({
-                '날짜': item.get('post_date', ''),
-                '플랫폼': '네이버 블로그',
-                '키워드': item.get('keyword', ''),
-                '국내/해외': item.get('region', '국내')
-            })
-        
-        # 트위터 데이터
-        for item in twitter_data:
-            all_data.append({
-                '날짜': item.get('post_date', ''),
-                '플랫폼': 'Twitter',
-                '키워드': item.get('keyword', ''),
-                '국내/해외': item.get('region', '미분류')
-            })
-        
-        if not all_data:
-            return
-        
-        df = pd.DataFrame(all_data)
-        
-        # 날짜별, 플랫폼별, 키워드별 집계
-        daily_counts = df.groupby(['날짜', '플랫폼', '키워드', '국내/해외']).size().reset_index(name='게시물 수')
-        daily_counts = daily_counts.sort_values(['날짜', '플랫폼'], ascending=[False, True])
-        
-        daily_counts.to_excel(writer, sheet_name='일별 트렌드', index=False)
+        keyword_stats = aggregates['keyword_stats']
+
+        def by_keyword(source):
+            stats = keyword_stats[keyword_stats['source'] == source].set_index('keyword')
+            metrics = stats.drop(columns='source').reindex(keywords).fillna(0)
+            return metrics.astype('int64')
+
+        # 트위터 참여 지표: 키워드별 게시물 수와 지표 합계
+        twitter_stats = by_keyword(self.TWITTER)
+        twitter_count = twitter_stats['count']
+        twitter_avg_views = (
+            (twitter_stats['views'] / twitter_count.where(twitter_count > 0))
+            .round(1).fillna(0)
+        )
+
+        # 네이버 참여 지표 (조회수가 수집되고 0보다 큰 것만 평균에 포함)
+        naver_stats = by_keyword(self.NAVER)
+        naver_count = naver_stats['count']
+        views_collected = naver_stats['views_collected']
+        naver_avg_views = (
+            (naver_stats['views_collected_sum'] / views_collected.where(views_collected > 0))
+            .round(1).fillna(0)
+        )
+
+        analysis = pd.DataFrame({
+            '키워드': keywords,
+            '네이버 게시물 수': naver_count.to_numpy(),
+            '트위터 게시물 수': twitter_count.to_numpy(),
+            '총 게시물 수': (naver_count + twitter_count).to_numpy(),
+            '트위터 총 조회수': twitter_stats['views'].to_numpy(),
+            '트위터 총 좋아요': twitter_stats['likes'].to_numpy(),
+            '트위터 총 댓글': twitter_stats['comments'].to_numpy(),
+            '트위터 총 리트윗': twitter_stats['retweets'].to_numpy(),
+            '트위터 평균 조회수': twitter_avg_views.to_numpy(),
+            '네이버 조회수 수집': (views_collected.astype(str) + '/' + naver_count.astype(str)).to_numpy(),
+            '네이버 평균 조회수': naver_avg_views.to_numpy()
+        })
+
+        return analysis
+
+    def _build_daily_trends_frame(self, aggregates):
+        """일별 트렌드 시트 (데이터가 없으면 None)"""
+        daily_counts = aggregates['daily_counts']
+        if daily_counts.empty:
+            return None
+
+        return daily_counts.sort_values(['날짜', '플랫폼'], ascending=[False, True])
+
+    @staticmethod
+    def _pivot(frame: pd.DataFrame, index: str, columns: str, values: str,
+               index_labels: List[str], column_labels: List[str]) -> pd.DataFrame:
+        """집계 테이블을 index x columns 정수 교차표로 (없는 칸은 0)"""
+        table = frame.groupby([index, columns])[values].sum().unstack(columns)
+        table = table.reindex(index=index_labels, columns=column_labels)
+        return table.fillna(0).astype('int64')
@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from .atomic_file import save_json
+
+
+class InstanceHealthStore:
+    """Nitter 인스턴스 상태표 (응답 시간, 성공률, 마지막 확인 시각)
+
+    전체 점검(probe) 결과와 실제 검색 결과(record)를 함께 반영하고 JSON 파일에 저장한다.
+    점검한 지 ttl_hours가 지나지 않았으면 시작할 때 다시 점검하지 않고 저장된 표에서
+    빠르고 안정적인 인스턴스를 고른다.
+    """
+
+    # 응답 시간/성공률 지수 이동 평균 가중치 (최근 결과 비중)
+    ALPHA = 0.3
+
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0'
+
+    def __init__(self, path: str = 'data/nitter_instances.json', ttl_hours: float = 6.0,
+                 min_success: float = 0.5):
+        """
+        Args:
+            path: 상태표 JSON 파일 경로
+            ttl_hours: 전체 점검 결과 유효 시간 (시간)
+            min_success: 정상으로 볼 최소 성공률 (0~1)
+        """
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.min_success = min_success
+        self.checked_at = 0.0
+        self.instances: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.checked_at = state.get('checked_at', 0.0)
+            self.instances = state.get('instances', {})
+
+    @property
+    def is_fresh(self) -> bool:
+        """마지막 전체 점검이 TTL 안인지"""
+        return bool(self.instances) and time.time() - self.checked_at < self.ttl
+
+    def record(self, instance: str, ok: bool, latency: Optional[float] = None):
+        """
+        인스턴스 요청 결과 반영
+
+        Args:
+            instance: 인스턴스 URL
+            ok: 성공 여부
+            latency: 응답 시간 (초, 모르면 None)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self.instances.get(instance)
+            if entry is None:
+                entry = self.instances[instance] = {
+                    'latency': latency, 'success_rate': 1.0 if ok else 0.0, 'checks': 0,
+                    'last_check': now, 'last_ok': None
+                }
+            else:
+                entry['success_rate'] += self.ALPHA * ((1.0 if ok else 0.0) - entry['success_rate'])
+                if latency is not None:
+                    previous = entry.get('latency')
+                    entry['latency'] = latency if previous is None else previous + self.ALPHA * (latency - previous)
+
+            entry['checks'] += 1
+            entry['last_check'] = now
+            if ok:
+                entry['last_ok'] = now
+
+    def probe(self, instances: Iterable[str], endpoint: str = '/x', timeout: float = 10.0,
+              workers: int = 16) -> List[str]:
+        """
+        인스턴스 전체 점검 (동시에 요청해 응답 시간과 타임라인 여부 확인)
+
+        Args:
+            instances: 점검할 인스턴스 URL
+            endpoint: 요청할 경로 (타임라인이 있는 페이지)
+            timeout: 요청 타임아웃 (초)
+            workers: 동시에 점검할 인스턴스 수
+
+        Returns:
+            정상 인스턴스 (빠른 순)
+        """
+        instances = list(dict.fromkeys(instances))
+
+        def check(instance):
+            started = time.perf_counter()
+            try:
+                r = requests.get(instance + endpoint, headers={'User-Agent': self.USER_AGENT},
+                                 cookies={'hlsPlayback': 'on'}, timeout=timeout)
+                ok = r.ok and 'timeline-item' in r.text
+            except requests.RequestException:
+                ok = False
+            self.record(instance, ok, time.perf_counter() - started if ok else None)
+
+        if instances:
+            with ThreadPoolExecutor(max_workers=min(workers, len(instances))) as executor:
+                list(executor.map(check, instances))
+
+        self.checked_at = time.time()
+        return self.ranked(instances)
+
+    def ranked(self, instances: Optional[Iterable[str]] = None, limit: Optional[int] = None) -> List[str]:
+        """
+        정상 인스턴스를 응답 시간 순으로 정렬
+
+        Args:
+            instances: 후보 (None이면 상태표의 전체 인스턴스)
+            limit: 최대 개수
+
+        Returns:
+            성공률이 min_success 이상인 인스턴스 URL 리스트 (빠른 순)
+        """
+        with self._lock:
+            candidates = self.instances if instances is None else {
+                i: self.instances[i] for i in instances if i in self.instances
+            }
+            healthy = [
+                (entry['latency'], instance) for instance, entry in candidates.items()
+                if entry['success_rate'] >= self.min_success and entry.get('latency') is not None
+            ]
+
+        healthy.sort()
+        ranked = [instance for _, instance in healthy]
+        return ranked[:limit] if limit else ranked
+
+    def save(self):
+        """상태표 저장"""
+        with self._lock:
+            state = {
+                'checked_at': self.checked_at,
+                'instances': {instance: dict(entry) for instance, entry in self.instances.items()}
+            }
+
+        save_json(self.path, state)
@@ -0,0 +1,86 @@
+import json
+import os
+from typing import Dict, Iterable, Iterator
+
+
+class JsonlWriter:
+    """레코드를 한 줄에 하나씩 JSONL 파일에 이어 쓰는 writer
+
+    flush_every개마다 디스크로 내보내므로 실행 중에도 `tail -f`로 확인할 수 있고,
+    중간에 프로세스가 죽어도 그때까지 쓴 레코드는 남는다.
+    """
+
+    def __init__(self, path: str, flush_every: int = 100):
+        """
+        Args:
+            path: 출력 JSONL 파일 경로
+            flush_every: 몇 개마다 flush 할지
+        """
+        self.path = path
+        self.flush_every = max(1, flush_every)
+        self.count = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, record: Dict):
+        """레코드 1개 기록 (dict 또는 to_dict()가 있는 레코드)"""
+        if hasattr(record, 'to_dict'):
+            record = record.to_dict()
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def write_all(self, records: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        레코드를 기록하면서 그대로 다음 단계로 넘기는 제너레이터
+
+        Args:
+            records: 레코드 이터러블 (크롤러 제너레이터 등)
+
+        Yields:
+            기록된 레코드
+        """
+        for record in records:
+            self.write(record)
+            yield record
+
+    def close(self):
+        """남은 내용을 flush 하고 파일 닫기"""
+        if not self._file.closed:
+            self._file.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_jsonl(path: str) -> Iterator[Dict]:
+    """
+    JSONL 파일을 레코드 단위로 읽기 (중단 시점에 잘린 마지막 줄은 무시)
+
+    Args:
+        path: JSONL 파일 경로
+
+    Yields:
+        레코드 dict
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
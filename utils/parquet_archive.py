@@ -0,0 +1,147 @@
+import os
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from .records import records_to_frame
+
+
+class ParquetArchive:
+    """수집한 게시물을 플랫폼/수집일로 파티션한 Parquet 데이터셋에 누적 저장
+
+    디렉터리 구조:
+        {root}/source=naver/collected_date=YYYY-MM-DD/part-*.parquet
+        {root}/source=twitter/collected_date=YYYY-MM-DD/part-*.parquet
+
+    load()는 필요한 컬럼과 날짜 파티션만 읽는다 (컬럼 프로젝션 + 조건 푸시다운).
+    """
+
+    # NaverBlogCrawler / NaverBlogDetailCrawler가 만드는 레코드
+    NAVER_SCHEMA = pa.schema([
+        ('platform', pa.string()),
+        ('region', pa.string()),
+        ('keyword', pa.string()),
+        ('title', pa.string()),
+        ('description', pa.string()),
+        ('blogger_name', pa.string()),
+        ('blogger_id', pa.string()),
+        ('post_url', pa.string()),
+        ('post_date', pa.string()),
+        ('collected_at', pa.timestamp('s')),
+        ('views', pa.int64()),
+        ('comments', pa.int64()),
+        ('likes', pa.int64()),
+        ('detail_crawled', pa.bool_()),
+    ])
+
+    # TwitterCrawler가 만드는 레코드
+    TWITTER_SCHEMA = pa.schema([
+        ('platform', pa.string()),
+        ('region', pa.string()),
+        ('keyword', pa.string()),
+        ('keywords', pa.list_(pa.string())),
+        ('channel_name', pa.string()),
+        ('channel_id', pa.string()),
+        ('tweet_id', pa.string()),
+        ('text', pa.string()),
+        ('post_url', pa.string()),
+        ('post_date', pa.string()),
+        ('views', pa.int64()),
+        ('likes', pa.int64()),
+        ('comments', pa.int64()),
+        ('retweets', pa.int64()),
+        ('collected_at', pa.timestamp('s')),
+    ])
+
+    SCHEMAS = {'naver': NAVER_SCHEMA, 'twitter': TWITTER_SCHEMA}
+    PARTITIONING = ds.partitioning(pa.schema([('collected_date', pa.string())]), flavor='hive')
+
+    def __init__(self, root: str = 'data/archive'):
+        """
+        Args:
+            root: 데이터셋 루트 디렉터리
+        """
+        self.root = root
+
+    def append(self, records: Iterable[Dict], platform: str) -> int:
+        """
+        레코드를 수집일 파티션에 추가 (기존 파일은 건드리지 않음)
+
+        Args:
+            records: 레코드 이터러블 (크롤러가 만든 dict)
+            platform: 'naver' 또는 'twitter'
+
+        Returns:
+            저장한 레코드 수
+        """
+        path = self._platform_dir(platform)
+        schema = self.SCHEMAS[platform]
+        df = records_to_frame(list(records), schema.names)
+        if df.empty:
+            return 0
+
+        df['collected_at'] = pd.to_datetime(df['collected_at'], errors='coerce')
+        df['collected_date'] = df['collected_at'].dt.strftime('%Y-%m-%d').fillna('unknown')
+
+        table = pa.Table.from_pandas(
+            df, schema=schema.append(pa.field('collected_date', pa.string())), preserve_index=False
+        )
+
+        ds.write_dataset(
+            table,
+            path,
+            format='parquet',
+            partitioning=self.PARTITIONING,
+            basename_template=f"part-{datetime.now().strftime('%Y%m%d_%H%M%S')}-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+        )
+        return table.num_rows
+
+    def load(self, platform: str, columns: Optional[List[str]] = None,
+             start_date: Optional[str] = None, end_date: Optional[str] = None,
+             where: Optional[ds.Expression] = None) -> pd.DataFrame:
+        """
+        아카이브 조회
+
+        Args:
+            platform: 'naver' 또는 'twitter'
+            columns: 읽을 컬럼 (None이면 전체)
+            start_date: 수집일 시작 (YYYY-MM-DD, 포함)
+            end_date: 수집일 끝 (YYYY-MM-DD, 포함)
+            where: 추가 조건 (예: ds.field('keyword') == '해시태그')
+
+        Returns:
+            조회 결과 DataFrame
+        """
+        path = self._platform_dir(platform)
+        if not os.path.isdir(path):
+            return pd.DataFrame(columns=columns or self.SCHEMAS[platform].names)
+
+        dataset = ds.dataset(
+            path,
+            format='parquet',
+            partitioning=self.PARTITIONING,
+            schema=self.SCHEMAS[platform].append(pa.field('collected_date', pa.string())),
+        )
+
+        # 수집일 조건은 파티션 경로로 걸러지므로 해당 날짜 파일만 읽음
+        expression = where
+        if start_date:
+            expression = self._and(expression, ds.field('collected_date') >= start_date)
+        if end_date:
+            expression = self._and(expression, ds.field('collected_date') <= end_date)
+
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+    def _platform_dir(self, platform: str) -> str:
+        if platform not in self.SCHEMAS:
+            raise ValueError(f"지원하지 않는 플랫폼: {platform} (naver 또는 twitter)")
+        return os.path.join(self.root, f'source={platform}')
+
+    @staticmethod
+    def _and(left: Optional[ds.Expression], right: ds.Expression) -> ds.Expression:
+        return right if left is None else left & right
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """호스트별 최소 요청 간격을 보장하는 스레드 안전 rate limiter
+
+    여러 워커가 같은 인스턴스를 공유하면 워커 수와 관계없이
+    한 호스트가 받는 요청 빈도는 1 / min_interval 을 넘지 않는다.
+    """
+
+    def __init__(self, min_interval: float = 2.0):
+        """
+        Args:
+            min_interval: 같은 호스트로 보내는 요청 사이 최소 간격 (초)
+        """
+        self.min_interval = max(0.0, min_interval)
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> float:
+        """
+        url의 호스트에 요청을 보낼 수 있을 때까지 대기
+
+        Args:
+            url: 요청할 URL
+
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        host = urlparse(url).netloc or url
+
+        # 슬롯만 잠금 안에서 예약하고, 대기는 잠금 밖에서 수행
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+
+        wait_time = slot - now
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+
+class TokenBucket:
+    """초당 rate개의 토큰을 채우는 스레드 안전 토큰 버킷
+
+    API 호출 한도(예: 네이버 검색 API 초당 10회)를 여러 스레드가 공유할 때 사용.
+    """
+
+    def __init__(self, rate: float = 10.0, capacity: float = None):
+        """
+        Args:
+            rate: 초당 채워지는 토큰 수 (허용 요청 수)
+            capacity: 버킷 크기 (순간적으로 몰아서 보낼 수 있는 최대 요청 수, 기본값 rate)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 얻을 때까지 대기
+
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                wait_time = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait_time)
+            waited += wait_time
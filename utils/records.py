@@ -0,0 +1,136 @@
+"""
+수집 레코드 타입 (네이버 블로그 포스트, 트윗)
+
+레코드마다 키 문자열을 가진 dict 대신 __slots__ dataclass를 사용해 레코드당 메모리를
+몇 배 줄인다. 기존 코드가 쓰던 record['views'], record.get('region') 같은 dict 방식
+접근도 그대로 지원하고, JSONL/JSON으로 보낼 때는 to_dict()를 사용한다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .text import DOMESTIC, OVERSEAS
+
+
+class Platform:
+    """플랫폼 이름 (모든 레코드가 같은 문자열 객체를 공유)"""
+    NAVER_BLOG = '네이버 블로그'
+    TWITTER = 'Twitter(X)'
+
+
+class Region:
+    """국내/해외 구분 (utils.text 분류 결과와 같은 문자열 객체)"""
+    DOMESTIC = DOMESTIC
+    OVERSEAS = OVERSEAS
+
+
+def collected_at_now() -> str:
+    """수집일시 문자열 (페이지/배치마다 한 번 만들어 레코드끼리 공유)"""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+class Record:
+    """dict처럼 읽고 쓸 수 있는 slots 레코드 공통 기능 (필드 순서 = __slots__ 순서)"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+    def to_dict(self) -> Dict[str, Any]:
+        """필드 순서대로 dict로 변환 (JSONL 기록용)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def columns(cls, records: Sequence['Record']) -> Dict[str, List[Any]]:
+        """
+        레코드 목록을 필드별 리스트로 변환 (레코드마다 dict를 만들지 않고 pd.DataFrame에 바로 사용)
+
+        Returns:
+            {필드명: 값 리스트}
+        """
+        return {name: [getattr(r, name) for r in records] for name in cls.__slots__}
+
+
+@dataclass(slots=True, kw_only=True, eq=False)
+class NaverPost(Record):
+    """네이버 블로그 포스트 (views/comments/likes/detail_crawled는 상세 크롤링에서 채움)"""
+    platform: str = Platform.NAVER_BLOG
+    region: str = Region.DOMESTIC
+    keyword: str
+    title: str
+    description: str
+    blogger_name: str
+    blogger_id: str
+    post_url: str
+    post_date: str
+    collected_at: str
+    views: Optional[int] = None
+    comments: Optional[int] = None
+    likes: Optional[int] = None
+    detail_crawled: Optional[bool] = None
+
+
+@dataclass(slots=True, kw_only=True, eq=False)
+class Tweet(Record):
+    """트윗 (keyword는 처음 걸린 키워드, keywords는 걸린 키워드 전체)"""
+    platform: str = Platform.TWITTER
+    region: str
+    keyword: str
+    keywords: List[str]
+    channel_name: str
+    channel_id: str
+    tweet_id: str
+    text: str
+    post_url: str
+    post_date: str
+    views: int
+    likes: int
+    comments: int
+    retweets: int
+    collected_at: str
+
+
+def records_to_frame(records: Sequence, columns: List[str]) -> 'pd.DataFrame':
+    """
+    레코드 목록을 DataFrame으로 변환
+
+    같은 타입의 Record 목록은 필드별 리스트로 바로 만들고(레코드별 dict 변환 없음),
+    dict(JSONL에서 읽은 레코드 등)는 pd.DataFrame.from_records로 만든다.
+
+    Args:
+        records: Record 또는 dict 리스트
+        columns: 결과 컬럼 (레코드에 없는 컬럼은 NaN)
+
+    Returns:
+        columns 순서의 DataFrame
+    """
+    import pandas as pd  # 레코드 생성(크롤러)만 할 때는 pandas를 불러오지 않음
+
+    if records and isinstance(records[0], Record) and all(type(r) is type(records[0]) for r in records):
+        data = type(records[0]).columns(records)
+        return pd.DataFrame({name: data[name] if name in data else None for name in columns},
+                            columns=columns, index=pd.RangeIndex(len(records)))
+    return pd.DataFrame.from_records(
+        [r.to_dict() if isinstance(r, Record) else r for r in records], columns=columns
+    )
@@ -0,0 +1,89 @@
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class AlreadyRunningError(RuntimeError):
+    """다른 프로세스가 이미 잠금을 가지고 있음"""
+
+
+class RunLock:
+    """lock 파일로 수집 실행이 겹치지 않게 막는 프로세스 간 잠금
+
+    OS 파일 잠금(flock / msvcrt.locking)을 사용하므로 프로세스가 비정상 종료되어도
+    잠금이 자동으로 풀린다. 파일에는 잠금을 가진 프로세스의 PID를 기록한다.
+    """
+
+    def __init__(self, path: str = 'data/main.lock'):
+        """
+        Args:
+            path: lock 파일 경로
+        """
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        """
+        잠금 시도 (기다리지 않음)
+
+        Returns:
+            잠금을 얻었으면 True, 다른 프로세스가 가지고 있으면 False
+        """
+        if self._file is not None:
+            return True
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        f = open(self.path, 'a+')
+        try:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            f.close()
+            return False
+
+        f.seek(0)
+        f.truncate()
+        f.write(str(os.getpid()))
+        f.flush()
+        self._file = f
+        return True
+
+    def release(self):
+        """잠금 해제"""
+        if self._file is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def holder(self) -> str:
+        """잠금을 가진 프로세스의 PID (모르면 빈 문자열)"""
+        try:
+            with open(self.path, 'r') as f:
+                return f.read().strip()
+        except OSError:
+            return ''
+
+    def __enter__(self):
+        if not self.acquire():
+            raise AlreadyRunningError(f"이미 실행 중입니다 (PID {self.holder() or '?'}, {self.path})")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class StatsCache:
+    """포스트별 상세 정보(조회수/댓글/좋아요) SQLite 캐시
+
+    수집 시각 기준 TTL이 지난 항목은 없는 것으로 취급하고,
+    항목 수가 max_entries를 넘으면 오래된 것부터 삭제한다.
+    """
+
+    def __init__(self, path: str = 'data/stats_cache.sqlite', ttl_hours: float = 24.0,
+                 max_entries: int = 100000):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttl_hours: 캐시 유효 시간 (시간)
+            max_entries: 최대 저장 항목 수
+        """
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 상세 크롤링 워커 스레드에서도 쓰므로 잠금으로 직렬화
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS post_stats (
+                post_key TEXT PRIMARY KEY,
+                views INTEGER,
+                comments INTEGER,
+                likes INTEGER,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_post_stats_fetched_at ON post_stats (fetched_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        캐시 조회
+
+        Returns:
+            {'views', 'comments', 'likes', 'fetched_at'} 또는 없거나 만료되었으면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT views, comments, likes, fetched_at FROM post_stats WHERE post_key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None or time.time() - row[3] > self.ttl:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return {'views': row[0], 'comments': row[1], 'likes': row[2], 'fetched_at': row[3]}
+
+    def put(self, key: str, stats: Dict):
+        """상세 정보 저장 (같은 키는 덮어씀)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO post_stats (post_key, views, comments, likes, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, stats.get('views'), stats.get('comments'), stats.get('likes'), time.time())
+            )
+            self._conn.commit()
+
+    def evict(self) -> int:
+        """
+        만료된 항목과 max_entries를 넘는 오래된 항목 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM post_stats WHERE fetched_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+            deleted += self._conn.execute(
+                "DELETE FROM post_stats WHERE post_key IN ("
+                "SELECT post_key FROM post_stats ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            ).rowcount
+            self._conn.commit()
+        return deleted
+
+    @property
+    def hit_rate(self) -> float:
+        """이번 실행의 캐시 적중률 (0~1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def close(self):
+        """정리 후 연결 종료"""
+        self.evict()
+        with self._lock:
+            self._conn.close()
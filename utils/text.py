@@ -0,0 +1,133 @@
+"""
+크롤러 공용 텍스트 처리 (HTML 정리, 한글 판별, 국내/해외 분류)
+
+정규식은 모듈을 불러올 때 한 번만 컴파일한다.
+
+    python -m utils.text [레코드 수]    # 마이크로벤치마크 (기본 1,000,000개)
+"""
+
+import html
+import re
+from functools import lru_cache
+from typing import Iterable, List
+
+KOREAN_PATTERN = re.compile(r'[ㄱ-ㅎㅏ-ㅣ가-힣]')
+# 태그와 HTML 엔티티(이름/10진/16진)를 한 번에 찾는 패턴
+MARKUP_PATTERN = re.compile(r'<[^<]+?>|&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[0-9A-Za-z]+);')
+
+DOMESTIC = '국내'
+OVERSEAS = '해외'
+
+
+# 자주 나오는 엔티티는 몇 개 안 되므로 캐시 (&#숫자; 같은 드문 엔티티가 쌓이지 않게 크기 제한)
+@lru_cache(maxsize=256)
+def _unescape_entity(entity: str) -> str:
+    # &nbsp;는 일반 공백으로
+    return html.unescape(entity).replace('\xa0', ' ')
+
+
+def _replace_markup(match) -> str:
+    markup = match.group()
+    if markup[0] == '<':
+        return ''
+    return _unescape_entity(markup)
+
+
+def clean_html(text: str) -> str:
+    """
+    HTML 태그를 지우고 모든 HTML 엔티티(&amp;, &#39;, &#x27;, &hellip; 등)를 한 번에 변환
+
+    Args:
+        text: 검색 API 제목/요약 같은 HTML 조각
+
+    Returns:
+        앞뒤 공백을 제거한 일반 텍스트
+    """
+    if not text:
+        return ""
+    return MARKUP_PATTERN.sub(_replace_markup, text).strip()
+
+
+def contains_korean(text: str) -> bool:
+    """텍스트에 한글이 포함되어 있는지 확인"""
+    # 한글은 ASCII가 아니므로 ASCII 텍스트는 정규식 없이 바로 제외
+    return bool(text) and not text.isascii() and KOREAN_PATTERN.search(text) is not None
+
+
+def classify_region(text: str) -> str:
+    """한글이 포함되어 있으면 '국내', 아니면 '해외'"""
+    return DOMESTIC if contains_korean(text) else OVERSEAS
+
+
+def classify_regions(texts: Iterable[str]) -> List[str]:
+    """
+    텍스트 목록을 한 번에 국내/해외로 분류 (레코드마다 함수를 호출하지 않음)
+
+    Args:
+        texts: 트윗 본문 등 (None/빈 문자열은 '해외')
+
+    Returns:
+        texts와 같은 순서의 '국내'/'해외' 리스트
+    """
+    search = KOREAN_PATTERN.search
+    return [
+        DOMESTIC if text and not text.isascii() and search(text) else OVERSEAS
+        for text in texts
+    ]
+
+
+def _benchmark(count: int):
+    """레코드마다 정규식을 컴파일하던 방식과 비교"""
+    import time
+
+    samples = [
+        '오늘 #해시태그 이벤트 참여했어요 https://t.co/abc',
+        'Check out the #hashtag event today! https://t.co/xyz',
+        'ライブ最高でした #hashtag',
+        'Great show tonight 🎉 다음에 또 봐요',
+    ]
+    texts = [samples[i % len(samples)] + str(i) for i in range(count)]
+
+    def per_record_compile(text):
+        if not text:
+            return False
+        korean_pattern = re.compile('[ㄱ-ㅎㅏ-ㅣ가-힣]')
+        return bool(korean_pattern.search(text))
+
+    def timed(label, func):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        print(f"   {label:<28} {elapsed:7.3f}초  ({elapsed / count * 1e9:6.0f} ns/레코드)")
+        return result
+
+    print(f"📏 국내/해외 분류: 트윗 {count:,}개")
+    before = timed('레코드마다 re.compile', lambda: ['국내' if per_record_compile(t) else '해외' for t in texts])
+    single = timed('classify_region (사전 컴파일)', lambda: [classify_region(t) for t in texts])
+    batched = timed('classify_regions (일괄)', lambda: classify_regions(texts))
+    assert before == single == batched
+
+    html_samples = [
+        '<b>해시태그</b> 이벤트 후기 남겨요',
+        '오늘 다녀온 <b>해시태그</b> 카페 &quot;최고&quot;',
+        '평범한 일상 기록',
+        '맛집 &amp; 카페 <b>해시태그</b>',
+    ]
+    html_texts = [html_samples[i % len(html_samples)] for i in range(count)]
+
+    def chained_replace(text):
+        text = re.sub('<[^<]+?>', '', text)
+        for entity, char in (('&nbsp;', ' '), ('&lt;', '<'), ('&gt;', '>'),
+                             ('&amp;', '&'), ('&quot;', '"'), ('&#39;', "'")):
+            text = text.replace(entity, char)
+        return text.strip()
+
+    print(f"📏 HTML 정리: {count:,}개")
+    timed('re.sub + str.replace 6회', lambda: [chained_replace(t) for t in html_texts])
+    timed('clean_html', lambda: [clean_html(t) for t in html_texts])
+
+
+if __name__ == '__main__':
+    import sys
+
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
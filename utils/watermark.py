@@ -0,0 +1,108 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from .atomic_file import save_json
+
+
+class WatermarkStore:
+    """키워드별 마지막 수집 위치(가장 최근 post_date와 그 날짜의 post_url) 저장소
+
+    네이버 검색 API는 날짜순(최신순)으로 결과를 주므로, 워터마크에 도달하면
+    그 뒤의 결과는 모두 이전 실행에서 이미 수집한 포스트다.
+    """
+
+    def __init__(self, path: str = 'data/watermarks.json'):
+        """
+        Args:
+            path: 워터마크 JSON 파일 경로
+        """
+        self.path = path
+        self.watermarks: Dict[str, Dict] = {}
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.watermarks = json.load(f)
+
+    def get(self, keyword: str) -> Optional[Dict]:
+        """
+        키워드의 워터마크 조회
+
+        Returns:
+            {'post_date': 'YYYY-MM-DD', 'post_urls': [...], 'updated_at': ...} 또는 None
+        """
+        return self.watermarks.get(keyword)
+
+    def update(self, keyword: str, posts: List[Dict]):
+        """
+        이번 실행에서 수집한 포스트로 워터마크 갱신
+
+        Args:
+            keyword: 검색 키워드
+            posts: 해당 키워드로 새로 수집한 포스트 리스트 (post_date, post_url 포함)
+        """
+        dated = [p for p in posts if p.get('post_date') and p.get('post_url')]
+        if not dated:
+            return
+
+        latest_date = max(p['post_date'] for p in dated)
+        latest_urls = {p['post_url'] for p in dated if p['post_date'] == latest_date}
+
+        # 같은 날짜면 이전 실행에서 본 URL도 유지
+        current = self.watermarks.get(keyword)
+        if current:
+            if current['post_date'] > latest_date:
+                return
+            if current['post_date'] == latest_date:
+                latest_urls.update(current['post_urls'])
+
+        self.watermarks[keyword] = {
+            'post_date': latest_date,
+            'post_urls': sorted(latest_urls),
+            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+    def save(self):
+        """워터마크 파일 저장"""
+        save_json(self.path, self.watermarks)
+
+
+class LatestPostTracker:
+    """키워드별로 지금까지 본 가장 최근 post_date와 그 날짜의 post_url만 기록
+
+    수집한 포스트를 모두 들고 있지 않고, 포스트가 지나갈 때마다 갱신해
+    WatermarkStore.update에 넘길 포스트만 남긴다.
+    """
+
+    def __init__(self):
+        self.latest: Dict[str, Tuple[str, Set[str]]] = {}
+
+    def add(self, post: Dict):
+        """
+        수집한 포스트 하나 반영
+
+        Args:
+            post: keyword, post_date, post_url을 가진 포스트
+        """
+        keyword, post_date, post_url = post.get('keyword'), post.get('post_date'), post.get('post_url')
+        if not (keyword and post_date and post_url):
+            return
+
+        current = self.latest.get(keyword)
+        if current is None or post_date > current[0]:
+            self.latest[keyword] = (post_date, {post_url})
+        elif post_date == current[0]:
+            current[1].add(post_url)
+
+    def posts(self, keyword: str) -> List[Dict]:
+        """
+        키워드의 가장 최근 포스트 (WatermarkStore.update 입력 형식)
+
+        Returns:
+            [{'post_date': ..., 'post_url': ...}, ...] (본 포스트가 없으면 빈 리스트)
+        """
+        if keyword not in self.latest:
+            return []
+        post_date, post_urls = self.latest[keyword]
+        return [{'post_date': post_date, 'post_url': url} for url in sorted(post_urls)]